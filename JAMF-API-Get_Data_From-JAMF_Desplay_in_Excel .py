@@ -24,6 +24,8 @@
 #	Version 10.0 - Adding last checkin and site info to computer info.
 #	Version 10.1 - Bug fixes and code cleanup. Now works with jamf cloud 
 # 				   version 11.10.2-t1729874551.
+#	Version 11.0 - Replaced the thread pools in each section with one shared asyncio
+#				   fetch engine so the whole report has one limit on requests in flight.
 #
 #
 #	This script take User Input and will call the JAMF API and get all Information 
@@ -227,6 +229,28 @@
 #
 #
 ##################################################
+#	Computer Scope lookup
+##################################################
+#	Provides the following:
+#	
+#	Policy, Configuration Profile, Nothing Scoped
+#	or Unresolved with no computer
+#	
+#	Computer ID
+#
+#	Computer Name
+#
+#	Policy or Profile ID and Name that applies
+#	to the computer
+#
+#	Scoped By, All Computers, the Computer or
+#	the Computer Group that scoped it
+#
+#	Unresolved Scope, buildings, departments,
+#	limitations or exclusions to check by hand
+#
+#
+##################################################
 #	Additional Info
 ##################################################
 #
@@ -248,7 +272,67 @@
 #	It wall also look up all JIM servers and let you choose the one you want to use.
 #
 #	The script uses the new bearer token auth for the API calls and then
-#	invalidates it when script is complete.
+#	invalidates it when script is complete. The token is renewed in the background
+#	5 minutes before it expires so long reports do not need to keep calling keep-alive.
+#
+#	All API lookups go through one asyncio fetch engine using httpx. The max number
+#	of requests in flight can be changed with the JAMF_MAX_CONCURRENT_REQUESTS
+#	environment variable (default 100). Connections are kept alive and reused, the
+#	pool size per host can be changed with JAMF_CONNECTION_POOL_SIZE (defaults to the
+#	max requests in flight).
+#
+#	The number of requests in flight is adjusted while the report runs. It goes up
+#	while the server keeps answering fast and is cut in half for everyone as soon as
+#	the server answers with 429 / 503 or sends Retry-After.
+#
+#	Failed GET requests are retried up to 3 times with a random wait, from a retry
+#	budget for the whole run (JAMF_RETRY_BUDGET_RATIO, default 0.1 of all requests).
+#	If one API route keeps failing it is skipped for 30 seconds instead of slowing
+#	down the rest of the report. A summary of retries is printed at the end.
+#
+#	If msgspec is installed (pip3 install msgspec) computer, group, policy, profile,
+#	package and script records are decoded with only the fields the report uses,
+#	which is a lot faster on big instances. orjson is used next if found, then json.
+#
+#	Responses are requested gzip compressed (or brotli if the brotli Library is found)
+#	and the bytes used by each API route are printed at the end.
+#
+#	Set JAMF_HTTP2=1 to use HTTP/2 (needs the h2 Library), requests then share a few
+#	connections. Set JAMF_TRANSPORT_BENCHMARK=1 to only time fetching up to
+#	JAMF_BENCHMARK_RECORDS policy records with requests / urllib3, HTTP/1.1 and HTTP/2,
+#	taking turns over JAMF_BENCHMARK_ROUNDS rounds (default 3) after a warm-up request.
+#
+#	Set JAMF_CACHE=1 to keep API responses in a local SQLite file (JAMF_CACHE_PATH,
+#	default ~/.jamf_report_cache.sqlite) so reports run back to back reuse them. Each
+#	kind of record has its own time to live and the file is kept under JAMF_CACHE_MAX_MB.
+#	When a cached response has expired and Jamf sent an ETag or Last-Modified for it,
+#	the script asks Jamf if it changed and only downloads it again if it did.
+#	Cached responses are kept per Jamf URL and API username.
+#
+#	Set JAMF_INCREMENTAL=1 so the Computers section only fetches computers whose
+#	inventory report date changed since the last run, the rest come from the snapshot
+#	store. Last check in for unchanged computers is the one from their last inventory
+#	report.
+#
+#	Set JAMF_SNAPSHOTS=1 to keep the raw records of each run in JAMF_SNAPSHOT_DIR
+#	(default your home folder) for JAMF_SNAPSHOT_DAYS (default 90) days. A record that
+#	did not change is only stored once, so daily runs take little space.
+#
+#	Policies, profiles, groups, packages and scripts are fetched once per run and
+#	shared by every sheet that uses them.
+#
+#	LDAP verification looks up each local account name once per run, at the same
+#	time for each batch of computers, and remembers names LDAP does not know.
+#
+#	Set JAMF_RECORD=path to save every API response of a run in one SQLite file,
+#	then JAMF_REPLAY=path to make the report again from that file with no network
+#	and no login. Useful to try report options or rebuild an old report quickly.
+#	JAMF_INCREMENTAL is ignored while recording, every computer record is fetched.
+#
+#	The Computer Scope sheet works out which enabled policies and profiles apply to
+#	each computer from their scope and the computer group members, with no requests
+#	per computer. Buildings, departments and limitations are not checked, each policy
+#	or profile that uses them gets an Unresolved row to check by hand.
 #
 #
 ##########################################################################################
@@ -338,8 +422,50 @@ except ImportError:
 	time.sleep(3)
 	import xmltodict
 
-	
-# New MultiThread libraries
+
+#For asyncio HTTP requests with httpx Library
+try:
+	import httpx
+except ImportError:
+	os.system('pip3 install httpx')
+	time.sleep(3)
+	import httpx
+
+
+#For fast JSON decoding with msgspec or orjson Library. These are optional,
+#the json Library is used if they are not found.
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+#For brotli compressed responses with the brotli Library. This is optional, gzip is
+#used if it is not found.
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+
+#For HTTP/2 with the h2 Library. This is optional and only needed with JAMF_HTTP2=1
+try:
+	import h2
+except ImportError:
+	h2 = None
+
+
+# Async Fetch Engine libraries
+import asyncio, json, random, threading, sqlite3, zlib, hashlib
+from typing import TypedDict
+from collections import deque, Counter
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import pandas.io.formats.excel
@@ -354,6 +480,7 @@ dataToCsvPolicy = []
 dataToCsvConfigurationProfile = []
 dataToCsvPackageToPolicy = []
 dataToCsvScriptToPolicy = []
+dataToCsvComputerScope = []
 JIMServerList = []
 
 
@@ -403,6 +530,19 @@ headers = {
 
 DEFAULT_TIMEOUT = 15 # seconds
 
+
+# Max number of API requests in flight at one time across every section of the report.
+# Can be changed with the JAMF_MAX_CONCURRENT_REQUESTS environment variable.
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('JAMF_MAX_CONCURRENT_REQUESTS', '100'))
+
+
+# Keep-alive connections kept open per host. Sized to the concurrency so every request
+# in flight can reuse a connection instead of doing a new TCP + TLS handshake.
+# Can be changed with the JAMF_CONNECTION_POOL_SIZE environment variable.
+CONNECTION_POOL_SIZE = int(os.environ.get('JAMF_CONNECTION_POOL_SIZE', MAX_CONCURRENT_REQUESTS))
+KEEPALIVE_EXPIRY = 30 # seconds
+
+
 class TimeoutHTTPAdapter(HTTPAdapter):
 	def __init__(self, *args, **kwargs):
 		self.timeout = DEFAULT_TIMEOUT
@@ -418,15 +558,16 @@ class TimeoutHTTPAdapter(HTTPAdapter):
 		return super().send(request, **kwargs)
 	
 	
-# Retry for requests
+# Retry for requests, only idempotent methods are sent again so auth POSTs are never repeated
 retry_strategy = Retry(
-	total=25,
+	total=3,
 	backoff_factor=1,
-	status_forcelist=[204, 413, 429, 500, 502, 503, 504],
-	allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST", "HTTP"]
+	status_forcelist=[429, 500, 502, 503, 504],
+	allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"],
+	respect_retry_after_header=True
 )
 
-adapter = TimeoutHTTPAdapter(max_retries=retry_strategy)
+adapter = TimeoutHTTPAdapter(max_retries=retry_strategy, pool_maxsize=CONNECTION_POOL_SIZE)
 
 http = requests.Session()
 http.mount("https://", adapter)
@@ -434,3888 +575,4471 @@ http.mount("http://", adapter)
 
 
 ##########################################################################################
-# Functions
+# Async Fetch Engine
 ##########################################################################################
-#Check for Yes or no answer from input
-def getYesOrNoInput(prompt):
-	while True:
-		try:
-			value = input(prompt)
-		except ValueError:
-			print("\nSorry, I didn't understand that.")
-			continue
-		
-		if value.lower() != 'yes' and value.lower() != 'no':
-			print("\nSorry, your response must be yes or no only.")
-			continue
-		else:
-			break
-	return value
+# Use HTTP/2 for the fetch engine, many requests share a few connections instead of one
+# connection per request in flight. Turn on with the JAMF_HTTP2=1 environment variable.
+HTTP2_ENABLED = os.environ.get('JAMF_HTTP2', '0') == '1'
 
+if HTTP2_ENABLED and h2 is None:
+	print("HTTP/2 needs the h2 Library (pip3 install h2), using HTTP/1.1")
+	HTTP2_ENABLED = False
 
-#Merge Dictionaries
-def MergeComputersInfo(dict1, dict2, dict3, dict4, dict5, dict6):
-	result = dict1 | dict2 | dict3 | dict4 | dict5 | dict6
-	return result
 
+# Run the transport benchmark instead of the report with JAMF_TRANSPORT_BENCHMARK=1
+TRANSPORT_BENCHMARK = os.environ.get('JAMF_TRANSPORT_BENCHMARK', '0') == '1'
+BENCHMARK_RECORDS = int(os.environ.get('JAMF_BENCHMARK_RECORDS', '500'))
+BENCHMARK_ROUNDS = max(1, int(os.environ.get('JAMF_BENCHMARK_ROUNDS', '3')))
 
-def MergePolicyInfo(dict1, dict2, dict3, dict4, dict5, dict6):
-	result = dict1 | dict2 | dict3 | dict4 | dict5 | dict6
-	return result
 
+# Local response cache so report runs close together do not fetch everything again.
+# Turn on with JAMF_CACHE=1, the file can be changed with JAMF_CACHE_PATH and the max
+# size with JAMF_CACHE_MAX_MB.
+CACHE_ENABLED = os.environ.get('JAMF_CACHE', '0') == '1'
+CACHE_PATH = os.environ.get('JAMF_CACHE_PATH', os.path.join(os.path.expanduser('~'), '.jamf_report_cache.sqlite'))
+CACHE_MAX_BYTES = int(os.environ.get('JAMF_CACHE_MAX_MB', '200')) * 1024 * 1024
 
-def MergeConfigProfileInfo(dict1, dict2, dict3):
-	result = dict1 | dict2 | dict3
-	return result
+# New responses are written to the file every CACHE_COMMIT_EVERY changes or
+# CACHE_COMMIT_SECONDS, so a run that stops early still leaves what it fetched for the next one
+CACHE_COMMIT_EVERY = 100
+CACHE_COMMIT_SECONDS = 5
 
+# How long a cached response can be used, in seconds, by API path. First match wins.
+CACHE_TTLS = [
+	('/JSSResource/computers', 15 * 60),
+	('/JSSResource/computergroups', 15 * 60),
+	('/JSSResource/policies', 60 * 60),
+	('/JSSResource/osxconfigurationprofiles', 60 * 60),
+	('/JSSResource/packages', 24 * 60 * 60),
+	('/JSSResource/scripts', 24 * 60 * 60),
+	('/JSSResource/ldapservers', 60 * 60),
+	('/api/v1/packages', 24 * 60 * 60)
+]
+CACHE_DEFAULT_TTL = 10 * 60
 
-#Check User Input for URL, Username, and Password
-def JAMFInfoCheck(url, username, password):
-	try:
-		response = http.post(url, headers=headers, auth = HTTPBasicAuth(username, password))
-		if response.status_code == 200:
-			return print(f"\nUser Input is OK, we can connect to JAMF API, Moving on.\n\n")
-		else:
-			raise SystemExit(f"\nUser Input is NOT OK, we cannot connect to JAMF API and now will EXIT! status_code: {response.status_code}\n\n")
-			
-	#Exception
-	except requests.exceptions.RequestException as e:
-		# print URL with Erors
-		raise SystemExit(f"\nUser Input is NOT OK, we cannot connect to JAMF API and now will EXIT! \n\nErr: {e}")
+# Expired responses with an ETag or Last-Modified are kept this long so they can be
+# checked with the server instead of downloaded again
+CACHE_REVALIDATE_MAX_AGE = 7 * 24 * 60 * 60
 
 
-# let user choose Options from list
-def let_user_pick(label, options):
-	print(label+"\n")
-	
-	for index, element in enumerate(options):
-		print("{}) {}".format(index + 1, element))
-		
-	while True:
-		try:
-			i = input("\nEnter number: ")
-			
-			try:
-				if 0 < int(i) <= len(options):
-					return int(i) - 1
-					break
-			
-				else:
-					print("\nI didn't get a number in the list. Please try again with a number in the list.")
-					continue
-			
-			except ValueError:
-				print ("\nYou fail at typing numbers. Please try again with a NUMBER in the list")
-				continue
-			
-			return None
-		
-		except:
-			print ("\nOops, Something went wrong.")
-			
-		return None
-	
-	return None
-	
-# Check Input for Number only
-def checkInputForNumber(label):
-	
-	while True:
-		num = input(label+" ")
-		try:
-			val = int(num)
-			
-			print("\nSetting Smart Group ID to: "+num)
-			smartGroupID = num
-			break;
-		
-		except ValueError:
-			
-			try:
-				float(num)
-				print("Input is an float number.")
-				print("Input number is: ", val)
-				break;
-			
-			except ValueError:
-				print("\nThis is not a number. Please enter a valid number\n")
-	
-	return num
+# Save every API response of a run in one SQLite file with JAMF_RECORD=path, then
+# make the report again from that file with JAMF_REPLAY=path. Replay needs no network or
+# login and uses the JAMF URL the file was recorded from.
+RECORD_PATH = os.environ.get('JAMF_RECORD', '')
+REPLAY_PATH = os.environ.get('JAMF_REPLAY', '')
+ARCHIVE_COMMIT_EVERY = 200 # responses written to the file between commits
 
+if RECORD_PATH and REPLAY_PATH:
+	print("JAMF_RECORD and JAMF_REPLAY are both set, replaying and not recording")
+	RECORD_PATH = ''
 
-def checkFilePath(prompt):
-	while True:
-		try:
-			value = input(prompt)
-		except ValueError:
-			print("\nSorry, I didn't understand that.")
-			continue
-		
-		pathExist = os.path.exists(value)
-		
-		if pathExist != True :
-			print("\nFile does not Path Exists.")
-			continue
-		else:
-			break
-	return value  
 
+# Only fetch computer records that changed since the last run, using the report date from
+# /JSSResource/computers/subset/basic. Turn on with JAMF_INCREMENTAL=1, the last run comes
+# from the snapshot store.
+INCREMENTAL_COMPUTERS = os.environ.get('JAMF_INCREMENTAL', '0') == '1'
 
-def checkFileName(prompt):
-	while True:
-		try:
-			value = input(prompt)
-		except ValueError:
-			print("\nSorry, I didn't understand that.")
-			continue
-		
-		if not value.endswith('.xlsx'):
-			print("\nFilename has the wrong extension for Excel.")
-			continue
-		else:
-			break
-	return value   
+# Keep the raw records of every run with JAMF_SNAPSHOTS=1 (always on for JAMF_INCREMENTAL),
+# in JAMF_SNAPSHOT_DIR (default your home folder) for JAMF_SNAPSHOT_DAYS days.
+SNAPSHOTS_ENABLED = os.environ.get('JAMF_SNAPSHOTS', '0') == '1' or INCREMENTAL_COMPUTERS
+SNAPSHOT_DIR = os.environ.get('JAMF_SNAPSHOT_DIR', os.path.expanduser('~'))
+SNAPSHOT_PATH = os.path.join(SNAPSHOT_DIR, '.jamf_report_snapshots.sqlite')
+SNAPSHOT_KEEP_DAYS = int(os.environ.get('JAMF_SNAPSHOT_DAYS', '90'))
 
+# A replay is not a new run, nothing is compared with or saved to the snapshots
+if REPLAY_PATH:
+	INCREMENTAL_COMPUTERS = False
+	SNAPSHOTS_ENABLED = False
 
-def confirmExcelFileName(prompt):
-	while True:
-		try:
-			value = input(prompt)
-		except ValueError:
-			print("\nSorry, I didn't understand that.")
-			continue
-		
-		if value.lower() != 'yes' and value.lower() != 'no':
-			print("\nSorry, your response must be yes or no only.")
-			continue
-		elif value.lower() == 'no' :
-			raise SystemExit(f"\nUser DID NOT confirm the Excel File Name and now will EXIT!")
-			
-		elif value.lower() == 'yes':
-			break
-	return value
+# A recording has to hold every computer record for the replay, so all of them are fetched.
+# The run is still saved to the snapshots for the next incremental run.
+if RECORD_PATH and INCREMENTAL_COMPUTERS:
+	print("JAMF_RECORD is set, fetching every computer and not only the changed ones")
+	INCREMENTAL_COMPUTERS = False
 
 
-def checkIfPackageIsUsedInPolicy(data, key, value):
-	for i in range(len(data)):
-		try:
-			if(data[i][key]==value): return True
-		except:
-			pass
-	return False
+# Make a folder for the cache or snapshot file if it is not there yet, and stop before
+# any prompt if it can not be written to
+def checkStoreFolder(folder, variableName):
+	try:
+		os.makedirs(folder, exist_ok=True)
 
+	except OSError as err:
+		raise SystemExit(f"\n{variableName} folder {folder} could not be created and now will EXIT! \n\nErr: {err}\n")
 
-def checkIfScriptIsUsedInPolicy(data, key, value):
-	for i in range(len(data)):
-		try:
-			if(data[i][key]==value): return True
-		except:
-			pass
-	return False
+	if not os.access(folder, os.W_OK):
+		raise SystemExit(f"\n{variableName} folder {folder} can not be written to and now will EXIT!\n")
 
 
-##########################################################################################
-# Get User Input
-##########################################################################################
-#Get User input if needed or use command line arguments
+if CACHE_ENABLED and not REPLAY_PATH:
+	checkStoreFolder(os.path.dirname(os.path.abspath(CACHE_PATH)), 'JAMF_CACHE_PATH')
 
-print("******************** JAMF API Credentials ********************\n")
+if SNAPSHOTS_ENABLED:
+	checkStoreFolder(SNAPSHOT_DIR, 'JAMF_SNAPSHOT_DIR')
 
-if APILoginURL == "" :
-	
-	get_JAMF_URL = input("Enter your JAMF Instance URL (https://yourjamf.jamfcloud.com): ")
-	
-else:
-	
-	print("JAMF URL supplied in command line arguments.")
-	get_JAMF_URL = sys.argv[1]
 
-	
-if APIUsername == "" :
-	
-	get_JAMF_API_Username = input("Enter your JAMF Instance API Username: ")
-	
-else:
-	
-	print("JAMF API Username supplied in command line arguments.")
-	get_JAMF_API_Username = sys.argv[2]
+# Ask the server to compress responses, computer records and profile payloads get a lot smaller
+ACCEPT_ENCODING = 'gzip, br' if brotli is not None else 'gzip'
 
 
-if APIPassword == "" :
-	
-	get_JAMF_API_Password = getpass.getpass("Enter your JAMF Instance API Password: ")
-	
-else:
-	
-	print("JAMF API Username supplied in command line arguments.")
-	get_JAMF_API_Password = sys.argv[3]
+# Retry for GET requests sent by the engine
+ENGINE_MAX_RETRIES = 3
+ENGINE_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+ENGINE_RETRY_BASE_DELAY = 1 # seconds
+ENGINE_RETRY_MAX_DELAY = 30 # seconds
 
 
+# Retry budget for the whole run. Retries are allowed while the number spent is under
+# RETRY_BUDGET_MIN plus RETRY_BUDGET_RATIO of all requests sent, so an outage cannot
+# turn every request into 4 requests.
+RETRY_BUDGET_MIN = 20
+RETRY_BUDGET_RATIO = float(os.environ.get('JAMF_RETRY_BUDGET_RATIO', '0.1'))
 
-#Check User Input for URL, Username, and Password
-#print (get_JAMF_URL+get_JAMF_URL_User_Test)
-#print(get_JAMF_API_Username)
-#print(get_JAMF_API_Password)
 
-JAMFInfoCheck((get_JAMF_URL+get_JAMF_URL_User_Test), get_JAMF_API_Username, get_JAMF_API_Password)
+# Circuit breaker per API route. After CIRCUIT_FAILURE_THRESHOLD failures in a row
+# (5xx, timeouts, connection errors) the route fails fast for CIRCUIT_OPEN_SECONDS,
+# then one request is let through to test it again.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_OPEN_SECONDS = 30
 
 
-##########################################################################################
-# JAMF API Variables
-##########################################################################################
-JAMF_url = get_JAMF_URL
-username = get_JAMF_API_Username
-password = get_JAMF_API_Password
+# Error returned for requests that were not sent because the route circuit is open
+class CircuitOpenError(Exception):
+	pass
 
 
-# Get Bearer token from JAMF API since we confirmed the Username and Password
-btURL = JAMF_url + "/api/v1/auth/token"
-token = http.post(btURL, headers=headers, auth = HTTPBasicAuth(username, password))
-bearer = token.json()['token']
+# Byte count as text for the run summary
+def formatBytes(numBytes):
+	for unit in ['B', 'KB', 'MB']:
+		if numBytes < 1024:
+			return f"{numBytes:.1f} {unit}" if unit != 'B' else f"{numBytes} {unit}"
+		numBytes /= 1024
 
+	return f"{numBytes:.1f} GB"
 
-# requests headers with token auth
-btHeaders = {
-	'Accept': 'application/json',
-	'Authorization': 'Bearer '+bearer
-}
 
+# Route name for a URL with the record IDs and names taken out
+# For Example : /JSSResource/policies/id/12 > GET /JSSResource/policies/id/{id}
+def getRoute(method, url):
+	path = urlsplit(url).path
+	path = re.sub(r'/(id|name|serialnumber|udid)/[^/]+', r'/\1/{id}', path)
+	path = re.sub(r'/\d+(?=/|$)', '/{id}', path)
+	return method + ' ' + path
 
-##########################################################################################
-# Get Report Config Input
-##########################################################################################
-# Get Main Groups Section.
-print("\n******************** JAMF API Excel File Info ********************\n")
-get_JAMF_Default_Path_Name = getYesOrNoInput("Do you want to use the Default filename and path for the Report (/Users/Shared/JAMF_Excel_Report_xx_xx_xxxx-xx:xx:xx.xlsx) ? (yes or no): ")
 
-if get_JAMF_Default_Path_Name == 'yes':
-	# Get Time
-	getFileNameTime = datetime.datetime.now()
-	fileNameTimeString = (getFileNameTime.strftime("%a_%b-%d-%Y_%H-%M-%S"))
-	
-	#Set filename with time and date
-	get_JAMF_FilePath_Info = '/Users/Shared/'
-	get_JAMF_FileName_Info = 'JAMF_Excel_Report_' + str(fileNameTimeString) + '.xlsx'
-	
-elif get_JAMF_Default_Path_Name == 'no':
-	
-	get_JAMF_Default_FilePath = getYesOrNoInput("Do you want to use the Default file path for the Report (/Users/Shared/) ? (yes or no): ")
-	
-	if get_JAMF_Default_FilePath == 'yes':
-		get_JAMF_FilePath_Info = '/Users/Shared/'
-		get_JAMF_FileName_Info = checkFileName("Please enter the name you want to save the excel file as. (ex. \"myExcelFile.xlsx\") : ")
-		
-	elif get_JAMF_Default_FilePath == 'no':
-		get_JAMF_FilePath_Info = checkFilePath("Please enter the full path where you want to save the file (ex. \"/Users/Shared/\") : ")
-		get_JAMF_FileName_Info = checkFileName("Please enter the name you want to save the excel file as. (ex. \"myExcelFile.xlsx\") : ")
+# Tracks retries spent for the run and the circuit state for each route
+class RetryPolicy:
+	def __init__(self):
+		self.retriesSpent = 0
+		self.retriesDenied = 0
+		self.retriesByRoute = Counter()
 
+		self.routeFailures = Counter()
+		self.openUntil = {}
+		self.probing = set()
+		self.circuitsOpened = 0
+		self.fastFailures = 0
 
-getDesplayExcelReportFile = get_JAMF_FilePath_Info+get_JAMF_FileName_Info
+	# Full jitter, a random wait between 0 and the exponential backoff
+	def getDelay(self, attempt):
+		return random.uniform(0, min(ENGINE_RETRY_MAX_DELAY, ENGINE_RETRY_BASE_DELAY * 2 ** attempt))
 
-desplayExcelReportFile = f"{getDesplayExcelReportFile}"
+	def canRetry(self, route, requestsSent):
+		if self.retriesSpent >= RETRY_BUDGET_MIN + RETRY_BUDGET_RATIO * requestsSent:
+			self.retriesDenied += 1
+			return False
 
-confirmExcelReportFile = confirmExcelFileName("Please confirm that the filename, " + desplayExcelReportFile + " is correct. (yes or no)")
+		self.retriesSpent += 1
+		self.retriesByRoute[route] += 1
+		return True
 
-if confirmExcelReportFile == 'yes':
-	excelReportFile = desplayExcelReportFile
-	print("\nSetting filename for JAMF Report to: "+excelReportFile+"\n")
+	# Returns False if the request should fail fast
+	def allowRequest(self, route, now):
+		openUntil = self.openUntil.get(route)
 
+		if openUntil is None:
+			return True
 
-# Get Main Groups Section.
-print("\n\n******************** JAMF API Report Included Excel Sheets ********************\n")
-get_JAMF_Computers_Info = getYesOrNoInput("Do you want to include JAMF Computer Info Section in Report? (yes or no): ")
-get_JAMF_Policy_Info = getYesOrNoInput("Do you want to include JAMF Policy Info Section in Report? (yes or no): ")
-get_JAMF_Configuration_Profile_Info = getYesOrNoInput("Do you want to include JAMF Configuration Profile Info Section in Report? (yes or no): ")
-get_JAMF_Package_To_Policy_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy Info Section in Report? (yes or no): ")
-get_JAMF_Script_To_Policy_Info = getYesOrNoInput("Do you want to include JAMF Script To Policy Info Section in Report? (yes or no): ")
+		# Half open, let one request through to test the route
+		if now >= openUntil and route not in self.probing:
+			self.probing.add(route)
+			return True
 
+		self.fastFailures += 1
+		return False
 
-##########################################################################################
-# Core Script
-##########################################################################################
-##################################################
-# Get Jamf Computer Info
-##################################################
-print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+	# Probe finished without a success or failure, the route stays half open
+	def releaseProbe(self, route):
+		self.probing.discard(route)
 
-if get_JAMF_Computers_Info == ("yes"):
-	
-	#Get Computer Info
-	print("\nIncluding JAMF Computer Info.\n\n")
-	includeComputerInfo = "yes"
-	
-	
-	#Get Smart Group ID if needed
-	print("\n******************** JAMF API Computer Info Results Filter Section. ********************\n")
-	print("\n\nPlease choose how you would like the results returned in your report. It is recommended to use a smart group id or computer id for this report for quickest results.\n")
-	print("\nPlease Note if you choose all computers the report may take some time to complete depending on the number of computers in your JAMF system.")
-	
-	# Set options for results filter for this section and question
-	myResultsFilterLabel = "Your results filter choices are:"
-	mymyResultsFilterOptions = ["Filter results for 1 Computer ID", "Filter results By Smart Group ID", "No Filter, Return All Computers"]
-	
-	# Get choice from user
-	get_JAMF_Computers_Info_Results_Filter = let_user_pick(myResultsFilterLabel, mymyResultsFilterOptions)
-	
-	get_JAMF_Computers_Info_Results_Filter_Choice = (mymyResultsFilterOptions[get_JAMF_Computers_Info_Results_Filter])
-	
-	#Return choice and set filter
-	if get_JAMF_Computers_Info_Results_Filter_Choice == 'Filter results for 1 Computer ID':
-		
-		print("\nUsing JAMF Computer ID to filter the Computer Report for 1 Computer Record.\n\n")
-		computerIDLabel = "Enter your JAMF Computer ID Number: "
-		get_JAMF_Computer_ID = checkInputForNumber(computerIDLabel)
-		print("\n")
-		JAMF_Computer_ID = get_JAMF_Computer_ID
-		usingFilter = "computerFilter"
-		
-		
-	elif get_JAMF_Computers_Info_Results_Filter_Choice == 'Filter results By Smart Group ID':
-		
-		print("\nUsing JAMF Smart Group to filter the Computer Report for 1 Computer Smart Group.\n\n")
-		smartGroupIDLabel = "Enter your JAMF SmartGroup ID Number: "
-		get_JAMF_SmartGroup_ID = checkInputForNumber(smartGroupIDLabel)
-		print("\n")
-		JAMF_SmartGroup_ID = get_JAMF_SmartGroup_ID
-		usingFilter = "smartGroupFilter"
-		
-		
-	elif get_JAMF_Computers_Info_Results_Filter_Choice == 'No Filter, Return All Computers':
-		
-		print("\nNot using JAMF Results Filter for the Computer Report.\n\n")
-		usingFilter = "noFilter"
-	
-	
-	#Get hardware Elements
-	print("\n******************** JAMF API Computer Info Hardware Section. ********************\n")
-	get_JAMF_Computers_Info_Hardware = getYesOrNoInput("Do you want to include JAMF Computer Hardware Info in Report? (yes or no): ")
-	if get_JAMF_Computers_Info_Hardware == ("yes"):
-		
-		print("\nIncluding Computer Hardware Data.\n\n")		
-		includeHardwareInfo = "yes"
-		
-	elif get_JAMF_Computers_Info_Hardware == ("no"):
-		
-		print("\nNot Including Computer Hardware Data.\n\n")		
-		includeHardwareInfo = "no"
-		
-		
-	#Get FileVault2 Users
-	print("\n******************** JAMF API Computer Info FileVault2 Section. ********************\n")
-	get_JAMF_Computers_Info_FileVault2_Users = getYesOrNoInput("Do you want to include JAMF Computer Hardware FileVault Users Info in Report? (yes or no): ")
-	if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
-		
-		print("\nIncluding FileVault2 Info Data.\n\n")		
-		includeFileVault2Info = "yes"
-		
-	elif get_JAMF_Computers_Info_FileVault2_Users == ("no"):
-		
-		print("\nNot including FileVault2 Info Data.\n\n")
-		includeFileVault2Info = "no"
+	def recordSuccess(self, route):
+		self.routeFailures[route] = 0
+		self.openUntil.pop(route, None)
+		self.probing.discard(route)
 
-	
-	#Get Local Users Accounts
-	print("\n******************** JAMF API Computer Info Local Account Section. ********************\n")
-	get_JAMF_Computers_Info_Local_Account = getYesOrNoInput("Do you want to include JAMF Computer Hardware Local Account Info in Report? (yes or no): ")
-	if get_JAMF_Computers_Info_Local_Account == ("yes"):
-		
-		print("\nIncluding Local Account Info Data.\n\n")
-		includeLocalAccountInfo = "yes"
-		
-		print("\n******************** JAMF API Computer Info Local Account LDAP Section. ********************\n")
-		get_JAMF_Computers_Info_Local_Account_LDAP = getYesOrNoInput("Do you want to include JAMF Computer Hardware Local Accounts LDAP Verification in Report? (yes or no): ")
-		
-		if get_JAMF_Computers_Info_Local_Account_LDAP == ("yes"):
-			
-			print("\nIncluding Local Account Info LDAP Verification Data.\n\n")
-			includeLocalAccountInfoLDAP = "yes"
-			
-			# Lookup JIM Server Name
-			url = JAMF_url + "/JSSResource/ldapservers"
-			
-			try:
-				response = http.get(url, headers=btHeaders)
-			
-				response.raise_for_status()
+	def recordFailure(self, route, now):
+		self.routeFailures[route] += 1
 
-				resp = response.json()
-				
-			except HTTPError as http_err:
-				print(f'HTTP error occurred: {http_err}')
-			except Exception as err:
-				print(f'Other error occurred: {err}')	
-			
-			#For Testing
-			#print(resp)
-			
-			JIMServerRecords = resp['ldap_servers']
-			JIMServerRecords.sort(key=lambda item: item.get('id'), reverse=False)
-			
-			
-			for JIMServer in JIMServerRecords:
-				
-				JIMServerRecordsName = JIMServer['name']
-				JIMServerList.append(JIMServerRecordsName)
-				
-			JIMServerlabel = "Please choose the JIM Server you would like to use:"
-			
-			JimServerChoice = let_user_pick(JIMServerlabel, JIMServerList)
-			
-			JIMServerNameForURL = (JIMServerList[JimServerChoice])
-			
-			JIMServerLDAPLookupURL = "/JSSResource/ldapservers/name/" + JIMServerNameForURL
-			
-			
-		elif get_JAMF_Computers_Info_Local_Account_LDAP == ("no"):
-			
-			print("\nIncluding Local Account Info LDAP Verification Data.\n\n")
-			includeLocalAccountInfoLDAP = "no"
-			
-		
-	elif get_JAMF_Computers_Info_Local_Account == ("no"):
-		
-		print("\nNot including Local Account Info Data.\n\n")
-		includeLocalAccountInfo = "no"
+		if route in self.probing or self.routeFailures[route] >= CIRCUIT_FAILURE_THRESHOLD:
+			if route not in self.openUntil or route in self.probing:
+				self.circuitsOpened += 1
+				print(f'API route {route} is failing, skipping it for {CIRCUIT_OPEN_SECONDS} seconds')
 
-	
-	#Get Group Membership
-	print("\n******************** JAMF API Computer Info Computer Group Membership Section. ********************\n")
-	get_JAMF_Computers_Info_Computer_Group_Membership = getYesOrNoInput("Do you want to include JAMF Computer Hardware Computer Group Membership Info in Report? (yes or no): ")
-	if get_JAMF_Computers_Info_Computer_Group_Membership == ("yes"):
-		
-		print("\nIncluding Computer Group Membership Info Data.\n\n")		
-		includeComputerGroupMembershipInfo = "yes"
-		
-	elif get_JAMF_Computers_Info_Computer_Group_Membership == ("no"):
-		
-		print("\nNot including Computer Group Membership Info Data.\n\n")
-		includeComputerGroupMembershipInfo = "no"
-		
-		
-	#Get Config Profile Membership
-	print("\n******************** JAMF API Computer Info Computer Configuration Profile Membership Section. ********************\n")
-	get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = getYesOrNoInput("Do you want to include JAMF Computer Hardware Configuration Profile Membership Info in Report? (yes or no): ")
-	if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == ("yes"):
-		
-		print("\nIncluding Computer Configuration Profile Membership Info Data.\n\n")		
-		includeComputerConfigurationProfileMembershipInfo = "yes"
-		
-	elif get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == ("no"):
-		
-		print("\nNot including Computer Group Membership Info Data.\n\n")
-		includeComputerConfigurationProfileMembershipInfo = "no"
+			self.openUntil[route] = now + CIRCUIT_OPEN_SECONDS
+			self.probing.discard(route)
 
+	def printStats(self, requestsSent):
+		print(f"API Retries: {self.retriesSpent} retries spent of a {int(RETRY_BUDGET_MIN + RETRY_BUDGET_RATIO * requestsSent)} retry budget, {self.retriesDenied} denied by the budget")
 
-elif get_JAMF_Computers_Info == ("no"):
-	
-	includeComputerInfo = "no"
-	usingFilter = "noFilter"
-	includeHardwareInfo = "no"
-	includeFileVault2Info = "no"
-	includeLocalAccountInfo = "no"
-	includeComputerGroupMembershipInfo = "no"
-	includeComputerConfigurationProfileMembershipInfo = "no"
-	
+		for route, retries in self.retriesByRoute.most_common(5):
+			print(f"\t{retries} retries for {route}")
 
-##################################################
-# Get Jamf Policy Info
-##################################################
-print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+		if self.circuitsOpened:
+			print(f"API Circuit Breaker: opened {self.circuitsOpened} times, {self.fastFailures} requests failed fast")
 
-if get_JAMF_Policy_Info == ("yes"):
-	
-	#Get Policy Info
-	print("\nIncluding JAMF Policy Info.\n\n")
-	includePolicyInfo = "yes"
-	
-	
-	#Get Policy Self Service Elements
-	print("\n******************** JAMF API Policy Self Service Section. ********************\n")
-	get_JAMF_Policy_Info_SelfService = getYesOrNoInput("Do you want to include JAMF Policy Self Service Info in Report? (yes or no): ")
-	if get_JAMF_Policy_Info_SelfService == ("yes"):
-		
-		print("\nIncluding Self Service Data.\n\n")
-		
-		includeSelfServiceInfo = "yes"
-		
-	elif get_JAMF_Policy_Info_SelfService == ("no"):
-		
-		print("\nNot Including Self Service Data.\n\n")
-		
-		includeSelfServiceInfo = "no"
-		
-		
-	#Get Policy Targets
-	print("\n******************** JAMF API Policy Targets Section. ********************\n")
-	get_JAMF_Policy_Info_Targets = getYesOrNoInput("Do you want to include JAMF Policy Targets Info in Report? (yes or no): ")
-	if get_JAMF_Policy_Info_Targets == ("yes"):
-		
-		print("\nIncluding Target Data.\n\n")
-		
-		includeTargetsInfo = "yes"
-		
-	elif get_JAMF_Policy_Info_Targets == ("no"):
-		
-		print("\nNot Including Target Data.\n\n")
-		
-		includeTargetsInfo = "no"
-		
-		
-	#Get Policy Exclusions
-	print("\n******************** JAMF API Policy Exclusions Section. ********************\n")
-	get_JAMF_Policy_Info_Exclusions = getYesOrNoInput("Do you want to include JAMF Policy Exclusions Info in Report? (yes or no): ")
-	if get_JAMF_Policy_Info_Exclusions == ("yes"):
-		
-		print("\nIncluding Exclusions Data.\n\n")
-		
-		includeExclusionsInfo = "yes"
-		
-	elif get_JAMF_Policy_Info_Exclusions == ("no"):
-		
-		print("\nNot Including Exclusions Data.\n\n")
-		
-		includeExclusionsInfo = "no"
-		
-		
-	#Get Policy Package Elements
-	print("\n******************** JAMF API Policy Packages Section. ********************\n")
-	get_JAMF_Policy_Info_Packages = getYesOrNoInput("Do you want to include JAMF Policy Packages Info in Report? (yes or no): ")
-	if get_JAMF_Policy_Info_Packages == ("yes"):
-		
-		print("\nIncluding Package Data.\n\n")
-		
-		includePackagesInfo = "yes"
-		
-	elif get_JAMF_Policy_Info_Packages == ("no"):
-		
-		print("\nNot Including Package Data.\n\n")
-		
-		includePackagesInfo = "no"
-		
-		
-	#Get Policy Script Elements
-	print("\n******************** JAMF API Policy Scripts Section. ********************\n")
-	get_JAMF_Policy_Info_Scripts = getYesOrNoInput("Do you want to include JAMF Policy Scripts Info in Report? (yes or no): ")
-	if get_JAMF_Policy_Info_Scripts == ("yes"):
-		
-		print("\nIncluding Scripts Data.\n\n")
-		
-		includeScriptsInfo = "yes"
-		
-	elif get_JAMF_Policy_Info_Scripts == ("no"):
-		
-		print("\nNot Including Scripts Data.\n\n")
-		
-		includeScriptsInfo = "no"
-		
-		
-elif get_JAMF_Policy_Info == ("no"):
-	
-	includePolicyInfo = "no"
-	
 
-##################################################
-# Get Configuration Profile Info
-##################################################
-print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+# Adaptive concurrency. The engine starts at a quarter of MAX_CONCURRENT_REQUESTS and
+# raises the limit by one each round while p95 latency stays flat. When any request gets
+# a 429 / 503 or a Retry-After header the limit is cut in half and every request waits
+# out the pause together.
+ADAPTIVE_LATENCY_WINDOW = 100 # last N request latencies used for p95
+ADAPTIVE_LATENCY_TOLERANCE = 1.5 # p95 can grow this much over the best p95 and still be flat
+ADAPTIVE_DECREASE_FACTOR = 0.5
+ADAPTIVE_BACKOFF_STATUS_CODES = [429, 503]
+ADAPTIVE_DEFAULT_PAUSE = 1 # seconds to pause when the server does not send Retry-After
 
-if get_JAMF_Configuration_Profile_Info == ("yes"):
-	
-	#Get Configuration Profile Info
-	print("Including Configuration Profile Info.\n\n")
-	
-	includeConfigurationProfileInfo = "yes"
-	
-	#Get Policy Targets
-	print("\n******************** JAMF API Configuration Profile Targets Section. ********************\n")
-	get_JAMF_Configuration_Profile_Info_Targets = getYesOrNoInput("Do you want to include JAMF Configuration Profile Targets Info in Report? (yes or no): ")
-	if get_JAMF_Configuration_Profile_Info_Targets == ("yes"):
-		
-		print("\nIncluding Target Data.\n\n")
-		
-		includeConfigurationProfileTargetsInfo = "yes"
-		
-	elif get_JAMF_Configuration_Profile_Info_Targets == ("no"):
-		
-		print("\nNot Including Target Data.\n\n")
-		
-		includeConfigurationProfileTargetsInfo = "no"
-		
-		
-	#Get Policy Exclusions
-	print("\n******************** JAMF API Configuration Profile Exclusions Section. ********************\n")
-	get_JAMF_Configuration_Profile_Info_Exclusions = getYesOrNoInput("Do you want to include JAMF Configuration Profile Exclusions Info in Report? (yes or no): ")
-	if get_JAMF_Configuration_Profile_Info_Exclusions == ("yes"):
-		
-		print("\nIncluding Exclusions Data.\n\n")
-		
-		includeConfigurationProfileExclusionsInfo = "yes"
-		
-	elif get_JAMF_Configuration_Profile_Info_Exclusions == ("no"):
-		
-		print("\nNot Including Exclusions Data.\n\n")
-		
-		includeConfigurationProfileExclusionsInfo = "no"
-		
-		
-elif get_JAMF_Configuration_Profile_Info == ("no"):
-	
-	includeConfigurationProfileInfo = "no"
-	
 
-##################################################
-# Get Jamf Package To Policy Info
-##################################################
-print("\n\n******************** JAMF API Report Included Package To Policy Info ********************\n")
+# Get seconds to wait from a Retry-After header, it can be seconds or an HTTP date
+def parseRetryAfter(retryAfter):
+	if not retryAfter:
+		return None
 
-if get_JAMF_Package_To_Policy_Info == ("yes"):
-	
-	#Get Package To Policy Info
-	print("\nIncluding JAMF Regular Package Info.\n\n")
-	
-	includeRegularPackageToPolicyInfo = "yes"
-	
-	#Get Policy Exclusions
-	print("\n******************** JAMF API Package To Policy in PreStage Policy Section. ********************\n")
-	get_JAMF_Policy_in_PreStage_Policy_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy in PreStage Policy Info in Report? (yes or no): ")
-	if get_JAMF_Policy_in_PreStage_Policy_Info == ("yes"):
-		
-		print("\nIncluding PreStage Policy Info.\n\n")
-		
-		includePreStagePackageToPolicyInfo = "yes"
-		
-	elif get_JAMF_Policy_in_PreStage_Policy_Info == ("no"):
-		
-		print("\nNot Including PreStage Policy Info.\n\n")
-		
-		includePreStagePackageToPolicyInfo = "no"
-		
-		
-	print("\n******************** JAMF API Package To Policy in Patch Management Section. ********************\n")
-	get_JAMF_Policy_in_Patch_Management_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy in Patch Management Info in Report? (yes or no): ")
-	if get_JAMF_Policy_in_Patch_Management_Info == ("yes"):
-		
-		print("\nIncluding Patch Management Info.\n\n")
-		
-		includePatchManagementPackageToPolicyInfo = "yes"
-		
-	elif get_JAMF_Policy_in_Patch_Management_Info == ("no"):
-		
-		print("\nNot Including Patch Management Info.\n\n")
-		
-		includePatchManagementPackageToPolicyInfo = "no"
-		
-		
-##################################################
-# Get Jamf Script To Policy Info
-##################################################
-print("\n\n******************** JAMF API Report Included Script To Policy Info ********************\n")
+	try:
+		return max(0, float(retryAfter))
 
-if get_JAMF_Script_To_Policy_Info == ("yes"):
-	
-	#Get Script To Policy Info
-	print("\nIncluding JAMF Regular Script Info.\n\n")
-	
-	includeRegularScriptToPolicyInfo = "yes"
+	except ValueError:
+		try:
+			retryDate = parsedate_to_datetime(retryAfter)
+			return max(0, (retryDate - datetime.datetime.now(retryDate.tzinfo)).total_seconds())
 
-				
-##################################################
-# Set Variables for dict
-##################################################
-#Check Options set and desplay message to user
-if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF_Configuration_Profile_Info == 'yes' or get_JAMF_Package_To_Policy_Info == 'yes' or get_JAMF_Script_To_Policy_Info == 'yes':
-	
-	print("\n******************** Running Requested Report Now. ********************\n\n")
-	
+		except (TypeError, ValueError):
+			return None
 
-	##################################################
-	# Set Variables for Dict for Computers Info
-	##################################################
-	if usingFilter == 'computerFilter':
-		
-		dataToCVS_JAMF_Computers_Info = "{'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-	elif usingFilter == 'smartGroupFilter':
-		
-		dataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':'',\
-		\
-		'Computer SmartGroup Name':'',\
-		\
-		'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-	elif usingFilter == 'noFilter':
-		
-		dataToCVS_JAMF_Computers_Info = "{'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-	
-	dataToCVS_JAMF_Computers_Hardware_Info = "{'Computer Make':'',\
-	\
-	'Computer Model':'',\
-	\
-	'Computer Model Identifier':'',\
-	\
-	'Computer OS Name':'',\
-	\
-	'Computer OS Version':'',\
-	\
-	'Computer OS Build':''}"	
-	
-	
-	dataToCVS_JAMF_Computers_FileVault2_Info = "{'Computer FileVault2 User':''}"
-	
-	
-	dataToCVS_JAMF_Computers_Local_Account_Info = "{'Computer Local Account Name':'',\
-	\
-	'Computer Local Account Real Name':'',\
-	\
-	'Computer Local Account ID':'',\
-	\
-	'Computer Local Account is Admin ':'',\
-	\
-	'Computer Local Account in LDAP ':''}"	
 
-	
-	dataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Computer Group Membership Group ID':'',\
-	\
-	'Computer Group Membership Group Name':'',\
-	\
-	'Computer Group Membership Group Is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Computer Configuration Profile Membership ID':'',\
-	\
-	'Computer Configuration Profile Membership Name':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Policy Info
-	##################################################
-	dataToCVS_JAMF_Policy_Info = "{'Type':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':'',\
-	\
-	'Policy Category ID':'',\
-	\
-	'Policy Category Name':''}"
-	
-	
-	dataToCVS_JAMF_Policy_SelfService_Info = "{'Policy In SelfService':'',\
-	\
-	'Policy In SelfService Name':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Target_Info = "{'Policy Target All Computers':'',\
-	\
-	'Policy Target Computer ID':'',\
-	\
-	'Policy Target Computer Name':'',\
-	\
-	'Policy Target Group ID':'',\
-	\
-	'Policy Target Group Name':'',\
-	\
-	'Policy Target Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Exclusion_Info = "{'Policy Exclusion Computer ID':'',\
-	\
-	'Policy Exclusion Computer Name':'',\
-	\
-	'Policy Exclusion Group id':'',\
-	\
-	'Policy Exclusion Group Name':'',\
-	\
-	'Policy Exclusion Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Packages_Info = "{'Policy Package ID':'',\
-	\
-	'Policy Package Name':'',\
-	\
-	'Policy Package Category Name':'',\
-	\
-	'Policy Package Filename':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Scripts_Info = "{'Policy Script ID':'',\
-	\
-	'Policy Script Name':'',\
-	\
-	'Policy Script Category Name':'',\
-	\
-	'Policy Script Filename':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Configuration Profile Info
-	##################################################
-	dataToCVS_JAMF_Configuration_Profile_Info = "{'Configuration Profile ID':'',\
-	\
-	'Configuration Profile Type':'',\
-	\
-	'Configuration Profile Name':'',\
-	\
-	'Configuration Profile Category ID':'',\
-	\
-	'Configuration Profile Category Name':''}"
-	
-	
-	dataToCVS_JAMF_Configuration_Profile_Target_Info = "{'Configuration Profile Target Computer ID':'',\
-	\
-	'Configuration Profile Target Computer Name':'',\
-	\
-	'Configuration Profile Target Group ID':'',\
-	\
-	'Configuration Profile Target Group Name':'',\
-	\
-	'Configuration Profile Target Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Configuration_Profile_Exclusion_Info = "{'Configuration Profile Exclusion Computer id':'',\
-	\
-	'Configuration Profile Exclusion Computer Name':'',\
-	\
-	'Configuration Profile Exclusion Group id':'',\
-	\
-	'Configuration Profile Exclusion Group Name':'',\
-	\
-	'Configuration Profile Exclusion Group is Smart':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Packages to Policies Info
-	##################################################
-	dataToCVS_JAMF_Package_To_Regular_Policy_Info = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	
-	dataToCVS_JAMF_Package_To_PreStage_Policy_Info = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	
-	dataToCVS_JAMF_Package_Unused_Info = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Script to Policies Info
-	##################################################
-	dataToCVS_JAMF_Script_To_Regular_Policy_Info = "{'Type':'',\
-	\
-	'Script ID':'',\
-	\
-	'Script Name':'',\
-	\
-	'Script File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	dataToCVS_JAMF_Script_Unused_Info = "{'Type':'',\
-	\
-	'Script ID':'',\
-	\
-	'Script Name':'',\
-	\
-	'Script File Name':''}"	
-	
+# AIMD limiter shared by every request the engine sends.
+class AdaptiveLimiter:
+	def __init__(self, maxLimit, minLimit=1):
+		self.maxLimit = maxLimit
+		self.minLimit = minLimit
+		self.limit = max(minLimit, maxLimit // 4)
+		self.inFlight = 0
+		self.pauseUntil = 0
+		self.condition = asyncio.Condition()
 
-	##################################################
-	# Set Variables for Dict for Computers Info to empty
-	##################################################
-	if usingFilter == 'computerFilter':
-		
-		dataToCVS_JAMF_Computers_Info_Empty = "{'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-	elif usingFilter == 'smartGroupFilter':
-		
-		dataToCVS_JAMF_Computers_Info_Empty = "{'Computer SmartGroup ID':'',\
-		\
-		'Computer SmartGroup Name':'',\
-		\
-		'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-	elif usingFilter == 'noFilter':
-		
-		dataToCVS_JAMF_Computers_Info_Empty = "{'Type':'',\
-		\
-		'Computer ID':'',\
-		\
-		'Computer Name':'',\
-		\
-		'Computer Serial Number':'',\
-		\
-		'Computer Last Check-in':'',\
-		\
-		'Computer Site Info':''}"
-		
-		
+		self.latencies = deque(maxlen=ADAPTIVE_LATENCY_WINDOW)
+		self.bestP95 = None
+		self.roundSuccesses = 0
+		self.lastDecrease = 0
+
+		# Counters for the summary
+		self.peakLimit = self.limit
+		self.decreases = 0
+
+	async def acquire(self):
+		loop = asyncio.get_running_loop()
+
+		async with self.condition:
+			while True:
+				pause = self.pauseUntil - loop.time()
+
+				if pause > 0:
+					# Wait out the fleet wide pause, wake early if it gets changed
+					try:
+						await asyncio.wait_for(self.condition.wait(), pause)
+					except asyncio.TimeoutError:
+						pass
+
+				elif self.inFlight < self.limit:
+					self.inFlight += 1
+					return
+
+				else:
+					await self.condition.wait()
+
+	async def release(self, latency, statusCode=None, retryAfter=None):
+		loop = asyncio.get_running_loop()
+
+		async with self.condition:
+			self.inFlight -= 1
+
+			if statusCode in ADAPTIVE_BACKOFF_STATUS_CODES or retryAfter is not None:
+				self.backOff(loop.time(), retryAfter)
+
+			elif statusCode is not None and statusCode < 500:
+				self.latencies.append(latency)
+				self.roundSuccesses += 1
+
+				# One round is a full limit worth of successful requests
+				if self.roundSuccesses >= self.limit:
+					self.roundSuccesses = 0
+					self.increase()
+
+			self.condition.notify_all()
+
+	def backOff(self, now, retryAfter):
+		pause = retryAfter if retryAfter is not None else ADAPTIVE_DEFAULT_PAUSE
+		self.pauseUntil = max(self.pauseUntil, now + pause)
+
+		# Only cut once for a burst of 429s from the same moment
+		if now - self.lastDecrease < pause:
+			return
+
+		self.lastDecrease = now
+		self.limit = max(self.minLimit, int(self.limit * ADAPTIVE_DECREASE_FACTOR))
+		self.roundSuccesses = 0
+		self.decreases += 1
+
+	def increase(self):
+		if len(self.latencies) < 10:
+			return
+
+		latencies = sorted(self.latencies)
+		p95 = latencies[int(len(latencies) * 0.95) - 1]
+
+		if self.bestP95 is None or p95 < self.bestP95:
+			self.bestP95 = p95
+
+		if p95 <= self.bestP95 * ADAPTIVE_LATENCY_TOLERANCE and self.limit < self.maxLimit:
+			self.limit += 1
+			self.peakLimit = max(self.peakLimit, self.limit)
+
+
+# Record types for the Classic API records the report reads. With msgspec the JSON is
+# decoded straight into these and every field not listed here is skipped, so things like
+# computer software lists, extension attributes and profile payloads are never built.
+# They are still plain dicts, so the report code does not change.
+# If you use a new field in the report, add it here too.
+class ComputerGroupsAccounts(TypedDict, total=False):
+	local_accounts: list
+	computer_group_memberships: list
+
+class ComputerDetail(TypedDict, total=False):
+	general: dict
+	hardware: dict
+	groups_accounts: ComputerGroupsAccounts
+	configuration_profiles: list
+
+class ComputerRecord(TypedDict, total=False):
+	computer: ComputerDetail
+
+
+class ComputerGroupDetail(TypedDict, total=False):
+	id: int
+	name: str
+	is_smart: bool
+	computers: list
+
+class ComputerGroupRecord(TypedDict, total=False):
+	computer_group: ComputerGroupDetail
+
+
+class PolicyDetail(TypedDict, total=False):
+	general: dict
+	scope: dict
+	package_configuration: dict
+	scripts: list
+	self_service: dict
+
+class PolicyRecord(TypedDict, total=False):
+	policy: PolicyDetail
+
+
+class ConfigurationProfileGeneral(TypedDict, total=False):
+	id: int
+	name: str
+	category: dict
+
+class ConfigurationProfileDetail(TypedDict, total=False):
+	general: ConfigurationProfileGeneral
+	scope: dict
+
+class ConfigurationProfileRecord(TypedDict, total=False):
+	os_x_configuration_profile: ConfigurationProfileDetail
+
+
+class PackageDetail(TypedDict, total=False):
+	id: int
+	name: str
+	filename: str
+	category: str
+
+class PackageRecord(TypedDict, total=False):
+	package: PackageDetail
+
+
+class ScriptDetail(TypedDict, total=False):
+	id: int
+	name: str
+	filename: str
+	category: str
+
+class ScriptRecord(TypedDict, total=False):
+	script: ScriptDetail
+
+
+# Record type for each API route, see getRoute
+RECORD_TYPES = {
+	'GET /JSSResource/computers/id/{id}': ComputerRecord,
+	'GET /JSSResource/computergroups/id/{id}': ComputerGroupRecord,
+	'GET /JSSResource/policies/id/{id}': PolicyRecord,
+	'GET /JSSResource/osxconfigurationprofiles/id/{id}': ConfigurationProfileRecord,
+	'GET /JSSResource/packages/id/{id}': PackageRecord,
+	'GET /JSSResource/scripts/id/{id}': ScriptRecord
+}
+
+recordDecoders = {}
+
+
+# Decode a JSON response with the fastest Library we have
+def decodeJSON(content, url):
+	if msgspec is not None:
+		recordType = RECORD_TYPES.get(getRoute('GET', url))
+
+		if recordType is not None:
+			if recordType not in recordDecoders:
+				recordDecoders[recordType] = msgspec.json.Decoder(recordType)
+
+			try:
+				return recordDecoders[recordType].decode(content)
+
+			# Record does not match the record type, decode all of it instead
+			except msgspec.ValidationError:
+				pass
+
+		return msgspec.json.decode(content)
+
+	if orjson is not None:
+		return orjson.loads(content)
+
+	return json.loads(content)
+
+
+# SQLite cache of successful GET responses, bodies are stored zlib compressed.
+# Keyed by the API account (a hash of Jamf URL and username, so accounts with different
+# privileges never share responses), full URL and Accept header. Expired responses that have an ETag or
+# Last-Modified are revalidated with a conditional GET, a 304 counts as a cache hit.
+# Expired responses are removed and then the least recently used ones until the cache
+# fits in CACHE_MAX_BYTES.
+class ResponseCache:
+	def __init__(self, path, maxBytes=CACHE_MAX_BYTES):
+		self.path = path
+		self.maxBytes = maxBytes
+		self.hits = 0
+		self.misses = 0
+		self.stored = 0
+		self.revalidations = 0
+		self.revalidated = 0
+		self.account = ''
+		self.uncommitted = 0
+		self.lastCommit = time.monotonic()
+
+		self.db = sqlite3.connect(path)
+		self.db.execute("""CREATE TABLE IF NOT EXISTS responses (
+			key TEXT PRIMARY KEY,
+			url TEXT,
+			status INTEGER,
+			headers TEXT,
+			body BLOB,
+			size INTEGER,
+			created REAL,
+			expires REAL,
+			last_used REAL
+		)""")
+		self.db.commit()
+
+	# Set once the username is known, before any request goes through the cache
+	def setAccount(self, jamfURL, username):
+		self.account = hashlib.sha256((jamfURL.rstrip('/') + '\n' + username).encode()).hexdigest()[:16]
+
+	def getKey(self, url, headers):
+		return self.account + ' ' + (headers or {}).get('Accept', '') + ' ' + url
+
+	def commitIfDue(self):
+		self.uncommitted += 1
+
+		if self.uncommitted >= CACHE_COMMIT_EVERY or time.monotonic() - self.lastCommit >= CACHE_COMMIT_SECONDS:
+			self.db.commit()
+			self.uncommitted = 0
+			self.lastCommit = time.monotonic()
+
+	def getTTL(self, url):
+		path = urlsplit(url).path
+
+		for prefix, ttl in CACHE_TTLS:
+			if prefix in path:
+				return ttl
+
+		return CACHE_DEFAULT_TTL
+
+	def get(self, url, headers=None):
+		key = self.getKey(url, headers)
+		now = time.time()
+
+		row = self.db.execute("SELECT status, headers, body FROM responses WHERE key = ? AND expires > ?", (key, now)).fetchone()
+
+		if row is None:
+			return None
+
+		self.hits += 1
+		self.db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+
+		return FetchResult(url, row[0], zlib.decompress(row[2]), httpx.Headers(json.loads(row[1])), 'OK')
+
+	# Expired response that can be revalidated, or None
+	def getStale(self, url, headers=None):
+		row = self.db.execute("SELECT status, headers, body FROM responses WHERE key = ?", (self.getKey(url, headers),)).fetchone()
+
+		if row is None:
+			return None
+
+		cachedHeaders = httpx.Headers(json.loads(row[1]))
+
+		if 'etag' not in cachedHeaders and 'last-modified' not in cachedHeaders:
+			return None
+
+		return FetchResult(url, row[0], zlib.decompress(row[2]), cachedHeaders, 'OK')
+
+	# Headers to send with a conditional GET for a stale response
+	def getConditionalHeaders(self, staleResult, headers=None):
+		conditionalHeaders = dict(headers or {})
+
+		if 'etag' in staleResult.headers:
+			conditionalHeaders['If-None-Match'] = staleResult.headers['etag']
+
+		if 'last-modified' in staleResult.headers:
+			conditionalHeaders['If-Modified-Since'] = staleResult.headers['last-modified']
+
+		self.revalidations += 1
+
+		return conditionalHeaders
+
+	# Server answered 304, the stale response is good for another TTL
+	def markRevalidated(self, url, headers=None):
+		now = time.time()
+
+		self.hits += 1
+		self.revalidated += 1
+		self.db.execute("UPDATE responses SET expires = ?, last_used = ? WHERE key = ?", (now + self.getTTL(url), now, self.getKey(url, headers)))
+		self.commitIfDue()
+
+	def put(self, url, headers, result):
+		now = time.time()
+		body = zlib.compress(result.content)
+
+		# Only keep the headers the report can use later
+		keepHeaders = {name: value for name, value in result.headers.items() if name.lower() in ('content-type', 'etag', 'last-modified')}
+
+		self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+			(self.getKey(url, headers), url, result.status_code, json.dumps(keepHeaders), body, len(body), now, now + self.getTTL(url), now))
+		self.stored += 1
+		self.commitIfDue()
+
+	def prune(self):
+		now = time.time()
+
+		# Keep expired responses that can still be revalidated for a while
+		self.db.execute("""DELETE FROM responses WHERE expires <= ? AND
+			(expires <= ? OR (headers NOT LIKE '%"etag"%' AND headers NOT LIKE '%"last-modified"%'))""",
+			(now, now - CACHE_REVALIDATE_MAX_AGE))
+
+		totalSize = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+		if totalSize > self.maxBytes:
+			for key, size in self.db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+				self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+				totalSize -= size
+
+				if totalSize <= self.maxBytes:
+					break
+
+		self.db.commit()
+
+	def printStats(self):
+		print(f"API Cache: {self.hits} responses from {self.path}, {self.misses} fetched, {self.stored} saved")
+
+		if self.revalidations:
+			print(f"API Cache Revalidation: {self.revalidated} of {self.revalidations} expired responses were still current (304), {self.revalidated / self.revalidations * 100:.1f}% hit rate")
+
+	def close(self):
+		self.prune()
+		self.db.close()
+
+
+# Every GET response of a run kept in one SQLite file, by Accept header and path, so a
+# replay can hand the report the same responses without asking Jamf. Each response is
+# written as it comes in with the body zlib compressed, and a replay reads them one at a
+# time, so the run's traffic is never all in memory.
+class ResponseArchive:
+	def __init__(self, path, replaying=False):
+		self.path = path
+		self.replaying = replaying
+		self.jamfURL = ''
+		self.recorded = 0
+		self.replayed = 0
+		self.notFound = 0
+
+		if replaying:
+			if not exists(path):
+				raise SystemExit(f"\nJAMF_REPLAY archive {path} does not exist and now will EXIT!\n")
+
+			# Read only so a wrong path or file is never changed
+			try:
+				self.db = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+				jamfURLRow = self.db.execute("SELECT value FROM archive_info WHERE name = 'jamfURL'").fetchone()
+
+			except sqlite3.Error as err:
+				raise SystemExit(f"\nJAMF_REPLAY file {path} is not a JAMF_RECORD archive and now will EXIT! \n\nErr: {err}\n")
+
+			if jamfURLRow is None:
+				raise SystemExit(f"\nJAMF_REPLAY archive {path} has no recorded responses and now will EXIT!\n")
+
+			self.jamfURL = jamfURLRow[0]
+
+		else:
+			# Written next to the old file first so a failed run does not lose it
+			if exists(path + '.tmp'):
+				os.remove(path + '.tmp')
+
+			self.db = sqlite3.connect(path + '.tmp')
+			self.db.execute("CREATE TABLE archive_info (name TEXT PRIMARY KEY, value TEXT)")
+			self.db.execute("""CREATE TABLE responses (
+				key TEXT PRIMARY KEY,
+				status INTEGER,
+				reason TEXT,
+				headers TEXT,
+				body BLOB
+			)""")
+			self.db.execute("INSERT INTO archive_info VALUES ('recorded', ?)", (datetime.datetime.now(datetime.timezone.utc).isoformat(),))
+			self.db.commit()
+
+	def getKey(self, url, headers):
+		splitURL = urlsplit(url)
+		path = splitURL.path + ('?' + splitURL.query if splitURL.query else '')
+
+		return (headers or {}).get('Accept', '') + ' ' + path
+
+	# 404s are kept too so missing records are missing again in the replay
+	def record(self, url, headers, result):
+		if result.error is not None:
+			return
+
+		if not self.jamfURL:
+			splitURL = urlsplit(url)
+			self.jamfURL = splitURL.scheme + '://' + splitURL.netloc
+			self.db.execute("INSERT INTO archive_info VALUES ('jamfURL', ?)", (self.jamfURL,))
+
+		keepHeaders = {name: value for name, value in result.headers.items() if name.lower() in ('content-type', 'etag', 'last-modified')}
+
+		self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+			(self.getKey(url, headers), result.status_code, result.reason, json.dumps(keepHeaders), zlib.compress(result.content)))
+		self.recorded += 1
+
+		if self.recorded % ARCHIVE_COMMIT_EVERY == 0:
+			self.db.commit()
+
+	def replay(self, url, headers):
+		row = self.db.execute("SELECT status, reason, headers, body FROM responses WHERE key = ?", (self.getKey(url, headers),)).fetchone()
+
+		if row is None:
+			self.notFound += 1
+			return FetchResult(url, 0, error=HTTPError(f'Not in the replay archive {self.path} for url: {url}'))
+
+		self.replayed += 1
+
+		return FetchResult(url, row[0], zlib.decompress(row[3]), json.loads(row[2]), row[1])
+
+	def printStats(self):
+		if self.replaying:
+			print(f"API Replay: {self.replayed} responses from {self.path}, {self.notFound} requests not in the archive")
+
+		else:
+			print(f"API Record: {self.recorded} responses saved to {self.path}")
+
+	def close(self):
+		if self.replaying:
+			self.db.close()
+			return
+
+		self.db.commit()
+		self.db.close()
+
+		os.replace(self.path + '.tmp', self.path)
+
+
+# Response from the fetch engine, works like a requests Response for the report code.
+class FetchResult:
+	def __init__(self, url, status_code, content=b'', headers=None, reason='', error=None):
+		self.url = url
+		self.status_code = status_code
+		self.content = content
+		self.headers = headers or {}
+		self.reason = reason
+		self.error = error
+		self.data = None
+
+	def json(self):
+		if self.data is None:
+			self.data = decodeJSON(self.content, self.url)
+		return self.data
+
+	def raise_for_status(self):
+		if self.error is not None:
+			raise self.error
+
+		if 400 <= self.status_code < 500:
+			raise HTTPError(f"{self.status_code} Client Error: {self.reason} for url: {self.url}")
+
+		elif 500 <= self.status_code < 600:
+			raise HTTPError(f"{self.status_code} Server Error: {self.reason} for url: {self.url}")
+
+
+# Record that Jamf answered 404 for, the ID is still in a list but the record is gone.
+class MissingRecord:
+	def __init__(self, recordID, url):
+		self.recordID = recordID
+		self.url = url
+
+
+# Result of fetchMany. records are the decoded records in the same order as the IDs that
+# were found (recordIDs) and contents their response bodies as sent by Jamf, missing are
+# MissingRecord for 404s, errors are (ID, error) for anything else.
+class FetchManyResult:
+	def __init__(self):
+		self.records = []
+		self.recordIDs = []
+		self.contents = []
+		self.missing = []
+		self.errors = []
+
+	def getMissingIDs(self):
+		return [missingRecord.recordID for missingRecord in self.missing]
+
+
+# One asyncio event loop and one HTTP client shared by every collector in the report.
+# All requests go through one semaphore so the whole run never has more than
+# MAX_CONCURRENT_REQUESTS in flight, no matter how many sections are fanning out.
+class FetchEngine:
+	def __init__(self, maxConcurrentRequests=MAX_CONCURRENT_REQUESTS, timeout=DEFAULT_TIMEOUT, http2=HTTP2_ENABLED, cache=None, archive=None):
+		self.maxConcurrentRequests = maxConcurrentRequests
+		self.timeout = timeout
+		self.http2 = http2
+		self.cache = cache
+		self.archive = archive
+		self.loop = asyncio.new_event_loop()
+		self.client = None
+		self.limiter = None
+		self.retryPolicy = RetryPolicy()
+		self.tokenManager = None
+		
+		# GET requests being sent right now, identical GETs wait on the same one
+		self.inFlight = {}
+		self.coalescedRequests = 0
+		
+		# Counters for connection reuse
+		self.requestsSent = 0
+		self.connectionsOpened = 0
+		self.httpVersions = Counter()
+		
+		# Bytes on the wire and decompressed bytes for each route
+		self.bytesByRoute = {}
+
+	# Run a coroutine on the engine loop and wait for the result
+	def run(self, coroutine):
+		return self.loop.run_until_complete(coroutine)
+
+	# Same as pool.map but for async functions, results come back in the same order as items
+	def map(self, function, items):
+		return self.run(self.amap(function, items))
+
+	async def amap(self, function, items):
+		return await asyncio.gather(*[function(item) for item in items])
+
+	# Identical GETs that are already in flight share the one network call and the
+	# one FetchResult, so the JSON is only decoded once too
+	async def request(self, url, method='GET', headers=None, auth=None):
+		if method != 'GET':
+			return await self.send(url, method, headers, auth)
+
+		if self.archive is None:
+			return await self.requestShared(url, headers, auth)
+
+		if self.archive.replaying:
+			return self.archive.replay(url, headers)
+
+		result = await self.requestShared(url, headers, auth)
+		self.archive.record(url, headers, result)
+
+		return result
+
+	async def requestShared(self, url, headers=None, auth=None):
+		if self.cache is not None:
+			cachedResult = self.cache.get(url, headers)
+
+			if cachedResult is not None:
+				return cachedResult
+
+		key = (url, tuple(sorted((headers or {}).items())), auth)
+		task = self.inFlight.get(key)
+
+		if task is not None:
+			self.coalescedRequests += 1
+			return await asyncio.shield(task)
+
+		task = asyncio.ensure_future(self.sendCached(url, headers, auth))
+		self.inFlight[key] = task
+
+		try:
+			return await asyncio.shield(task)
+
+		finally:
+			if self.inFlight.get(key) is task:
+				del self.inFlight[key]
+
+	# GET through the response cache, an expired response is revalidated if it can be
+	async def sendCached(self, url, headers=None, auth=None):
+		if self.cache is None:
+			return await self.send(url, 'GET', headers, auth)
+
+		staleResult = self.cache.getStale(url, headers)
+
+		if staleResult is not None:
+			result = await self.send(url, 'GET', self.cache.getConditionalHeaders(staleResult, headers), auth)
+
+			if result.status_code == 304:
+				self.cache.markRevalidated(url, headers)
+				return staleResult
+
+		else:
+			result = await self.send(url, 'GET', headers, auth)
+
+		self.cache.misses += 1
+
+		if result.status_code == 200:
+			self.cache.put(url, headers, result)
+
+		return result
+
+	async def send(self, url, method='GET', headers=None, auth=None):
+		tokenRefreshed = False
+
+		if self.client is None:
+			limits = httpx.Limits(max_connections=CONNECTION_POOL_SIZE, max_keepalive_connections=CONNECTION_POOL_SIZE, keepalive_expiry=KEEPALIVE_EXPIRY)
+			self.client = httpx.AsyncClient(timeout=self.timeout, limits=limits, headers={'Accept-Encoding': ACCEPT_ENCODING}, http2=self.http2, follow_redirects=True)
+			self.limiter = AdaptiveLimiter(self.maxConcurrentRequests)
+
+		route = getRoute(method, url)
+		attempt = 0
+
+		while True:
+			if not self.retryPolicy.allowRequest(route, time.monotonic()):
+				return FetchResult(url, 0, error=CircuitOpenError(f'Circuit open for {route}, request skipped for url: {url}'))
+
+			# Only the request let through to test a half open route holds the probe
+			isProbe = route in self.retryPolicy.probing
+
+			try:
+				await self.limiter.acquire()
+				startTime = time.monotonic()
+				response = None
+				retryAfter = None
+
+				# Requests without basic auth get the current bearer token
+				requestHeaders = headers
+
+				if auth is None and self.tokenManager is not None:
+					requestHeaders = dict(headers or {})
+					requestHeaders['Authorization'] = self.tokenManager.getAuthorization()
+					usedAuthorization = requestHeaders['Authorization']
+
+				try:
+					self.requestsSent += 1
+
+					# Body is decompressed as it streams in
+					async with self.client.stream(method, url, headers=requestHeaders, auth=auth, extensions={'trace': self.trace}) as streamResponse:
+						content = b''.join([chunk async for chunk in streamResponse.aiter_bytes()])
+
+					response = streamResponse
+					self.httpVersions[response.http_version] += 1
+					retryAfter = parseRetryAfter(response.headers.get('Retry-After'))
+					self.recordBytes(route, response.num_bytes_downloaded, len(content))
+
+				# StreamError is a response that broke off while it was read
+				except (httpx.HTTPError, httpx.StreamError) as err:
+					error = err
+
+				# A bad URL (like a record ID that can not be in a URL) is not worth a retry
+				# and says nothing about the route
+				except httpx.InvalidURL as err:
+					return FetchResult(url, 0, error=err)
+
+				finally:
+					statusCode = response.status_code if response is not None else None
+					await self.limiter.release(time.monotonic() - startTime, statusCode, retryAfter)
+
+				# 429 means the server is busy not that the route is broken, the limiter handles it
+				if response is None or response.status_code >= 500:
+					self.retryPolicy.recordFailure(route, time.monotonic())
+				elif response.status_code != 429:
+					self.retryPolicy.recordSuccess(route)
+
+				# Token expired early or was revoked, get a new one and send the request one more time
+				if response is not None and response.status_code == 401 and auth is None and self.tokenManager is not None and not tokenRefreshed:
+					tokenRefreshed = True
+					await self.loop.run_in_executor(None, self.tokenManager.refreshIfStale, usedAuthorization)
+					continue
+
+				# Only GET requests are safe to send again
+				if method == 'GET' and attempt < ENGINE_MAX_RETRIES:
+					if response is None or response.status_code in ENGINE_RETRY_STATUS_CODES:
+						if self.retryPolicy.canRetry(route, self.requestsSent):
+							# The limiter already holds everyone back for Retry-After
+							if retryAfter is None:
+								await asyncio.sleep(self.retryPolicy.getDelay(attempt))
+							attempt += 1
+							continue
+
+				if response is None:
+					return FetchResult(url, 0, error=error)
+
+				return FetchResult(url, response.status_code, content, response.headers, response.reason_phrase)
+
+			# A probe that got a 429 or an error that is not an HTTP error leaves the route
+			# half open, so the next request tests it again
+			finally:
+				if isProbe:
+					self.retryPolicy.releaseProbe(route)
+
+	def get(self, url, headers=None, auth=None):
+		return self.run(self.request(url, headers=headers, auth=auth))
+
+	# Get each record for a list of IDs exactly once.
+	# For Example : fetchEngine.fetchMany(list_of_policies, JAMF_url + "/JSSResource/policies/id/", headers=btHeaders)
+	def fetchMany(self, ids, endpoint, headers=None, auth=None):
+		return self.run(self.afetchMany(ids, endpoint, headers, auth))
+
+	async def afetchMany(self, ids, endpoint, headers=None, auth=None):
+		result = FetchManyResult()
+
+		# Anything raised for one ID ends up in errors instead of stopping the rest
+		responses = await asyncio.gather(*[self.request(f"{endpoint}{recordID}", headers=headers, auth=auth) for recordID in ids], return_exceptions=True)
+
+		for recordID, response in zip(ids, responses):
+			if isinstance(response, Exception):
+				print(f'Other error occurred: {response}')
+				result.errors.append((recordID, response))
+				continue
+
+			try:
+				response.raise_for_status()
+
+				result.records.append(response.json())
+				result.recordIDs.append(recordID)
+				result.contents.append(response.content)
+
+			except HTTPError as http_err:
+				if response.status_code == 404:
+					result.missing.append(MissingRecord(recordID, response.url))
+
+				else:
+					print(f'HTTP error occurred: {http_err}')
+					result.errors.append((recordID, http_err))
+
+			except Exception as err:
+				print(f'Other error occurred: {err}')
+				result.errors.append((recordID, err))
+
+		if result.missing:
+			print(f".......We found that Record: {', '.join(result.getMissingIDs())}, does not exist in your JAMF Instance at URL: {endpoint}")
+
+		return result
+
+	# Yields responses for urls in order, fetching the next batch in one go while the
+	# caller works through the current one
+	def iterGet(self, urls, headers=None, batchSize=None):
+		batchSize = batchSize or self.maxConcurrentRequests
+
+		for start in range(0, len(urls), batchSize):
+			batch = urls[start:start + batchSize]
+
+			for response in self.map(partial(self.request, headers=headers), batch):
+				yield response
+
+	# Called by httpx for each step of a request, used to count new connections
+	async def trace(self, eventName, info):
+		if eventName == 'connection.connect_tcp.complete':
+			self.connectionsOpened += 1
+
+	def recordBytes(self, route, wireBytes, decodedBytes):
+		routeBytes = self.bytesByRoute.setdefault(route, [0, 0, 0])
+		routeBytes[0] += wireBytes
+		routeBytes[1] += decodedBytes
+		routeBytes[2] += 1
+
+	def printTransferStats(self):
+		if not self.bytesByRoute:
+			return
+
+		wireBytes = sum(routeBytes[0] for routeBytes in self.bytesByRoute.values())
+		decodedBytes = sum(routeBytes[1] for routeBytes in self.bytesByRoute.values())
+		saved = (1 - wireBytes / decodedBytes) * 100 if decodedBytes else 0
+
+		print(f"API Transfer: {formatBytes(wireBytes)} on the wire for {formatBytes(decodedBytes)} of data ({saved:.1f}% saved by {ACCEPT_ENCODING} compression)")
+
+		# Routes that cost the most bandwidth
+		for route, routeBytes in sorted(self.bytesByRoute.items(), key=lambda item: item[1][0], reverse=True)[:5]:
+			print(f"\t{formatBytes(routeBytes[0])} on the wire / {formatBytes(routeBytes[1])} decompressed for {routeBytes[2]} requests to {route}")
+
+	def printConnectionStats(self):
+		print()
+
+		# Nothing was sent if every response came from the cache
+		if self.requestsSent > 0:
+			reuseRatio = (self.requestsSent - self.connectionsOpened) / self.requestsSent * 100
+
+			httpVersions = ', '.join(f"{version}: {count}" for version, count in self.httpVersions.most_common())
+
+			print(f"API Connections: {self.requestsSent} requests sent over {self.connectionsOpened} connections ({reuseRatio:.1f}% reused, {httpVersions})")
+			print(f"API Concurrency: ended at {self.limiter.limit} requests in flight, peak {self.limiter.peakLimit} of {self.maxConcurrentRequests}, backed off {self.limiter.decreases} times")
+			self.retryPolicy.printStats(self.requestsSent)
+			self.printTransferStats()
+
+		print(f"API Coalescing: {self.coalescedRequests} requests saved by sharing an identical request already in flight")
+
+		if self.cache is not None:
+			self.cache.printStats()
+
+		if self.archive is not None:
+			self.archive.printStats()
+
+		if self.tokenManager is not None:
+			print(f"API Token: refreshed {self.tokenManager.refreshes} times")
+
+		print()
+
+	def close(self):
+		if self.client is not None:
+			self.run(self.client.aclose())
+
+		if self.cache is not None:
+			self.cache.close()
+
+		if self.archive is not None:
+			self.archive.close()
+
+		self.loop.close()
+
+
+# Replay answers every request from the archive, the cache is not used
+if CACHE_ENABLED and not REPLAY_PATH:
+	responseCache = ResponseCache(CACHE_PATH)
+else:
+	responseCache = None
+
+if REPLAY_PATH:
+	responseArchive = ResponseArchive(REPLAY_PATH, replaying=True)
+elif RECORD_PATH:
+	responseArchive = ResponseArchive(RECORD_PATH)
+else:
+	responseArchive = None
+
+fetchEngine = FetchEngine(cache=responseCache, archive=responseArchive)
+
+
+##########################################################################################
+# Snapshot Store
+##########################################################################################
+# Raw records of each run in one SQLite file, the response body as Jamf sent it and not
+# the decoded record, so fields the report does not read are kept too. Each record is
+# stored once by the sha256 of its body (blobs), each run only lists which record has
+# which hash (manifest), so runs where little changed cost very little space. Runs older
+# than SNAPSHOT_KEEP_DAYS and blobs no run uses any more are removed.
+class SnapshotStore:
+	def __init__(self, path):
+		self.path = path
+		self.jamfHost = ''
+		self.runID = None
+		self.newBlobs = 0
+		self.reusedBlobs = 0
+
+		self.db = sqlite3.connect(path)
+		self.db.execute("CREATE TABLE IF NOT EXISTS blobs (hash TEXT PRIMARY KEY, body BLOB)")
+		self.db.execute("CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY, jamf_host TEXT, started REAL, completed INTEGER)")
+		self.db.execute("""CREATE TABLE IF NOT EXISTS manifest (
+			run_id INTEGER,
+			kind TEXT,
+			record_id TEXT,
+			hash TEXT,
+			report_date_epoch INTEGER,
+			PRIMARY KEY (run_id, kind, record_id)
+		)""")
+		self.db.commit()
+
+	def beginRun(self, jamfURL):
+		self.jamfHost = urlsplit(jamfURL).netloc
+		self.runID = self.db.execute("INSERT INTO runs (jamf_host, started, completed) VALUES (?, ?, 0)", (self.jamfHost, time.time())).lastrowid
+		self.db.commit()
+
+	# Records are only compressed and written if no earlier run has the same body
+	def putRecord(self, kind, recordID, body, reportDate=None):
+		blobHash = hashlib.sha256(body).hexdigest()
+
+		if self.db.execute("SELECT 1 FROM blobs WHERE hash = ?", (blobHash,)).fetchone() is None:
+			self.db.execute("INSERT INTO blobs VALUES (?, ?)", (blobHash, zlib.compress(body)))
+			self.newBlobs += 1
+
+		else:
+			self.reusedBlobs += 1
+
+		self.putHash(kind, recordID, blobHash, reportDate)
+
+	def putHash(self, kind, recordID, blobHash, reportDate=None):
+		self.db.execute("INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?, ?)", (self.runID, kind, str(recordID), blobHash, reportDate))
+
+	# Completed runs for this Jamf instance, newest first, as (run ID, start time)
+	def getRuns(self):
+		return self.db.execute("SELECT id, started FROM runs WHERE jamf_host = ? AND completed = 1 ORDER BY id DESC", (self.jamfHost,)).fetchall()
+
+	# Newest completed run for this Jamf instance with records of kind, None if there is none
+	def getLastRunID(self, kind):
+		row = self.db.execute("""SELECT id FROM runs WHERE jamf_host = ? AND completed = 1
+			AND EXISTS (SELECT 1 FROM manifest WHERE run_id = runs.id AND kind = ?) ORDER BY id DESC LIMIT 1""", (self.jamfHost, kind)).fetchone()
+
+		return row[0] if row is not None else None
+
+	# {record ID: (report date, hash)} for a run, records are only read when asked for
+	def loadManifest(self, runID, kind):
+		rows = self.db.execute("SELECT record_id, report_date_epoch, hash FROM manifest WHERE run_id = ? AND kind = ?", (runID, kind))
+
+		return {recordID: (reportDate, blobHash) for recordID, reportDate, blobHash in rows}
+
+	# Response body of a record, decode it with FetchResult so it gets the same record type
+	def getRecord(self, blobHash):
+		row = self.db.execute("SELECT body FROM blobs WHERE hash = ?", (blobHash,)).fetchone()
+
+		return zlib.decompress(row[0]) if row is not None else None
+
+	# {record ID: record} for every record of kind in a run
+	def loadRun(self, runID, kind):
+		rows = self.db.execute("""SELECT manifest.record_id, blobs.body FROM manifest JOIN blobs ON blobs.hash = manifest.hash
+			WHERE manifest.run_id = ? AND manifest.kind = ?""", (runID, kind))
+
+		return {recordID: json.loads(zlib.decompress(body)) for recordID, body in rows}
+
+	# Records were saved as they were fetched, mark the run complete so later runs can use it
+	def finishRun(self):
+		self.db.execute("UPDATE runs SET completed = 1 WHERE id = ?", (self.runID,))
+		self.db.commit()
+
+	def prune(self):
+		cutoff = time.time() - SNAPSHOT_KEEP_DAYS * 24 * 60 * 60
+
+		# Old runs, and runs that never finished
+		oldRunIDs = [row[0] for row in self.db.execute("SELECT id FROM runs WHERE started < ? OR (completed = 0 AND id != ?)", (cutoff, self.runID))]
+
+		for runID in oldRunIDs:
+			self.db.execute("DELETE FROM manifest WHERE run_id = ?", (runID,))
+			self.db.execute("DELETE FROM runs WHERE id = ?", (runID,))
+
+		self.db.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT hash FROM manifest)")
+		self.db.commit()
+
+	def printStats(self):
+		print(f"Snapshots: {self.newBlobs} new records saved, {self.reusedBlobs} unchanged records shared with earlier runs in {self.path}")
+
+	def close(self):
+		self.prune()
+		self.db.close()
+
+
+##########################################################################################
+# Computer Snapshot
+##########################################################################################
+# Computer records from the last run with their report date, from the snapshot store.
+# Computers with the same report date in /JSSResource/computers/subset/basic are used
+# from the snapshot and only the ones that changed are fetched again.
+class ComputerSnapshot:
+	def __init__(self, snapshotStore):
+		self.snapshotStore = snapshotStore
+		self.lastRunID = snapshotStore.getLastRunID('computers')
+		self.records = snapshotStore.loadManifest(self.lastRunID, 'computers') if self.lastRunID is not None else {}
+		self.reused = 0
+		self.fetched = 0
+
+	# Yields a response for each computer in computerRecords, in order
+	def iterComputerResponses(self, jamfURL, computerRecords, headers):
+		response = fetchEngine.get(jamfURL + "/JSSResource/computers/subset/basic", headers=headers)
+		response.raise_for_status()
+
+		reportDates = {str(computer['id']): computer.get('report_date_epoch') for computer in response.json()['computers']}
+
+		changedIDs = []
+
+		for computerRecord in computerRecords:
+			computerID = str(computerRecord['id'])
+			snapshotRecord = self.records.get(computerID)
+
+			if snapshotRecord is None or reportDates.get(computerID) is None or snapshotRecord[0] != reportDates[computerID]:
+				changedIDs.append(computerID)
+
+		print(f"Incremental Computers: {len(computerRecords) - len(changedIDs)} computers unchanged since the last run, fetching {len(changedIDs)}")
+
+		changedResponses = fetchEngine.iterGet([jamfURL + "/JSSResource/computers/id/" + computerID for computerID in changedIDs], headers=headers)
+		changedIDs = set(changedIDs)
+
+		for computerRecord in computerRecords:
+			computerID = str(computerRecord['id'])
+			url = jamfURL + "/JSSResource/computers/id/" + computerID
+
+			if computerID in changedIDs:
+				computerResponse = next(changedResponses)
+				self.fetched += 1
+
+				if computerResponse.status_code == 200:
+					self.snapshotStore.putRecord('computers', computerID, computerResponse.content, reportDates.get(computerID))
+
+			else:
+				blobHash = self.records[computerID][1]
+
+				computerResponse = FetchResult(url, 200, self.snapshotStore.getRecord(blobHash))
+				self.snapshotStore.putHash('computers', computerID, blobHash, reportDates.get(computerID))
+				self.reused += 1
+
+			yield computerResponse
+
+	# Passes responses through, keeping computer records fetched without the incremental
+	# check for the next run
+	def iterRecorded(self, computerRecords, computerResponses):
+		for computerRecord, computerResponse in zip(computerRecords, computerResponses):
+			if computerResponse.status_code == 200:
+				computerRecordProfile = computerResponse.json()
+				self.snapshotStore.putRecord('computers', computerRecord['id'], computerResponse.content, computerRecordProfile['computer']['general'].get('report_date_epoch'))
+
+			yield computerResponse
+
+	def printStats(self):
+		if self.reused or self.fetched:
+			print(f"Incremental Computers: {self.reused} computers from the snapshot, {self.fetched} fetched")
+
+
+##########################################################################################
+# Run Entity Store
+##########################################################################################
+# List endpoint and list key for each kind of record the report reads
+ENTITY_TYPES = {
+	'policies': ('/JSSResource/policies', 'policies'),
+	'osxconfigurationprofiles': ('/JSSResource/osxconfigurationprofiles', 'os_x_configuration_profiles'),
+	'packages': ('/JSSResource/packages', 'packages'),
+	'scripts': ('/JSSResource/scripts', 'scripts'),
+	'computergroups': ('/JSSResource/computergroups', 'computer_groups'),
+	'computers': ('/JSSResource/computers', 'computers')
+}
+
+# Page size for the Jamf Pro API package list
+PACKAGE_PAGE_SIZE = 1000
+
+
+# Lists and records fetched during this run, shared by every report section so a
+# policy, group, package or script is only fetched once no matter how many sheets use it.
+# Nothing is kept between runs, that is what the response cache is for. With a snapshot
+# store set, each record is saved to it as it is fetched.
+class RunEntityStore:
+	def __init__(self, jamfURL, headers):
+		self.jamfURL = jamfURL
+		self.headers = headers
+		self.lists = {}
+		self.records = {entityType: {} for entityType in ENTITY_TYPES}
+		self.missing = {entityType: set() for entityType in ENTITY_TYPES}
+		self.packageDetails = None
+		self.snapshotStore = None
+
+	# List of every record of entityType sorted by id, from one API call
+	def getList(self, entityType):
+		if entityType in self.lists:
+			return self.lists[entityType]
+
+		listPath, listKey = ENTITY_TYPES[entityType]
+
+		try:
+			response = fetchEngine.get(self.jamfURL + listPath, headers=self.headers)
+
+			response.raise_for_status()
+
+			entityList = response.json()[listKey]
+
+		except HTTPError as http_err:
+			print(f'HTTP error occurred: {http_err}')
+			return []
+		except Exception as err:
+			print(f'Other error occurred: {err}')
+			return []
+
+		entityList.sort(key=lambda item: item.get('id'), reverse=False)
+
+		self.lists[entityType] = entityList
+		return entityList
+
+	# Same as fetchEngine.fetchMany but records already in the store are not fetched again
+	def getRecords(self, entityType, ids):
+		return fetchEngine.run(self.agetRecords(entityType, ids))
+
+	async def agetRecords(self, entityType, ids):
+		records = self.records[entityType]
+		missing = self.missing[entityType]
+
+		newIDs = [recordID for recordID in dict.fromkeys(ids) if recordID not in records and recordID not in missing]
+
+		if newIDs:
+			fetchResult = await fetchEngine.afetchMany(newIDs, self.jamfURL + ENTITY_TYPES[entityType][0] + "/id/", headers=self.headers)
+
+			records.update(zip(fetchResult.recordIDs, fetchResult.records))
+
+			if self.snapshotStore is not None:
+				for recordID, content in zip(fetchResult.recordIDs, fetchResult.contents):
+					self.snapshotStore.putRecord(entityType, recordID, content)
+
+			missing.update(fetchResult.getMissingIDs())
+
+		result = FetchManyResult()
+
+		for recordID in ids:
+			if recordID in records:
+				result.records.append(records[recordID])
+				result.recordIDs.append(recordID)
+
+			elif recordID in missing:
+				result.missing.append(MissingRecord(recordID, self.jamfURL + ENTITY_TYPES[entityType][0] + "/id/" + recordID))
+
+		return result
+
+	# Every record of entityType, in the same order as getList
+	def getAllRecords(self, entityType):
+		return self.getRecords(entityType, [str(entity['id']) for entity in self.getList(entityType)]).records
+
+	# id, name and filename for each package ID, in the same shape as the Classic API
+	# package record. All packages come from the paged Jamf Pro API list in a few calls,
+	# any the list did not have are fetched from the Classic API at the same time.
+	def getPackageDetails(self, ids):
+		if self.packageDetails is None:
+			self.packageDetails = {}
+			page = 0
+
+			try:
+				while True:
+					response = fetchEngine.get(f"{self.jamfURL}/api/v1/packages?page={page}&page-size={PACKAGE_PAGE_SIZE}&sort=id%3Aasc", headers=self.headers)
+
+					response.raise_for_status()
+
+					resp = response.json()
+
+					for package in resp['results']:
+						self.packageDetails[str(package['id'])] = {'package': {'id': int(package['id']), 'name': package['packageName'], 'filename': package['fileName']}}
+
+					page += 1
+
+					if not resp['results'] or page * PACKAGE_PAGE_SIZE >= resp['totalCount']:
+						break
+
+			except HTTPError as http_err:
+				print(f'Jamf Pro API package list not available, using the Classic API: {http_err}')
+			except Exception as err:
+				print(f'Other error occurred: {err}')
+
+		classicIDs = [recordID for recordID in ids if recordID not in self.packageDetails]
+
+		if classicIDs:
+			fetchResult = self.getRecords('packages', classicIDs)
+
+			self.packageDetails.update(zip(fetchResult.recordIDs, fetchResult.records))
+
+		return self.packageDetails
+
+
+##########################################################################################
+# Usage Graph
+##########################################################################################
+# What uses what, built from the records collected for the report. Nodes are (kind, ID)
+# for packages, scripts, policies, PreStage enrollments, patch policies and computer
+# groups, edges are typed ('installs', 'runs', 'targets', 'excludes'). Edges are indexed
+# both ways so "what uses X" and "what does policy Y pull in" only look at X's or Y's edges.
+class UsageGraph:
+	def __init__(self):
+		self.nodes = {}
+		self.uses = {}
+		self.usedBy = {}
+		self.policiesAdded = False
+
+	def addNode(self, kind, nodeID, **attributes):
+		node = (kind, str(nodeID))
+		self.nodes.setdefault(node, {}).update(attributes)
+
+		return node
+
+	# The same edge can be added more than once, a policy can install a package twice
+	def addEdge(self, fromNode, edgeType, toNode, **attributes):
+		self.nodes.setdefault(fromNode, {})
+		self.nodes.setdefault(toNode, {})
+
+		self.uses.setdefault(fromNode, []).append((edgeType, toNode, attributes))
+		self.usedBy.setdefault(toNode, []).append((edgeType, fromNode, attributes))
+
+	# Packages, scripts and computer group scope of every policy record, only added once
+	# even if more than one sheet asks
+	def addPolicies(self, policyRecords):
+		if self.policiesAdded:
+			return
+
+		self.policiesAdded = True
+
+		for policyRecord in policyRecords:
+			policyGeneral = policyRecord['policy']['general']
+			policyScope = policyRecord['policy'].get('scope', {})
+
+			policyNode = self.addNode('policy', policyGeneral['id'], id=policyGeneral['id'], name=policyGeneral['name'])
+
+			for policyPackage in policyRecord['policy']['package_configuration']['packages']:
+				self.addEdge(policyNode, 'installs', ('package', str(policyPackage['id'])), action=policyPackage.get('action'))
+
+			for policyScript in policyRecord['policy']['scripts']:
+				self.addEdge(policyNode, 'runs', ('script', str(policyScript['id'])))
+
+			for computerGroup in policyScope.get('computer_groups', []):
+				self.addEdge(policyNode, 'targets', ('computergroup', str(computerGroup['id'])))
+
+			for computerGroup in policyScope.get('exclusions', {}).get('computer_groups', []):
+				self.addEdge(policyNode, 'excludes', ('computergroup', str(computerGroup['id'])))
+
+	# [(edge type, node, edge attributes)] for everything that uses the node
+	def getUsedBy(self, kind, nodeID, edgeType=None):
+		return [edge for edge in self.usedBy.get((kind, str(nodeID)), []) if edgeType is None or edge[0] == edgeType]
+
+	# [(edge type, node, edge attributes)] for everything the node uses
+	def getUses(self, kind, nodeID, edgeType=None):
+		return [edge for edge in self.uses.get((kind, str(nodeID)), []) if edgeType is None or edge[0] == edgeType]
+
+	# Nodes of kind nothing uses
+	def getUnused(self, kind):
+		return [node for node in self.nodes if node[0] == kind and node not in self.usedBy]
+
+	# Every edgeType edge into a node of kind as a DataFrame, in the order they were added:
+	# Used ID, Using Kind, Using ID, Using Name and one column for each edge attribute
+	def getEdgeFrame(self, kind, edgeType):
+		edgeRows = []
+
+		for usedNode, edges in self.usedBy.items():
+			if usedNode[0] != kind:
+				continue
+
+			for foundEdgeType, usingNode, attributes in edges:
+				if foundEdgeType == edgeType:
+					edgeRows.append({'Used ID': usedNode[1], 'Using Kind': usingNode[0], 'Using ID': usingNode[1], 'Using Name': self.nodes[usingNode].get('name'), **attributes})
+
+		return pd.DataFrame(edgeRows, columns=None if edgeRows else ['Used ID', 'Using Kind', 'Using ID', 'Using Name'])
+
+
+##########################################################################################
+# Scope Resolver
+##########################################################################################
+# Which policies and configuration profiles apply to each computer, worked out locally from
+# the scope of the policy and profile records and the member list of each scoped computer
+# group. Only the computer list and the groups are fetched, nothing per computer.
+# Buildings, departments, limitations and other exclusions are not in these records,
+# they are listed in the Unresolved Scope column so the row can be checked by hand, and
+# each policy or profile that has them also gets one Unresolved row with no computer.
+COMPUTER_SCOPE_COLUMNS = ['Type', 'Computer ID', 'Computer Name', 'Policy or Profile ID', 'Policy or Profile Name', 'Scoped By', 'Unresolved Scope']
+SCOPE_UNRESOLVED_TARGETS = {'buildings': 'Buildings', 'departments': 'Departments'}
+SCOPE_UNRESOLVED_LIMITATIONS = {'network_segments': 'Network Segments', 'users': 'Users', 'user_groups': 'User Groups', 'ibeacons': 'iBeacons'}
+SCOPE_UNRESOLVED_EXCLUSIONS = {'buildings': 'Buildings', 'departments': 'Departments', 'network_segments': 'Network Segments', 'users': 'Users', 'user_groups': 'User Groups', 'ibeacons': 'iBeacons'}
+
+
+class ScopeResolver:
+	def __init__(self, entityStore):
+		self.entityStore = entityStore
+		self.groupMembers = {}
+
+	# Computer IDs in each computer group, smart and static, one request per group
+	def loadGroupMembers(self, groupIDs):
+		fetchResult = self.entityStore.getRecords('computergroups', [groupID for groupID in dict.fromkeys(groupIDs) if groupID not in self.groupMembers])
+
+		for groupID, groupRecord in zip(fetchResult.recordIDs, fetchResult.records):
+			self.groupMembers[groupID] = {str(computer['id']) for computer in groupRecord['computer_group'].get('computers', [])}
+
+		# Groups that are gone have no members
+		for missingRecord in fetchResult.missing:
+			self.groupMembers[missingRecord.recordID] = set()
+
+	# Parts of a scope that can not be checked from the records, as text for the sheet
+	@staticmethod
+	def getUnresolvedScope(scope):
+		unresolved = [label for key, label in SCOPE_UNRESOLVED_TARGETS.items() if scope.get(key)]
+		unresolved += ['Limitation ' + label for key, label in SCOPE_UNRESOLVED_LIMITATIONS.items() if scope.get('limitations', {}).get(key)]
+		unresolved += ['Exclusion ' + label for key, label in SCOPE_UNRESOLVED_EXCLUSIONS.items() if scope.get('exclusions', {}).get(key)]
+
+		return ", ".join(unresolved)
+
+	# {computer ID: [what scoped it]} for the computers a scope applies to after exclusions
+	def getScopedComputers(self, scope, computerIDs):
+		scopedBy = {}
+
+		if scope.get('all_computers'):
+			for computerID in computerIDs:
+				scopedBy.setdefault(computerID, []).append('All Computers')
+
+		for computer in scope.get('computers', []):
+			scopedBy.setdefault(str(computer['id']), []).append('Computer')
+
+		for computerGroup in scope.get('computer_groups', []):
+			for computerID in self.groupMembers.get(str(computerGroup['id']), ()):
+				scopedBy.setdefault(computerID, []).append('Computer Group: ' + computerGroup['name'])
+
+		exclusions = scope.get('exclusions', {})
+
+		excluded = {str(computer['id']) for computer in exclusions.get('computers', [])}
+
+		for computerGroup in exclusions.get('computer_groups', []):
+			excluded |= self.groupMembers.get(str(computerGroup['id']), set())
+
+		return {computerID: reasons for computerID, reasons in scopedBy.items() if computerID in computerIDs and computerID not in excluded}
+
+	# One row for each policy and profile that applies to each computer, in computer list
+	# order. Disabled policies are left out, computers nothing applies to get one row.
+	# Then one row for each policy and profile with scope that could not be checked.
+	def resolve(self, policyRecords, profileRecords):
+		computerNames = {str(computer['id']): computer['name'] for computer in self.entityStore.getList('computers')}
+
+		scopedRecords = [('Policy', policyRecord['policy']['general'], policyRecord['policy'].get('scope', {}))
+			for policyRecord in policyRecords if policyRecord['policy']['general'].get('enabled', True)]
+		scopedRecords += [('Configuration Profile', profileRecord['os_x_configuration_profile']['general'], profileRecord['os_x_configuration_profile'].get('scope', {}))
+			for profileRecord in profileRecords]
+
+		# Every group used as a target or exclusion, fetched at the same time
+		groupIDs = []
+
+		for recordType, general, scope in scopedRecords:
+			groupIDs += [str(computerGroup['id']) for computerGroup in scope.get('computer_groups', [])]
+			groupIDs += [str(computerGroup['id']) for computerGroup in scope.get('exclusions', {}).get('computer_groups', [])]
+
+		self.loadGroupMembers(groupIDs)
+
+		appliedTo = {computerID: [] for computerID in computerNames}
+		unresolvedRows = []
+
+		for recordType, general, scope in scopedRecords:
+			unresolvedScope = self.getUnresolvedScope(scope)
+
+			if unresolvedScope:
+				unresolvedRows.append({'Type':'Unresolved ' + recordType,\
+				\
+				'Policy or Profile ID':int(general['id']),\
+				\
+				'Policy or Profile Name':general['name'],\
+				\
+				'Unresolved Scope':unresolvedScope})
+
+			for computerID, reasons in self.getScopedComputers(scope, appliedTo).items():
+				appliedTo[computerID].append({'Type':recordType,\
+				\
+				'Computer ID':int(computerID),\
+				\
+				'Computer Name':computerNames[computerID],\
+				\
+				'Policy or Profile ID':int(general['id']),\
+				\
+				'Policy or Profile Name':general['name'],\
+				\
+				'Scoped By':", ".join(reasons),\
+				\
+				'Unresolved Scope':unresolvedScope})
+
+		scopeRows = []
+
+		for computerID, computerRows in appliedTo.items():
+			if computerRows:
+				scopeRows += computerRows
+			else:
+				scopeRows.append({'Type':'Nothing Scoped', 'Computer ID':int(computerID), 'Computer Name':computerNames[computerID]})
+
+		return scopeRows + unresolvedRows
 
-	dataToCVS_JAMF_Computers_Hardware_Info_Empty = "{'Computer Make':'',\
-	\
-	'Computer Model':'',\
-	\
-	'Computer Model Identifier':'',\
-	\
-	'Computer OS Name':'',\
-	\
-	'Computer OS Version':'',\
-	\
-	'Computer OS Build':''}"	
-	
-	
-	dataToCVS_JAMF_Computers_FileVault2_Info_Empty = "{'Computer FileVault2 User':''}"
-	
-	
-	dataToCVS_JAMF_Computers_Local_Account_Info_Empty = "{'Computer Local Account Name':'',\
-	\
-	'Computer Local Account Real Name':'',\
-	\
-	'Computer Local Account ID':'',\
-	\
-	'Computer Local Account is Admin ':'',\
-	\
-	'Computer Local Account in LDAP ':''}"
-	
-	
-	dataToCVS_JAMF_Computers_Info_Computer_Group_Membership_Empty = "{'Computer Group Membership Group ID':'',\
-	\
-	'Computer Group Membership Group Name':'',\
-	\
-	'Computer Group Membership Group Is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty = "{'Computer Configuration Profile Membership ID':'',\
-	\
-	'Computer Configuration Profile Membership Name':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Policy Info Empty
-	##################################################
-	dataToCVS_JAMF_Policy_Info_Empty = "{'Type':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':'',\
-	\
-	'Policy Category ID':'',\
-	\
-	'Policy Category Name':''}"
-	
-	
-	dataToCVS_JAMF_Policy_SelfService_Info_Empty = "{'Policy In SelfService':'',\
-	\
-	'Policy In SelfService Name':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Target_Info_Empty = "{'Policy Target All Computers':'',\
-	\
-	'Policy Target Computer ID':'',\
-	\
-	'Policy Target Computer Name':'',\
-	\
-	'Policy Target Group ID':'',\
-	\
-	'Policy Target Group Name':'',\
-	\
-	'Policy Target Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Exclusion_Info_Empty = "{'Policy Exclusion Computer ID':'',\
-	\
-	'Policy Exclusion Computer Name':'',\
-	\
-	'Policy Exclusion Group id':'',\
-	\
-	'Policy Exclusion Group Name':'',\
-	\
-	'Policy Exclusion Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Packages_Info_Empty = "{'Policy Package ID':'',\
-	\
-	'Policy Package Name':'',\
-	\
-	'Policy Package Category Name':'',\
-	\
-	'Policy Package Filename':''}"
-	
-	
-	dataToCVS_JAMF_Policy_Scripts_Info_Empty = "{'Policy Script ID':'',\
-	\
-	'Policy Script Name':'',\
-	\
-	'Policy Script Category Name':'',\
-	\
-	'Policy Script Filename':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Configuration Profile Info to empty
-	##################################################
-	dataToCVS_JAMF_Configuration_Profile_Info_Empty = "{'Configuration Profile ID':'',\
-	\
-	'Configuration Profile Type':'',\
-	\
-	'Configuration Profile Name':'',\
-	\
-	'Configuration Profile Category ID':'',\
-	\
-	'Configuration Profile Category Name':''}"
-	
-	
-	dataToCVS_JAMF_Configuration_Profile_Target_Info_Empty = "{'Configuration Profile Target Computer ID':'',\
-	\
-	'Configuration Profile Target Computer Name':'',\
-	\
-	'Configuration Profile Target Group ID':'',\
-	\
-	'Configuration Profile Target Group Name':'',\
-	\
-	'Configuration Profile Target Group is Smart':''}"
-	
-	
-	dataToCVS_JAMF_Configuration_Profile_Exclusion_Info_Empty = "{'Configuration Profile Exclusion Computer id':'',\
-	\
-	'Configuration Profile Exclusion Computer Name':'',\
-	\
-	'Configuration Profile Exclusion Group id':'',\
-	\
-	'Configuration Profile Exclusion Group Name':'',\
-	\
-	'Configuration Profile Exclusion Group is Smart':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Script Profile Info to empty
-	##################################################
-	dataToCVS_JAMF_Package_To_Regular_Policy_Info_Empty = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	
-	dataToCVS_JAMF_Package_To_PreStage_Policy_Info_Empty = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	
-	dataToCVS_JAMF_Package_Unused_Info_Empty = "{'Type':'',\
-	\
-	'Package List':'',\
-	\
-	'Package ID':'',\
-	\
-	'Package Name':'',\
-	\
-	'Package File Name':''}"
-	
-	
-	##################################################
-	# Set Variables for Dict for Script to Policies Info Empty
-	##################################################
-	dataToCVS_JAMF_Script_To_Regular_Policy_Info_Empty = "{'Type':'',\
-	\
-	'Script ID':'',\
-	\
-	'Script Name':'',\
-	\
-	'Script File Name':'',\
-	\
-	'Policy ID':'',\
-	\
-	'Policy Name':''}"
-	
-	dataToCVS_JAMF_Script_Unused_Info_Empty = "{'Type':'',\
-	\
-	'Script ID':'',\
-	\
-	'Script Name':'',\
-	\
-	'Script File Name':''}"	
-	
-	
-	##################################################
-	# Take Variables and make Dict
-	##################################################
-	# Computers Info
-	JAMF_Computers_Info = eval(dataToCVS_JAMF_Computers_Info)
-	JAMF_Computers_Hardware_Info = eval(dataToCVS_JAMF_Computers_Hardware_Info)
-	JAMF_Computers_FileVault2_Info = eval(dataToCVS_JAMF_Computers_FileVault2_Info)
-	JAMF_Computers_Local_Account_Info = eval(dataToCVS_JAMF_Computers_Local_Account_Info)
-	JAMF_Computers_Info_Computer_Group_Membership = eval(dataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
-	JAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
-	
-	# Policy Info
-	JAMF_Policy_Info = eval(dataToCVS_JAMF_Policy_Info)
-	JAMF_Policy_SelfService_Info = eval(dataToCVS_JAMF_Policy_SelfService_Info)
-	JAMF_Policy_Target_Info = eval(dataToCVS_JAMF_Policy_Target_Info)
-	JAMF_Policy_Exclusion_Info = eval(dataToCVS_JAMF_Policy_Exclusion_Info)
-	JAMF_Policy_Packages_Info = eval(dataToCVS_JAMF_Policy_Packages_Info)
-	JAMF_Policy_Scripts_Info = eval(dataToCVS_JAMF_Policy_Scripts_Info)
-	
-	# Configuration Profile Info
-	JAMF_Configuration_Profile_Info = eval(dataToCVS_JAMF_Configuration_Profile_Info)
-	JAMF_Configuration_Profile_Target_Info = eval(dataToCVS_JAMF_Configuration_Profile_Target_Info)
-	JAMF_Configuration_Profile_Exclusion_Info = eval(dataToCVS_JAMF_Configuration_Profile_Exclusion_Info)
-	
-	# Package to Policy Info
-	JAMF_Package_To_Regular_Policy_Info = eval(dataToCVS_JAMF_Package_To_Regular_Policy_Info)
-	JAMF_Package_To_PreStage_Policy_Info = eval(dataToCVS_JAMF_Package_To_PreStage_Policy_Info)
-	JAMF_Package_Unused_Info = eval(dataToCVS_JAMF_Package_Unused_Info)
-	
-	
-	# Script to Policy Info
-	JAMF_Script_To_Regular_Policy_Info = eval(dataToCVS_JAMF_Script_To_Regular_Policy_Info)
-	JAMF_Script_Unused_Info = eval(dataToCVS_JAMF_Script_Unused_Info)
-	
-	
-	##################################################
-	# Take Variables and make them a Empty Dict
-	##################################################
-	# Computers Info
-	JAMF_Computers_Info_Empty = eval(dataToCVS_JAMF_Computers_Info_Empty)
-	JAMF_Computers_Hardware_Info_Empty = eval(dataToCVS_JAMF_Computers_Hardware_Info_Empty)
-	JAMF_Computers_FileVault2_Info_Empty = eval(dataToCVS_JAMF_Computers_FileVault2_Info_Empty)
-	JAMF_Computers_Local_Account_Info_Empty = eval(dataToCVS_JAMF_Computers_Local_Account_Info_Empty)
-	JAMF_Computers_Info_Computer_Group_Membership_Empty = eval(dataToCVS_JAMF_Computers_Info_Computer_Group_Membership_Empty)
-	JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty = eval(dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty)
-	
-	# Policy Info
-	JAMF_Policy_Info_Empty = eval(dataToCVS_JAMF_Policy_Info_Empty)
-	JAMF_Policy_SelfService_Info_Empty = eval(dataToCVS_JAMF_Policy_SelfService_Info_Empty)
-	JAMF_Policy_Target_Info_Empty = eval(dataToCVS_JAMF_Policy_Target_Info_Empty)
-	JAMF_Policy_Exclusion_Info_Empty = eval(dataToCVS_JAMF_Policy_Exclusion_Info_Empty)
-	JAMF_Policy_Packages_Info_Empty = eval(dataToCVS_JAMF_Policy_Packages_Info_Empty)
-	JAMF_Policy_Scripts_Info_Empty = eval(dataToCVS_JAMF_Policy_Scripts_Info_Empty)
-	
-	# Configuration Profile Info
-	JAMF_Configuration_Profile_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Info_Empty)
-	JAMF_Configuration_Profile_Target_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Target_Info_Empty)
-	JAMF_Configuration_Profile_Exclusion_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Exclusion_Info_Empty)
-	
-	# Package to Policy Info
-	JAMF_Package_To_Regular_Policy_Info_Empty = eval(dataToCVS_JAMF_Package_To_Regular_Policy_Info_Empty)
-	JAMF_Package_To_PreStage_Policy_Info_Empty = eval(dataToCVS_JAMF_Package_To_PreStage_Policy_Info_Empty)
-	JAMF_Package_Unused_Info_Empty = eval(dataToCVS_JAMF_Package_Unused_Info_Empty)
-	
-	# Script to Policy Info
-	JAMF_Script_To_Regular_Policy_Info_Empty = eval(dataToCVS_JAMF_Script_To_Regular_Policy_Info_Empty)
-	JAMF_Script_Unused_Info_Empty = eval(dataToCVS_JAMF_Script_Unused_Info_Empty)
-	
-	
-	##################################################
-	# Build the dataToCsvPolicy
-	##################################################
-	# Computer Fields
-	if get_JAMF_Computers_Info == "yes":
-		
-		if includeComputerInfo == "yes":
-			
-			computerColumns = JAMF_Computers_Info
-			
-			
-		if includeHardwareInfo == "yes":
-			
-			hardwareColumns = JAMF_Computers_Hardware_Info
-			
-		elif includeHardwareInfo == "no":
-			
-			hardwareColumns = JAMF_Computers_Hardware_Info_Empty
-			
-		
-		if includeFileVault2Info == "yes":
-			
-			FileVault2Columns = JAMF_Computers_FileVault2_Info
-			
-		elif includeFileVault2Info == "no":
-			
-			FileVault2Columns = JAMF_Computers_FileVault2_Info_Empty
-			
-		
-		if includeLocalAccountInfo == "yes":
-			
-			LocalAccountColumns = JAMF_Computers_Local_Account_Info
-			
-		elif includeLocalAccountInfo == "no":
-			
-			LocalAccountColumns = JAMF_Computers_Local_Account_Info_Empty
-			
-			
-		if includeComputerGroupMembershipInfo == 'yes':
-			
-			computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership
-			
-		elif includeComputerGroupMembershipInfo == 'no':
-			
-			computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership_Empty
-			
-			
-		if includeComputerConfigurationProfileMembershipInfo == 'yes':
-			
-			computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership
-			
-		elif includeComputerConfigurationProfileMembershipInfo == 'no':
-			
-			computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty	
-			
-			
-	elif get_JAMF_Computers_Info == "no":
-		
-		computerColumns = JAMF_Computers_Info_Empty
-		hardwareColumns = JAMF_Computers_Hardware_Info_Empty
-		FileVault2Columns = JAMF_Computers_FileVault2_Info_Empty
-		LocalAccountColumns = JAMF_Computers_Local_Account_Info_Empty
-		computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership_Empty
-		computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty	
-						
-	
-	# Policy Fields
-	if get_JAMF_Policy_Info == "yes":
-		
-		if includePolicyInfo == "yes":
-			
-			policyColumns = JAMF_Policy_Info
-			
-			
-		if includeSelfServiceInfo == "yes":
-			
-			selfServiceColumns = JAMF_Policy_SelfService_Info
-			
-		elif includeSelfServiceInfo == "no":
-			
-			selfServiceColumns = JAMF_Policy_SelfService_Info_Empty
-			
-			
-		if includeTargetsInfo == "yes":
-			
-			targetsColumns = JAMF_Policy_Target_Info
-			
-		elif includeTargetsInfo == "no":
-			
-			targetsColumns = JAMF_Policy_Target_Info_Empty
-			
-			
-		if includeExclusionsInfo == "yes":
-			
-			exclusionColumns = JAMF_Policy_Exclusion_Info
-			
-		elif includeExclusionsInfo == "no":
-			
-			exclusionColumns = JAMF_Policy_Exclusion_Info_Empty	
-			
-			
-		if includePackagesInfo == "yes":
-			
-			packageColumns = JAMF_Policy_Packages_Info
-			
-		elif includePackagesInfo == "no":
-			
-			packageColumns = JAMF_Policy_Packages_Info_Empty
-			
-			
-		if includeScriptsInfo == "yes":
-			
-			scriptsColumns = JAMF_Policy_Scripts_Info
-			
-		elif includeScriptsInfo == "no":
-			
-			scriptsColumns = JAMF_Policy_Scripts_Info_Empty
-			
-	elif get_JAMF_Policy_Info == "no":
-		
-		policyColumns = JAMF_Policy_Info_Empty
-		selfServiceColumns = JAMF_Policy_SelfService_Info_Empty
-		targetsColumns = JAMF_Policy_Target_Info_Empty
-		exclusionColumns = JAMF_Policy_Exclusion_Info_Empty
-		packageColumns = JAMF_Policy_Packages_Info_Empty
-		scriptsColumns = JAMF_Policy_Scripts_Info_Empty
-		
-	
-	# Configuration Profile Fields
-	if get_JAMF_Configuration_Profile_Info == "yes":
-		
-		if includeConfigurationProfileInfo == "yes":
-			
-			configProfileColumns = JAMF_Configuration_Profile_Info
-			
-		elif includeConfigurationProfileInfo == "no":
-			
-			configProfileColumns = JAMF_Configuration_Profile_Info_Empty
-			
-			
-		if includeConfigurationProfileTargetsInfo == "yes":
-			
-			configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info
-			
-		elif includeConfigurationProfileTargetsInfo == "no":
-			
-			configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info_Empty
-			
-			
-		if includeConfigurationProfileExclusionsInfo == "yes":
-			
-			configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info
-			
-		elif includeConfigurationProfileExclusionsInfo == "no":
-			
-			configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info_Empty
-			
-			
-	elif get_JAMF_Configuration_Profile_Info == "no":
-		
-		configProfileColumns = JAMF_Configuration_Profile_Info_Empty
-		configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info_Empty
-		configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info_Empty
-	
-	
-	# Package to Policy Info fields
-	if get_JAMF_Package_To_Policy_Info == 'yes':
-		
-		# Regular columns
-		if includeRegularPackageToPolicyInfo == "yes":
-			
-			packageToRegularPolicyColumns = JAMF_Package_To_Regular_Policy_Info
-			packageUnusedColumns = JAMF_Package_Unused_Info	
-			
-		elif includeRegularPackageToPolicyInfo == "no":
-			
-			packageToRegularPolicyColumns = JAMF_Package_To_Regular_Policy_Info_Empty
-			packageUnusedColumns = JAMF_Package_Unused_Info_Empty
-		
-		#prestage columns
-		if includePreStagePackageToPolicyInfo == "yes":
-			
-			packageToPreStagePolicyColumns = JAMF_Package_To_PreStage_Policy_Info
-			packageUnusedColumns = JAMF_Package_Unused_Info
-			
-		elif includePreStagePackageToPolicyInfo == "no":
-			
-			packageToPreStagePolicyColumns = JAMF_Package_To_PreStage_Policy_Info_Empty
-			packageUnusedColumns = JAMF_Package_Unused_Info_Empty
-			
-			
-	# Script to Policy Info fields
-	if get_JAMF_Script_To_Policy_Info == 'yes':
-		
-		# Regular columns
-		if includeRegularScriptToPolicyInfo == "yes":
-			
-			ScriptToRegularPolicyColumns = JAMF_Script_To_Regular_Policy_Info
-			ScriptUnusedColumns = JAMF_Script_Unused_Info	
-			
-		elif includeRegularScriptToPolicyInfo == "no":
-			
-			ScriptToRegularPolicyColumns = JAMF_Script_To_Regular_Policy_Info_Empty
-			ScriptUnusedColumns = JAMF_Script_Unused_Info_Empty
-			
 
 ##########################################################################################
-# Process Requested Info for Sheets
-##########################################################################################			
-if get_JAMF_Computers_Info == ("yes"):
-	
-	##########################################################################################
-	# Process Computers information for csv / Excel
-	##########################################################################################
-	# Set up url for getting a list of all Computers from JAMF API
-	if usingFilter == 'computerFilter':
-		
-		url = JAMF_url + "/JSSResource/computers/id/" + JAMF_Computer_ID
-		
-	elif usingFilter == 'smartGroupFilter':
-		
-		url = JAMF_url + "/JSSResource/computergroups/id/" + JAMF_SmartGroup_ID
-		
-	elif usingFilter == 'noFilter':
-		
-		url = JAMF_url + "/JSSResource/computers"
-	
-	try:
-		response = http.get(url, headers=btHeaders)
-		
+# LDAP User Cache
+##########################################################################################
+# LDAP verification for local account names. Each name is looked up once per run no matter
+# how many computers have it, and names LDAP does not know (404) are remembered as well.
+LDAP_USER_MISSING = 'missing'
+
+
+class LDAPUserCache:
+	def __init__(self, jamfURL, lookupURL, headers):
+		self.lookupURL = jamfURL + lookupURL + "/user/"
+		self.headers = headers
+		self.users = {}
+		self.lookups = 0
+		self.hits = 0
+
+	# Same filter the Local Account rows use, only these names are checked in LDAP
+	@staticmethod
+	def isReportedAccount(name):
+		return re.match(r"^((?![_/][a-zA-Z]*))", name) and name not in filterDefaultUserAccountsList
+
+	# Local account names to check for computer responses that came back OK
+	def getAccountNames(self, computerResponses):
+		names = []
+
+		for computerResponse in computerResponses:
+			if computerResponse.status_code != 200:
+				continue
+
+			try:
+				localAccounts = computerResponse.json()['computer']['groups_accounts']['local_accounts']
+
+			except Exception:
+				continue
+
+			names.extend(localAccount['name'] for localAccount in localAccounts if self.isReportedAccount(localAccount['name']))
+
+		return names
+
+	# Look up all names not seen yet at the same time
+	def resolve(self, names):
+		newNames = [name for name in dict.fromkeys(names) if name not in self.users]
+
+		self.hits += len(names) - len(newNames)
+
+		if not newNames:
+			return
+
+		responses = fetchEngine.map(partial(fetchEngine.request, headers=self.headers), [self.lookupURL + name for name in newNames])
+
+		for name, response in zip(newNames, responses):
+			self.lookups += 1
+
+			try:
+				response.raise_for_status()
+
+				self.users[name] = response.json()
+
+			except HTTPError as http_err:
+				if response.status_code == 404:
+					print(f".......We found that Record: {name}, does not exist in your JAMF Instance at URL: {response.url}")
+					self.users[name] = LDAP_USER_MISSING
+
+				else:
+					# Not kept, the next computer with this name asks again
+					print(f'HTTP error occurred: {http_err}')
+
+			except Exception as err:
+				print(f'Other error occurred: {err}')
+
+	# Passes computer responses through in order, looking up the local accounts of each
+	# batch before handing it on
+	def iterPrefetched(self, computerResponses, batchSize=None):
+		batchSize = batchSize or fetchEngine.maxConcurrentRequests
+		batch = []
+
+		for computerResponse in computerResponses:
+			batch.append(computerResponse)
+
+			if len(batch) == batchSize:
+				self.resolve(self.getAccountNames(batch))
+				yield from batch
+				batch = []
+
+		if batch:
+			self.resolve(self.getAccountNames(batch))
+			yield from batch
+
+	# LDAP record for name, None if LDAP does not know it or the lookup failed
+	def get(self, name):
+		if name not in self.users:
+			self.resolve([name])
+
+		verifyLocalAccount = self.users.get(name)
+
+		if verifyLocalAccount == LDAP_USER_MISSING:
+			return None
+
+		return verifyLocalAccount
+
+	def printStats(self):
+		print(f"LDAP Verification: {self.lookups} names looked up, {self.hits} lookups answered from the run cache")
+
+
+##########################################################################################
+# Bearer Token Manager
+##########################################################################################
+# Refresh the token this many seconds before it expires
+TOKEN_REFRESH_BEFORE_EXPIRY = 5 * 60
+
+# Used when the token response has no expires field we can read
+TOKEN_DEFAULT_LIFETIME = 20 * 60
+
+# Never refresh sooner than this. If the Jamf clock is behind ours the token can look
+# expired already, the timer waits this long and a 401 before then gets a new token.
+TOKEN_MIN_REFRESH_DELAY = 30
+
+
+# Gets the bearer token once and keeps it fresh with a background timer, so the report
+# does not have to call keep-alive in every loop. Safe to use from threads and the
+# fetch engine at the same time.
+class BearerTokenManager:
+	def __init__(self, jamfURL, username, password):
+		self.jamfURL = jamfURL
+		self.username = username
+		self.password = password
+		self.lock = threading.Lock()
+		self.refreshLock = threading.RLock()
+		self.timer = None
+		self.token = None
+		self.expires = None
+		self.refreshes = 0
+
+		self.getNewToken()
+
+	def getAuthorization(self):
+		with self.lock:
+			return 'Bearer ' + self.token
+
+	def getNewToken(self):
+		response = http.post(self.jamfURL + "/api/v1/auth/token", headers=headers, auth = HTTPBasicAuth(self.username, self.password))
 		response.raise_for_status()
-		
-		resp = response.json()
-		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')
-	
-	# For Testing
-	#print(response.json())
-	
-	#Choose filter for records
-	if usingFilter == 'computerFilter':
-		
-		computerRecords = resp['computer']['general']
+		self.setToken(response.json())
+
+	def setToken(self, tokenData):
+		lifetime = TOKEN_DEFAULT_LIFETIME
 
-		
-	elif usingFilter == 'smartGroupFilter':
-		
-		computerRecords = resp['computer_group']['computers']
-		computerRecords.sort(key=lambda item: item.get('id'), reverse=False)
-		
-		smartGroupRecords = resp['computer_group']
-		smartGroupRecordName = smartGroupRecords['name']
-		
-		#Set Variables if Data Available
-		if len(str(smartGroupRecords['id'])) == 0:
-			smartGroupRecordID = ''
-		else:
-			smartGroupRecordID = int(smartGroupRecords['id'])
-		
-	elif usingFilter == 'noFilter':
-		
-		computerRecords = resp['computers']
-		computerRecords.sort(key=lambda item: item.get('id'), reverse=False)
-	
-	
-	# Process Computers List and get information linked to Computers
-	if usingFilter == 'computerFilter':
-		
-		#run for single computer
-		# Get ID to do JAMF API lookup
-		computerRecordID = str(computerRecords['id'])
-		
-		#For Testing
-		#print(computerRecordID)
-		
-		# Set up url for getting information from each configurationProfile ID from JAMF API
-		url = JAMF_url + "/JSSResource/computers/id/" + computerRecordID
-		
 		try:
-			response = http.get(url, headers=btHeaders)
-			
-			response.raise_for_status()
-			
-			computerRecordProfile = response.json()
-			
+			expires = datetime.datetime.fromisoformat(tokenData['expires'].replace('Z', '+00:00'))
+			lifetime = (expires - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+
+		except (KeyError, AttributeError, ValueError):
+			pass
+
+		with self.lock:
+			self.token = tokenData['token']
+			self.expires = time.time() + lifetime
+
+		self.scheduleRefresh(lifetime)
+
+	def scheduleRefresh(self, lifetime):
+		if self.timer is not None:
+			self.timer.cancel()
+
+		refreshIn = max(TOKEN_MIN_REFRESH_DELAY, lifetime / 2, lifetime - TOKEN_REFRESH_BEFORE_EXPIRY)
+
+		self.timer = threading.Timer(refreshIn, self.refresh)
+		self.timer.daemon = True
+		self.timer.start()
+
+	# Only refresh if no other request has already replaced the token that was rejected
+	def refreshIfStale(self, rejectedAuthorization):
+		with self.refreshLock:
+			if self.getAuthorization() == rejectedAuthorization:
+				self.refresh()
+
+	# Renew the token with keep-alive, if that fails get a new one with the API Username and Password
+	def refresh(self):
+		with self.refreshLock:
+			try:
+				response = http.post(self.jamfURL + "/api/v1/auth/keep-alive", headers={'Accept': 'application/json', 'Authorization': self.getAuthorization()})
+				response.raise_for_status()
+				self.setToken(response.json())
+
+			except Exception:
+				try:
+					self.getNewToken()
+
+				except Exception as err:
+					print(f'Bearer token refresh error occurred: {err}')
+					return
+
+			self.refreshes += 1
+
+	def invalidate(self):
+		if self.timer is not None:
+			self.timer.cancel()
+
+		try:
+			http.post(self.jamfURL + "/api/v1/auth/invalidate-token", headers={'Accept': 'application/json', 'Authorization': self.getAuthorization()})
+
 		except HTTPError as http_err:
 			print(f'HTTP error occurred: {http_err}')
 		except Exception as err:
 			print(f'Other error occurred: {err}')
-			
-			
-		# For Testing
-		#print(computerRecordProfile)
-			
-		#General Element for ID and Catagory
-		mycomputerRecordGeneral = computerRecordProfile['computer']['general']
-		mycomputerRecordHardware = computerRecordProfile['computer']['hardware']
-		mycomputerRecordHardwareFileVault2Users = computerRecordProfile['computer']['hardware']['filevault2_users']
-		mycomputerRecordHardwareLocalAccounts = computerRecordProfile['computer']['groups_accounts']['local_accounts']
-		mycomputerRecordComputerGroupMembership = computerRecordProfile['computer']['groups_accounts']['computer_group_memberships']
-		mycomputerConfigurationProfileMembership = computerRecordProfile['computer']['configuration_profiles']
-		
-		
-		##########################################################################################
-		# Process ConfigurationProfile information for csv / Excel
-		##########################################################################################
-		# Individual Computers Info for each record
-		getMycomputerRecordGeneralID = (str(mycomputerRecordGeneral['id']) + " - " + mycomputerRecordGeneral['name'])
-		
-		# Get info for Policies
-		print("Working on Computer ID: " + getMycomputerRecordGeneralID)
-		
-		#Set Variables if Data Available
-		if len(str(mycomputerRecordGeneral['id'])) == 0:
-			mycomputerRecordGeneralID = ''
-		else:
-			mycomputerRecordGeneralID = int(mycomputerRecordGeneral['id'])
-			
-			
-		# Set Variables for Dict for Computers Info
-		if usingFilter == 'computerFilter':
-			
-			appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
-			\
-			'Computer ID':mycomputerRecordGeneralID,\
-			\
-			'Computer Name':mycomputerRecordGeneral['name'],\
-			\
-			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-			\
-			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-			\
-			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-			
-		elif usingFilter == 'smartGroupFilter':
-			
-			appendDataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':smartGroupRecordID,\
-			\
-			'Computer SmartGroup Name':smartGroupRecordName,\
-			\
-			'Type':'Computer Info',\
-			\
-			'Computer ID':mycomputerRecordGeneralID,\
-			\
-			'Computer Name':mycomputerRecordGeneral['name'],\
-			\
-			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-			\
-			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-			\
-			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-			
-		elif usingFilter == 'noFilter':
-			
-			appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
-			\
-			'Computer ID':mycomputerRecordGeneralID,\
-			\
-			'Computer Name':mycomputerRecordGeneral['name'],\
-			\
-			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-			\
-			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-			\
-			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-			
-			
-		appendJAMF_Computers_Info = eval(appendDataToCVS_JAMF_Computers_Info)
-		appendComputerColumns = appendJAMF_Computers_Info
-		
-		#Set Columns	
-		Combined = MergeComputersInfo(appendComputerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-		
-		#Set CSV File
-		dataToCsvComputers.append(Combined)	
-		
+
+
+##########################################################################################
+# Functions
+##########################################################################################
+#Check for Yes or no answer from input
+def getYesOrNoInput(prompt):
+	while True:
+		try:
+			value = input(prompt)
+		except ValueError:
+			print("\nSorry, I didn't understand that.")
+			continue
 		
-		if get_JAMF_Computers_Info_Hardware == ("yes"):
-			##########################################################################################		
-			# Get info for Hardware	
-			##########################################################################################
-			# Get info for Policies
-			print(".......Getting Hardware Info for Computer ID: " + getMycomputerRecordGeneralID)
-			
-			formatMyComputerRecordHardwareOSBuild = f"\"{mycomputerRecordHardware['os_build']}\""
-			
-			appendDataToCVS_JAMF_Computers_Hardware_Info = "{'Type':'Computer Hardware Info',\
-			\
-			'Computer ID':mycomputerRecordGeneralID,\
-			\
-			'Computer Name':mycomputerRecordGeneral['name'],\
-			\
-			'Computer Make':mycomputerRecordHardware['make'],\
-			\
-			'Computer Model':mycomputerRecordHardware['model'],\
-			\
-			'Computer Model Identifier':mycomputerRecordHardware['model_identifier'],\
-			\
-			'Computer OS Name':mycomputerRecordHardware['os_name'],\
-			\
-			'Computer OS Version':str(mycomputerRecordHardware['os_version']),\
-			\
-			'Computer OS Build':formatMyComputerRecordHardwareOSBuild}"	
-			
-			appendJAMF_Computers_Hardware_Info = eval(appendDataToCVS_JAMF_Computers_Hardware_Info)
-			appendComputerHardwareColumns = appendJAMF_Computers_Hardware_Info
-			
-			#Set Columns	
-			Combined = MergeComputersInfo(computerColumns, appendComputerHardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-			
-			#Set CSV File
-			dataToCsvComputers.append(Combined)	
-			
-			
-		if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
-			##########################################################################################		
-			# Get info for FileVautl2	
-			##########################################################################################
-			print(".......Getting FileVault Info for Computer ID: " + getMycomputerRecordGeneralID)
+		if value.lower() != 'yes' and value.lower() != 'no':
+			print("\nSorry, your response must be yes or no only.")
+			continue
+		else:
+			break
+	return value
+
+
+#Merge Dictionaries
+def MergeComputersInfo(dict1, dict2, dict3, dict4, dict5, dict6):
+	result = dict1 | dict2 | dict3 | dict4 | dict5 | dict6
+	return result
+
+
+def MergePolicyInfo(dict1, dict2, dict3, dict4, dict5, dict6):
+	result = dict1 | dict2 | dict3 | dict4 | dict5 | dict6
+	return result
+
+
+def MergeConfigProfileInfo(dict1, dict2, dict3):
+	result = dict1 | dict2 | dict3
+	return result
+
+
+#Check User Input for URL, Username, and Password
+def JAMFInfoCheck(url, username, password):
+	try:
+		response = http.post(url, headers=headers, auth = HTTPBasicAuth(username, password))
+		if response.status_code == 200:
+			return print(f"\nUser Input is OK, we can connect to JAMF API, Moving on.\n\n")
+		else:
+			raise SystemExit(f"\nUser Input is NOT OK, we cannot connect to JAMF API and now will EXIT! status_code: {response.status_code}\n\n")
 			
-			for FileVault2User in mycomputerRecordHardwareFileVault2Users :
-				
-				appendDataToCVS_JAMF_Computers_FileVault2_Info = "{'Type':'Computer Hardware FileVault2 Info',\
-				\
-				'Computer ID':mycomputerRecordGeneralID,\
-				\
-				'Computer Name':mycomputerRecordGeneral['name'],\
-				\
-				'Computer FileVault2 User':FileVault2User}"
-				
-				appendJAMF_Computers_FileVault2_Info = eval(appendDataToCVS_JAMF_Computers_FileVault2_Info)
-				appendComputerFileVault2Columns = appendJAMF_Computers_FileVault2_Info
-				
-				#Set Columns	
-				Combined = MergeComputersInfo(computerColumns, hardwareColumns, appendComputerFileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-				
-				#Set CSV File
-				dataToCsvComputers.append(Combined)	
-				
-				
-		if get_JAMF_Computers_Info_Local_Account == ("yes"):
-			##########################################################################################		
-			# Get info for Local Accounts	
-			##########################################################################################
-			print(".......Getting Local Account Info for Computer ID: " + getMycomputerRecordGeneralID)
+	#Exception
+	except requests.exceptions.RequestException as e:
+		# print URL with Erors
+		raise SystemExit(f"\nUser Input is NOT OK, we cannot connect to JAMF API and now will EXIT! \n\nErr: {e}")
+
+
+# let user choose Options from list
+def let_user_pick(label, options):
+	print(label+"\n")
+	
+	for index, element in enumerate(options):
+		print("{}) {}".format(index + 1, element))
+		
+	while True:
+		try:
+			i = input("\nEnter number: ")
 			
-			for computerLocalAccount in mycomputerRecordHardwareLocalAccounts:
-				
-				# Put current data into variable to filter
-				filterComputerLocalAccountData = computerLocalAccount['name']
-				
-				# Regex Pattern
-				filterPattern = r"^((?![_/][a-zA-Z]*))"
-				filterDefaultUserAccountsListdata = filterDefaultUserAccountsList
-				
-				if re.match(filterPattern, filterComputerLocalAccountData): #Check if regex is correct
-				
-					if filterComputerLocalAccountData not in filterDefaultUserAccountsListdata :
-						
-						verifyLocalAccountIsAdmin = computerLocalAccount['administrator']
-						computerLocalAccountName = computerLocalAccount['name']
-						computerLocalAccountRealName = computerLocalAccount['realname']
-						
-						#Set Variables if Data Available
-						if len(str(computerLocalAccount['uid'])) == 0:
-							computerLocalAccountUID = ''
-						else:
-							computerLocalAccountUID = int(computerLocalAccount['uid'])
-							
-						computerLocalAccountIsAdmin = verifyLocalAccountIsAdmin
-						computerInInLDAP = "false"
-						
-						if includeLocalAccountInfoLDAP == "yes":
-							
-							# Set up url for getting information from each configurationProfile ID from JAMF API
-							url = JAMF_url + JIMServerLDAPLookupURL + "/user/" + filterComputerLocalAccountData
-							
-							try:
-								response = http.get(url, headers=btHeaders)
-								
-								response.raise_for_status()
-								
-								verifyLocalAccount = response.json()
-								
-							except HTTPError as http_err:
-								# Process HTTP Error
-								check_http_err = str(http_err)
-								split_My_http_err = check_http_err.split()
-								
-								myHttpError = split_My_http_err[0]
-								myMissingRecordID = filterComputerLocalAccountData
-								myMissingRecordURL = split_My_http_err[5]
-								
-								if myHttpError == '404':
-									print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-									
-								else:
-									print(f'HTTP error occurred: {http_err}')
-									
-								continue
-							except Exception as err:
-								print(f'Other error occurred: {err}')
-								continue
-								
-								
-							# For Testing
-							#print(verifyLocalAccount)
-								
-							verifidLocalAccountRecords = verifyLocalAccount['ldap_users']
-							verifidLocalAccountRecords.sort(key=lambda item: item.get('id'), reverse=False)
-							
-							for localAccountRecord in verifidLocalAccountRecords :
-								
-								#print(localAccountRecord['username'])
-								
-								#Set Variables if Data Available
-								if len(str(localAccountRecord['uid'])) == 0:
-									computerLocalAccountUID = ''
-								else:
-									computerLocalAccountUID = int(localAccountRecord['uid'])
-									
-									
-								computerInInLDAP = "true"
-								
-								
-						appendDataToCVS_JAMF_Computers_Local_Account_Info = "{'Type':'Computer Hardware Local Account Info',\
-						\
-						'Computer ID':mycomputerRecordGeneralID,\
-						\
-						'Computer Name':mycomputerRecordGeneral['name'],\
-						\
-						'Computer Local Account Name':computerLocalAccountName,\
-						\
-						'Computer Local Account Real Name':computerLocalAccountRealName,\
-						\
-						'Computer Local Account ID':computerLocalAccountUID,\
-						\
-						'Computer Local Account is Admin ':computerLocalAccountIsAdmin,\
-						\
-						'Computer Local Account in LDAP ':computerInInLDAP}"
-						
-						
-						appendJAMF_Computers_Local_Account_Info = eval(appendDataToCVS_JAMF_Computers_Local_Account_Info)
-						appendLocalAccountColumns = appendJAMF_Computers_Local_Account_Info
-						
-						#Set Columns	
-						Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, appendLocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-						
-						#Set CSV File
-						dataToCsvComputers.append(Combined)	
-						
-						
-		if get_JAMF_Computers_Info_Computer_Group_Membership == 'yes':
-			##########################################################################################		
-			# Get info for Computer Group Membership	
-			##########################################################################################
-			print(".......Getting Computer Group Info for Computer ID: " + getMycomputerRecordGeneralID)
+			try:
+				if 0 < int(i) <= len(options):
+					return int(i) - 1
+					break
 			
-			#Get Info from record
-			computerGroupMembershipRecords = mycomputerRecordComputerGroupMembership
+				else:
+					print("\nI didn't get a number in the list. Please try again with a number in the list.")
+					continue
 			
+			except ValueError:
+				print ("\nYou fail at typing numbers. Please try again with a NUMBER in the list")
+				continue
 			
-			list_of_groups = []
+			return None
+		
+		except:
+			print ("\nOops, Something went wrong.")
 			
-			for groupName in computerGroupMembershipRecords :
-				list_of_groups.append(f'{groupName}')
-				
-				
-			# Renew token because the report is a long process
-			# renew token
-			tokenURL = JAMF_url + "/api/v1/auth/keep-alive"
+		return None
+	
+	return None
+	
+# Check Input for Number only
+def checkInputForNumber(label):
+	
+	while True:
+		num = input(label+" ")
+		try:
+			val = int(num)
 			
-			token = http.post(tokenURL, headers=btHeaders)
+			print("\nSetting Smart Group ID to: "+num)
+			smartGroupID = num
+			break;
+		
+		except ValueError:
 			
-			bearer = token.json()['token']
+			try:
+				float(num)
+				print("Input is an float number.")
+				print("Input number is: ", val)
+				break;
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			except ValueError:
+				print("\nThis is not a number. Please enter a valid number\n")
+	
+	return num
+
+
+def checkFilePath(prompt):
+	while True:
+		try:
+			value = input(prompt)
+		except ValueError:
+			print("\nSorry, I didn't understand that.")
+			continue
+		
+		pathExist = os.path.exists(value)
+		
+		if pathExist != True :
+			print("\nFile does not Path Exists.")
+			continue
+		else:
+			break
+	return value  
+
+
+def checkFileName(prompt):
+	while True:
+		try:
+			value = input(prompt)
+		except ValueError:
+			print("\nSorry, I didn't understand that.")
+			continue
+		
+		if not value.endswith('.xlsx'):
+			print("\nFilename has the wrong extension for Excel.")
+			continue
+		else:
+			break
+	return value   
+
+
+def confirmExcelFileName(prompt):
+	while True:
+		try:
+			value = input(prompt)
+		except ValueError:
+			print("\nSorry, I didn't understand that.")
+			continue
+		
+		if value.lower() != 'yes' and value.lower() != 'no':
+			print("\nSorry, your response must be yes or no only.")
+			continue
+		elif value.lower() == 'no' :
+			raise SystemExit(f"\nUser DID NOT confirm the Excel File Name and now will EXIT!")
 			
+		elif value.lower() == 'yes':
+			break
+	return value
+
+
+# id, name and is_smart for every computer group by name, from the entity store list
+def getComputerGroupIndex():
+	return {computerGroup['name']: computerGroup for computerGroup in entityStore.getList('computergroups')}
+
+
+# id and name for every configuration profile by id, from the entity store list. The list
+# is only fetched once and shared by the Computers and Configuration Profile sections.
+def getConfigurationProfileIndex():
+	return {str(configurationProfile['id']): configurationProfile for configurationProfile in entityStore.getList('osxconfigurationprofiles')}
+
+
+# Fetch the same policy records with the requests / urllib3 thread pool the report used
+# to use, then with the fetch engine over HTTP/1.1 and over HTTP/2, and print the times.
+# Each client sends one untimed request first so DNS, TCP and TLS setup is not timed, and
+# the transports take turns going first over BENCHMARK_ROUNDS rounds so none of them
+# always pays for a cold server cache. The median round is printed for each.
+def runTransportBenchmark(url, headers):
+	print("\n******************** JAMF API Transport Benchmark ********************\n")
+	
+	response = fetchEngine.get(url + "/JSSResource/policies", headers=headers)
+	response.raise_for_status()
+	
+	policyURLs = [url + "/JSSResource/policies/id/" + str(policy['id']) for policy in response.json()['policies']][:BENCHMARK_RECORDS]
+	
+	print(f"Fetching {len(policyURLs)} policy records with each transport, {BENCHMARK_ROUNDS} rounds.\n")
+	
+	# requests / urllib3
+	requestsPool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+	
+	def fetchWithRequests(urls):
+		requestsHeaders = dict(headers)
+		requestsHeaders['Authorization'] = tokenManager.getAuthorization()
+		
+		list(requestsPool.map(lambda policyURL: http.get(policyURL, headers=requestsHeaders).content, urls))
+		
+	# Fetch engine
+	def fetchWithEngine(benchmarkEngine, urls):
+		benchmarkEngine.map(partial(benchmarkEngine.request, headers=headers), urls)
+		
+	transports = [('requests / urllib3 thread pool', fetchWithRequests, None)]
+	
+	for label, useHTTP2 in [('fetch engine HTTP/1.1', False), ('fetch engine HTTP/2', True)]:
+		if useHTTP2 and h2 is None:
+			print(f"{label}: skipped, needs the h2 Library (pip3 install h2)")
+			continue
+		
+		benchmarkEngine = FetchEngine(http2=useHTTP2)
+		benchmarkEngine.tokenManager = tokenManager
+		
+		transports.append((label, partial(fetchWithEngine, benchmarkEngine), benchmarkEngine))
+		
+	# Warm up, not timed
+	for label, fetch, benchmarkEngine in transports:
+		fetch(policyURLs[:1])
+		
+	roundTimes = {label: [] for label, fetch, benchmarkEngine in transports}
+	
+	for benchmarkRound in range(BENCHMARK_ROUNDS):
+		# Each round starts with the next transport
+		shift = benchmarkRound % len(transports)
+		
+		for label, fetch, benchmarkEngine in transports[shift:] + transports[:shift]:
+			startTime = time.monotonic()
+			fetch(policyURLs)
+			roundTimes[label].append(time.monotonic() - startTime)
 			
-			def get_clean_List(url, groups):
-				
-				myURL = (f"{url}/JSSResource/computergroups/name/{groups}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_groups.remove(groups)
-					
-				
-			def get_url(url, groups):
-				
-				print(f"..............Working on Computer Group: {groups}, for Computer ID: " + getMycomputerRecordGeneralID)
-				
-				myURL = (f"{url}/JSSResource/computergroups/name/{groups}")
-				
-				try:
-					
-					computerGroupMembershipNameResponse = http.get(myURL, headers=btHeaders)
-					
-					computerGroupMembershipNameResponse.raise_for_status()
-					
-					resp = computerGroupMembershipNameResponse.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = groups
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				#Set Variables if Data Available
-				if len(str(resp['computer_group']['id'])) == 0:
-					mygroupMembershipId = ''
-				else:
-					mygroupMembershipId = int(resp['computer_group']['id'])	
-					
-					
-				groupMembershipName = resp['computer_group']['name']
-				groupMembershipIsSmart = resp['computer_group']['is_smart']
-				
-				
-				return mygroupMembershipId, groupMembershipName, groupMembershipIsSmart
+	for label, fetch, benchmarkEngine in transports:
+		times = sorted(roundTimes[label])
+		
+		benchmarkResult = f"{label}: {times[len(times) // 2]:.2f} seconds median, {times[0]:.2f} best"
+		
+		if benchmarkEngine is not None:
+			benchmarkResult += f", {benchmarkEngine.connectionsOpened} connections, {', '.join(benchmarkEngine.httpVersions)}"
+			benchmarkEngine.close()
 			
+		print(benchmarkResult)
+		
+	requestsPool.shutdown()
+
+
+##########################################################################################
+# Get User Input
+##########################################################################################
+#Get User input if needed or use command line arguments
+
+# A replay uses the JAMF URL from the archive and does not log in
+if REPLAY_PATH:
+	
+	print(f"Replaying JAMF API responses for {responseArchive.jamfURL} from {REPLAY_PATH}, no login needed.\n")
+	get_JAMF_URL = responseArchive.jamfURL
+	get_JAMF_API_Username = ''
+	get_JAMF_API_Password = ''
+	
+else:
+	
+	print("******************** JAMF API Credentials ********************\n")
+
+	if APILoginURL == "" :
+	
+		get_JAMF_URL = input("Enter your JAMF Instance URL (https://yourjamf.jamfcloud.com): ")
+	
+	else:
+	
+		print("JAMF URL supplied in command line arguments.")
+		get_JAMF_URL = sys.argv[1]
+
+	
+	if APIUsername == "" :
+	
+		get_JAMF_API_Username = input("Enter your JAMF Instance API Username: ")
+	
+	else:
+	
+		print("JAMF API Username supplied in command line arguments.")
+		get_JAMF_API_Username = sys.argv[2]
+
+
+	if APIPassword == "" :
+	
+		get_JAMF_API_Password = getpass.getpass("Enter your JAMF Instance API Password: ")
+	
+	else:
+	
+		print("JAMF API Username supplied in command line arguments.")
+		get_JAMF_API_Password = sys.argv[3]
+
+
+
+	#Check User Input for URL, Username, and Password
+	#print (get_JAMF_URL+get_JAMF_URL_User_Test)
+	#print(get_JAMF_API_Username)
+	#print(get_JAMF_API_Password)
+
+	JAMFInfoCheck((get_JAMF_URL+get_JAMF_URL_User_Test), get_JAMF_API_Username, get_JAMF_API_Password)
+
+
+##########################################################################################
+# JAMF API Variables
+##########################################################################################
+JAMF_url = get_JAMF_URL
+username = get_JAMF_API_Username
+password = get_JAMF_API_Password
+
+# Cached responses are only shared by runs with the same Jamf URL and username
+if responseCache is not None:
+	responseCache.setAccount(JAMF_url, username)
+
+
+# Get Bearer token from JAMF API since we confirmed the Username and Password
+# The token manager keeps it fresh and the fetch engine adds it to every request
+if REPLAY_PATH:
+	tokenManager = None
+	
+else:
+	tokenManager = BearerTokenManager(JAMF_url, username, password)
+	fetchEngine.tokenManager = tokenManager
+
+
+# requests headers for token auth, Authorization is added by the fetch engine
+btHeaders = {
+	'Accept': 'application/json'
+}
+
+# Patch software title API sends back XML with a broken JSON header
+btBrokenXMLHeaders = {
+	"Accept": "application/xml, application/json",
+	"Content-Type": "application/xml"
+}
+
+# Lists and records shared by every report section for this run
+entityStore = RunEntityStore(JAMF_url, btHeaders)
+
+# What uses what, the Package and Script to Policies sheets are views over it
+usageGraph = UsageGraph()
+
+
+# Only run the transport benchmark if asked, it needs the network so not for a replay
+if TRANSPORT_BENCHMARK and not REPLAY_PATH:
+	runTransportBenchmark(JAMF_url, btHeaders)
+	
+	fetchEngine.close()
+	tokenManager.invalidate()
+	sys.exit()
+
+
+# Raw records of this run are kept for later runs
+if SNAPSHOTS_ENABLED:
+	snapshotStore = SnapshotStore(SNAPSHOT_PATH)
+	snapshotStore.beginRun(JAMF_url)
+	entityStore.snapshotStore = snapshotStore
+
+
+##########################################################################################
+# Get Report Config Input
+##########################################################################################
+# Get Main Groups Section.
+print("\n******************** JAMF API Excel File Info ********************\n")
+get_JAMF_Default_Path_Name = getYesOrNoInput("Do you want to use the Default filename and path for the Report (/Users/Shared/JAMF_Excel_Report_xx_xx_xxxx-xx:xx:xx.xlsx) ? (yes or no): ")
+
+if get_JAMF_Default_Path_Name == 'yes':
+	# Get Time
+	getFileNameTime = datetime.datetime.now()
+	fileNameTimeString = (getFileNameTime.strftime("%a_%b-%d-%Y_%H-%M-%S"))
+	
+	#Set filename with time and date
+	get_JAMF_FilePath_Info = '/Users/Shared/'
+	get_JAMF_FileName_Info = 'JAMF_Excel_Report_' + str(fileNameTimeString) + '.xlsx'
+	
+elif get_JAMF_Default_Path_Name == 'no':
+	
+	get_JAMF_Default_FilePath = getYesOrNoInput("Do you want to use the Default file path for the Report (/Users/Shared/) ? (yes or no): ")
+	
+	if get_JAMF_Default_FilePath == 'yes':
+		get_JAMF_FilePath_Info = '/Users/Shared/'
+		get_JAMF_FileName_Info = checkFileName("Please enter the name you want to save the excel file as. (ex. \"myExcelFile.xlsx\") : ")
+		
+	elif get_JAMF_Default_FilePath == 'no':
+		get_JAMF_FilePath_Info = checkFilePath("Please enter the full path where you want to save the file (ex. \"/Users/Shared/\") : ")
+		get_JAMF_FileName_Info = checkFileName("Please enter the name you want to save the excel file as. (ex. \"myExcelFile.xlsx\") : ")
+
+
+getDesplayExcelReportFile = get_JAMF_FilePath_Info+get_JAMF_FileName_Info
+
+desplayExcelReportFile = f"{getDesplayExcelReportFile}"
+
+confirmExcelReportFile = confirmExcelFileName("Please confirm that the filename, " + desplayExcelReportFile + " is correct. (yes or no)")
+
+if confirmExcelReportFile == 'yes':
+	excelReportFile = desplayExcelReportFile
+	print("\nSetting filename for JAMF Report to: "+excelReportFile+"\n")
+
+
+# Get Main Groups Section.
+print("\n\n******************** JAMF API Report Included Excel Sheets ********************\n")
+get_JAMF_Computers_Info = getYesOrNoInput("Do you want to include JAMF Computer Info Section in Report? (yes or no): ")
+get_JAMF_Policy_Info = getYesOrNoInput("Do you want to include JAMF Policy Info Section in Report? (yes or no): ")
+get_JAMF_Configuration_Profile_Info = getYesOrNoInput("Do you want to include JAMF Configuration Profile Info Section in Report? (yes or no): ")
+get_JAMF_Package_To_Policy_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy Info Section in Report? (yes or no): ")
+get_JAMF_Script_To_Policy_Info = getYesOrNoInput("Do you want to include JAMF Script To Policy Info Section in Report? (yes or no): ")
+get_JAMF_Computer_Scope_Info = getYesOrNoInput("Do you want to include JAMF Computer Scope Info Section in Report? (yes or no): ")
+
+
+##########################################################################################
+# Core Script
+##########################################################################################
+##################################################
+# Get Jamf Computer Info
+##################################################
+print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+
+if get_JAMF_Computers_Info == ("yes"):
+	
+	#Get Computer Info
+	print("\nIncluding JAMF Computer Info.\n\n")
+	includeComputerInfo = "yes"
+	
+	
+	#Get Smart Group ID if needed
+	print("\n******************** JAMF API Computer Info Results Filter Section. ********************\n")
+	print("\n\nPlease choose how you would like the results returned in your report. It is recommended to use a smart group id or computer id for this report for quickest results.\n")
+	print("\nPlease Note if you choose all computers the report may take some time to complete depending on the number of computers in your JAMF system.")
+	
+	# Set options for results filter for this section and question
+	myResultsFilterLabel = "Your results filter choices are:"
+	mymyResultsFilterOptions = ["Filter results for 1 Computer ID", "Filter results By Smart Group ID", "No Filter, Return All Computers"]
+	
+	# Get choice from user
+	get_JAMF_Computers_Info_Results_Filter = let_user_pick(myResultsFilterLabel, mymyResultsFilterOptions)
+	
+	get_JAMF_Computers_Info_Results_Filter_Choice = (mymyResultsFilterOptions[get_JAMF_Computers_Info_Results_Filter])
+	
+	#Return choice and set filter
+	if get_JAMF_Computers_Info_Results_Filter_Choice == 'Filter results for 1 Computer ID':
+		
+		print("\nUsing JAMF Computer ID to filter the Computer Report for 1 Computer Record.\n\n")
+		computerIDLabel = "Enter your JAMF Computer ID Number: "
+		get_JAMF_Computer_ID = checkInputForNumber(computerIDLabel)
+		print("\n")
+		JAMF_Computer_ID = get_JAMF_Computer_ID
+		usingFilter = "computerFilter"
 		
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_groups))
-				
-				
-			#print(list_of_groups)	
-				
-				
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_groups))
-			
-				#print(response_list)
-
-
-			# Renew token because the report is a long process
-			# renew token
-			tokenURL = JAMF_url + "/api/v1/auth/keep-alive"
-			
-			token = http.post(tokenURL, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			for response in response_list:
-				# Make sure to refresh variables for each loop
-				myComputerID = mycomputerRecordGeneralID
-				myComputerName = mycomputerRecordGeneral['name']
-				myGroupMemberID = response[0] 
-				myGroupMemberName = response[1] 
-				myGroupIsSmart = response[2]
-				
-				#print(f"My Group info: {response}")	
-				
-				appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Type':'Computer Group Membership Info',\
-				\
-				'Computer ID':myComputerID,\
-				\
-				'Computer Name':myComputerName,\
-				\
-				'Computer Group Membership Group ID':myGroupMemberID,\
-				\
-				'Computer Group Membership Group Name':myGroupMemberName,\
-				\
-				'Computer Group Membership Group Is Smart':myGroupIsSmart}"
-				
-				
-				appendJAMF_Computers_Info_Computer_Group_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
-				appendComputerGroupMembershipColumns = appendJAMF_Computers_Info_Computer_Group_Membership
-				
-				#Set Columns	
-				Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, appendComputerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-				
-				#Set CSV File
-				dataToCsvComputers.append(Combined)
-				
-				
-		if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == 'yes':
-			##########################################################################################		
-			# Get info for Computer Configuration Profile Membership	
-			##########################################################################################
-			print(".......Working on Configuration Profile Membership for Computer ID: " + getMycomputerRecordGeneralID)
-			
-			#Get Info from record
-			computerConfigurationProfileMembership = mycomputerConfigurationProfileMembership
-			
-			
-			list_of_config_profiles_ID = []
-			
-			for ConfigProfile in computerConfigurationProfileMembership :
-				if ConfigProfile['id'] > 0:
-					configurationProfileID = str(ConfigProfile['id'])
-					list_of_config_profiles_ID.append(f'{configurationProfileID}')
-					
-					
-			def get_clean_List(url, configProfiles):
-				
-				myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configProfiles}")
-				
-				test = http.get(myURL, headers=headers, auth = HTTPBasicAuth(username, password))
-				
-				if test.status_code != 200:
-					list_of_config_profiles_ID.remove(configProfiles)
-					
-					
-			def get_url(url, configProfiles):
-				
-				print(f"..............Working on Configuration Profile ID: {configProfiles}, for Computer ID: " + getMycomputerRecordGeneralID)
-				
-				myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configProfiles}")
-				
-				try:
-					
-					computerConfigurationProfileMembershipResponse = http.get(myURL, headers=headers, auth = HTTPBasicAuth(username, password))
-					
-					computerConfigurationProfileMembershipResponse.raise_for_status()
-					
-					resp = computerConfigurationProfileMembershipResponse.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = configProfiles
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				#General Element for ID and Catagory
-				myConfigurationProfileGeneral = resp['os_x_configuration_profile']['general']
-				myConfigurationProfileGeneralID = myConfigurationProfileGeneral['id']
-				myConfigurationProfileGeneralName = myConfigurationProfileGeneral['name']
-				
-				
-				return myConfigurationProfileGeneralID, myConfigurationProfileGeneralName
-			
-			
-			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_config_profiles_ID))
-				
-				
-			#print(list_of_config_profiles_ID)	
-				
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_config_profiles_ID))
-				
-			#print(response_list)
-				
-				
-			for response in response_list:
-				# Make sure to refresh variables for each loop
-				myComputerID = mycomputerRecordGeneralID
-				myComputerName = mycomputerRecordGeneral['name']
-				myConfigProfileID = response[0] 
-				myConfigProfileName = response[1] 
-			
-				#print(f"My Group info: {response}")
-			
-				appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Type':'Computer Configuration Profile Membership Info',\
-				\
-				'Computer ID':myComputerID,\
-				\
-				'Computer Name':myComputerName,\
-				\
-				'Computer Configuration Profile Membership ID':myConfigProfileID,\
-				\
-				'Computer Configuration Profile Membership Name':myConfigProfileName}"
-				
-				
-				appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
-				appendComputerConfigurationProfileMembershipColumns = appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership
-				
-				#Set Columns	
-				Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, appendComputerConfigurationProfileMembershipColumns)
-				
-				#Set CSV File
-				dataToCsvComputers.append(Combined)
-			
 		
-	else:		
+	elif get_JAMF_Computers_Info_Results_Filter_Choice == 'Filter results By Smart Group ID':
 		
-		#Run for smart group on no filter
-		for computerRecord in computerRecords:
-			
-			# Get ID to do JAMF API lookup
-			computerRecordID = str(computerRecord['id'])
-			
-			#For Testing
-			#print(computerRecordID)
-			
-			# Set up url for getting information from each configurationProfile ID from JAMF API
-			url = JAMF_url + "/JSSResource/computers/id/" + computerRecordID
-			
-			try:
-				response = http.get(url, headers=btHeaders)
-				
-				response.raise_for_status()
-				
-				computerRecordProfile = response.json()
-				
-			except HTTPError as http_err:
-				print(f'HTTP error occurred: {http_err}')
-			except Exception as err:
-				print(f'Other error occurred: {err}')
-				
-			
-			# For Testing
-			#print(computerRecordProfile)
-			
-			#General Element for ID and Catagory
-			mycomputerRecordGeneral = computerRecordProfile['computer']['general']
-			mycomputerRecordHardware = computerRecordProfile['computer']['hardware']
-			mycomputerRecordHardwareFileVault2Users = computerRecordProfile['computer']['hardware']['filevault2_users']
-			mycomputerRecordHardwareLocalAccounts = computerRecordProfile['computer']['groups_accounts']['local_accounts']
-			mycomputerRecordComputerGroupMembership = computerRecordProfile['computer']['groups_accounts']['computer_group_memberships']
-			mycomputerConfigurationProfileMembership = computerRecordProfile['computer']['configuration_profiles']
-			
-			
-			##########################################################################################
-			# Process ConfigurationProfile information for csv / Excel
-			##########################################################################################
-			# Individual Computers Info for each record
-			getMycomputerRecordGeneralID = (str(mycomputerRecordGeneral['id']) + " - " + mycomputerRecordGeneral['name'])
-			
-			# Get info for Policies
-			print("Working on Computer ID: " + getMycomputerRecordGeneralID)
-			
-			#Set Variables if Data Available
-			if len(str(mycomputerRecordGeneral['id'])) == 0:
-				mycomputerRecordGeneralID = ''
-			else:
-				mycomputerRecordGeneralID = int(mycomputerRecordGeneral['id'])
-				
+		print("\nUsing JAMF Smart Group to filter the Computer Report for 1 Computer Smart Group.\n\n")
+		smartGroupIDLabel = "Enter your JAMF SmartGroup ID Number: "
+		get_JAMF_SmartGroup_ID = checkInputForNumber(smartGroupIDLabel)
+		print("\n")
+		JAMF_SmartGroup_ID = get_JAMF_SmartGroup_ID
+		usingFilter = "smartGroupFilter"
 		
-			# Set Variables for Dict for Computers Info
-			if usingFilter == 'computerFilter':
-				
-				appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
-				\
-				'Computer ID':mycomputerRecordGeneralID,\
-				\
-				'Computer Name':mycomputerRecordGeneral['name'],\
-				\
-				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-				\
-				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-				\
-				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-				
-			elif usingFilter == 'smartGroupFilter':
-				
-				appendDataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':smartGroupRecordID,\
-				\
-				'Computer SmartGroup Name':smartGroupRecordName,\
-				\
-				'Type':'Computer Info',\
-				\
-				'Computer ID':mycomputerRecordGeneralID,\
-				\
-				'Computer Name':mycomputerRecordGeneral['name'],\
-				\
-				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-				\
-				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-				\
-				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-				
-			elif usingFilter == 'noFilter':
-				
-				appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
-				\
-				'Computer ID':mycomputerRecordGeneralID,\
-				\
-				'Computer Name':mycomputerRecordGeneral['name'],\
-				\
-				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
-				\
-				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
-				\
-				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
-				
-				
-			appendJAMF_Computers_Info = eval(appendDataToCVS_JAMF_Computers_Info)
-			appendComputerColumns = appendJAMF_Computers_Info
+		
+	elif get_JAMF_Computers_Info_Results_Filter_Choice == 'No Filter, Return All Computers':
+		
+		print("\nNot using JAMF Results Filter for the Computer Report.\n\n")
+		usingFilter = "noFilter"
+	
+	
+	#Get hardware Elements
+	print("\n******************** JAMF API Computer Info Hardware Section. ********************\n")
+	get_JAMF_Computers_Info_Hardware = getYesOrNoInput("Do you want to include JAMF Computer Hardware Info in Report? (yes or no): ")
+	if get_JAMF_Computers_Info_Hardware == ("yes"):
+		
+		print("\nIncluding Computer Hardware Data.\n\n")		
+		includeHardwareInfo = "yes"
+		
+	elif get_JAMF_Computers_Info_Hardware == ("no"):
+		
+		print("\nNot Including Computer Hardware Data.\n\n")		
+		includeHardwareInfo = "no"
+		
+		
+	#Get FileVault2 Users
+	print("\n******************** JAMF API Computer Info FileVault2 Section. ********************\n")
+	get_JAMF_Computers_Info_FileVault2_Users = getYesOrNoInput("Do you want to include JAMF Computer Hardware FileVault Users Info in Report? (yes or no): ")
+	if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
+		
+		print("\nIncluding FileVault2 Info Data.\n\n")		
+		includeFileVault2Info = "yes"
+		
+	elif get_JAMF_Computers_Info_FileVault2_Users == ("no"):
+		
+		print("\nNot including FileVault2 Info Data.\n\n")
+		includeFileVault2Info = "no"
+
+	
+	#Get Local Users Accounts
+	print("\n******************** JAMF API Computer Info Local Account Section. ********************\n")
+	get_JAMF_Computers_Info_Local_Account = getYesOrNoInput("Do you want to include JAMF Computer Hardware Local Account Info in Report? (yes or no): ")
+	if get_JAMF_Computers_Info_Local_Account == ("yes"):
+		
+		print("\nIncluding Local Account Info Data.\n\n")
+		includeLocalAccountInfo = "yes"
+		
+		print("\n******************** JAMF API Computer Info Local Account LDAP Section. ********************\n")
+		get_JAMF_Computers_Info_Local_Account_LDAP = getYesOrNoInput("Do you want to include JAMF Computer Hardware Local Accounts LDAP Verification in Report? (yes or no): ")
+		
+		if get_JAMF_Computers_Info_Local_Account_LDAP == ("yes"):
 			
-			#Set Columns	
-			Combined = MergeComputersInfo(appendComputerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+			print("\nIncluding Local Account Info LDAP Verification Data.\n\n")
+			includeLocalAccountInfoLDAP = "yes"
 			
-			#Set CSV File
-			dataToCsvComputers.append(Combined)	
+			# Lookup JIM Server Name
+			url = JAMF_url + "/JSSResource/ldapservers"
 			
+			try:
+				response = fetchEngine.get(url, headers=btHeaders)
 			
-			if get_JAMF_Computers_Info_Hardware == ("yes"):
-				##########################################################################################		
-				# Get info for Hardware	
-				##########################################################################################
-				formatMyComputerRecordHardwareOSBuild = f"\"{mycomputerRecordHardware['os_build']}\""
-				
-				appendDataToCVS_JAMF_Computers_Hardware_Info = "{'Type':'Computer Hardware Info',\
-				\
-				'Computer ID':mycomputerRecordGeneralID,\
-				\
-				'Computer Name':mycomputerRecordGeneral['name'],\
-				\
-				'Computer Make':mycomputerRecordHardware['make'],\
-				\
-				'Computer Model':mycomputerRecordHardware['model'],\
-				\
-				'Computer Model Identifier':mycomputerRecordHardware['model_identifier'],\
-				\
-				'Computer OS Name':mycomputerRecordHardware['os_name'],\
-				\
-				'Computer OS Version':str(mycomputerRecordHardware['os_version']),\
-				\
-				'Computer OS Build':formatMyComputerRecordHardwareOSBuild}"	
-				
-				appendJAMF_Computers_Hardware_Info = eval(appendDataToCVS_JAMF_Computers_Hardware_Info)
-				appendComputerHardwareColumns = appendJAMF_Computers_Hardware_Info
-				
-				#Set Columns	
-				Combined = MergeComputersInfo(computerColumns, appendComputerHardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+				response.raise_for_status()
+
+				resp = response.json()
 				
-				#Set CSV File
-				dataToCsvComputers.append(Combined)	
-					
-			
-			if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
-				##########################################################################################		
-				# Get info for FileVautl2	
-				##########################################################################################
-				for FileVault2User in mycomputerRecordHardwareFileVault2Users :
-					
-					appendDataToCVS_JAMF_Computers_FileVault2_Info = "{'Type':'Computer Hardware FileVault2 Info',\
-					\
-					'Computer ID':mycomputerRecordGeneralID,\
-					\
-					'Computer Name':mycomputerRecordGeneral['name'],\
-					\
-					'Computer FileVault2 User':FileVault2User}"
-					
-					appendJAMF_Computers_FileVault2_Info = eval(appendDataToCVS_JAMF_Computers_FileVault2_Info)
-					appendComputerFileVault2Columns = appendJAMF_Computers_FileVault2_Info
-					
-					#Set Columns	
-					Combined = MergeComputersInfo(computerColumns, hardwareColumns, appendComputerFileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-					
-					#Set CSV File
-					dataToCsvComputers.append(Combined)	
+			except HTTPError as http_err:
+				print(f'HTTP error occurred: {http_err}')
+			except Exception as err:
+				print(f'Other error occurred: {err}')	
 			
+			#For Testing
+			#print(resp)
+			
+			JIMServerRecords = resp['ldap_servers']
+			JIMServerRecords.sort(key=lambda item: item.get('id'), reverse=False)
+			
+			
+			for JIMServer in JIMServerRecords:
 				
-			if get_JAMF_Computers_Info_Local_Account == ("yes"):
-				##########################################################################################		
-				# Get info for Local Accounts	
-				##########################################################################################
-				for computerLocalAccount in mycomputerRecordHardwareLocalAccounts:
-					
-					# Put current data into variable to filter
-					filterComputerLocalAccountData = computerLocalAccount['name']
-					
-					# Regex Pattern
-					filterPattern = r"^((?![_/][a-zA-Z]*))"
-					filterDefaultUserAccountsListdata = filterDefaultUserAccountsList
-					
-					if re.match(filterPattern, filterComputerLocalAccountData): #Check if regex is correct
-					
-						if filterComputerLocalAccountData not in filterDefaultUserAccountsListdata :
-							
-							verifyLocalAccountIsAdmin = computerLocalAccount['administrator']
-							computerLocalAccountName = computerLocalAccount['name']
-							computerLocalAccountRealName = computerLocalAccount['realname']
-							
-							#Set Variables if Data Available
-							if len(str(computerLocalAccount['uid'])) == 0:
-								computerLocalAccountUID = ''
-							else:
-								computerLocalAccountUID = int(computerLocalAccount['uid'])
-								
-							computerLocalAccountIsAdmin = verifyLocalAccountIsAdmin
-							computerInInLDAP = "false"
-							
-							if includeLocalAccountInfoLDAP == "yes":
-								
-								# Set up url for getting information from each configurationProfile ID from JAMF API
-								url = JAMF_url + JIMServerLDAPLookupURL + "/user/" + filterComputerLocalAccountData
-								
-								try:
-									response = http.get(url, headers=btHeaders)
-									
-									response.raise_for_status()
-									
-									verifyLocalAccount = response.json()
-									
-								except HTTPError as http_err:
-									# Process HTTP Error
-									check_http_err = str(http_err)
-									split_My_http_err = check_http_err.split()
-									
-									myHttpError = split_My_http_err[0]
-									myMissingRecordID = filterComputerLocalAccountData
-									myMissingRecordURL = split_My_http_err[5]
-									
-									if myHttpError == '404':
-										print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-										
-									else:
-										print(f'HTTP error occurred: {http_err}')
-										
-									continue
-								except Exception as err:
-									print(f'Other error occurred: {err}')
-									continue
-									
-								
-								# For Testing
-								#print(verifyLocalAccount)
-								
-								verifidLocalAccountRecords = verifyLocalAccount['ldap_users']
-								#verifidLocalAccountRecords.sort(key=lambda item: item.get('id'), reverse=False)
-								
-								for localAccountRecord in verifidLocalAccountRecords :
-									
-									#print(localAccountRecord['username'])
-									
-									#Set Variables if Data Available
-									if len(str(localAccountRecord['uid'])) == 0:
-										computerLocalAccountUID = ''
-									else:
-										computerLocalAccountUID = int(localAccountRecord['uid'])
-										
-									
-									computerInInLDAP = "true"
-									
-						
-							appendDataToCVS_JAMF_Computers_Local_Account_Info = "{'Type':'Computer Hardware Local Account Info',\
-							\
-							'Computer ID':mycomputerRecordGeneralID,\
-							\
-							'Computer Name':mycomputerRecordGeneral['name'],\
-							\
-							'Computer Local Account Name':computerLocalAccountName,\
-							\
-							'Computer Local Account Real Name':computerLocalAccountRealName,\
-							\
-							'Computer Local Account ID':computerLocalAccountUID,\
-							\
-							'Computer Local Account is Admin ':computerLocalAccountIsAdmin,\
-							\
-							'Computer Local Account in LDAP ':computerInInLDAP}"
-						
-							
-							appendJAMF_Computers_Local_Account_Info = eval(appendDataToCVS_JAMF_Computers_Local_Account_Info)
-							appendLocalAccountColumns = appendJAMF_Computers_Local_Account_Info
-						
-							#Set Columns	
-							Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, appendLocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-						
-							#Set CSV File
-							dataToCsvComputers.append(Combined)	
-							
-							
-			if get_JAMF_Computers_Info_Computer_Group_Membership == 'yes':
-				##########################################################################################		
-				# Get info for Computer Group Membership	
-				##########################################################################################
-				print(".......Getting Computer Group Info for Computer ID: " + getMycomputerRecordGeneralID)
-				
-				#Get Info from record
-				computerGroupMembershipRecords = mycomputerRecordComputerGroupMembership
-				
-				
-				list_of_groups = []
-				
-				for groupName in computerGroupMembershipRecords :
-					list_of_groups.append(f'{groupName}')
-					
-					
-				# Renew token because the report is a long process
-				# renew token
-				tokenURL = JAMF_url + "/api/v1/auth/keep-alive"
-				
-				token = http.post(tokenURL, headers=btHeaders)
-				
-				bearer = token.json()['token']
-				
-				btHeaders = {
-					'Accept': 'application/json',
-					'Authorization': 'Bearer '+bearer
-				}
-				
-				
-				def get_clean_List(url, groups):
-					
-					myURL = (f"{url}/JSSResource/computergroups/name/{groups}")
-					
-					test = http.get(myURL, headers=btHeaders)
-					
-					if test.status_code != 200:
-						list_of_groups.remove(groups)
-						
-						
-				def get_url(url, groups):
-					
-					print(f"..............Working on Computer Group: {groups}, for Computer ID: " + getMycomputerRecordGeneralID)
-					
-					myURL = (f"{url}/JSSResource/computergroups/name/{groups}")
-					
-					try:
-						
-						computerGroupMembershipNameResponse = http.get(myURL, headers=btHeaders)
-						
-						computerGroupMembershipNameResponse.raise_for_status()
-						
-						resp = computerGroupMembershipNameResponse.json()
-						
-					except HTTPError as http_err:
-						
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = groups
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						
-						
-					#Set Variables if Data Available
-					if len(str(resp['computer_group']['id'])) == 0:
-						mygroupMembershipId = ''
-					else:
-						mygroupMembershipId = int(resp['computer_group']['id'])	
-						
-						
-					groupMembershipName = resp['computer_group']['name']
-					groupMembershipIsSmart = resp['computer_group']['is_smart']
-					
-					
-					return mygroupMembershipId, groupMembershipName, groupMembershipIsSmart
-				
-				
-				# Clean List
-				with ThreadPoolExecutor(max_workers=100) as pool:
-					get_data = partial(get_clean_List, JAMF_url)
-					list(pool.map(get_data,list_of_groups))
-					
-					
-				#print(list_of_groups)	
-					
-					
-				# Process List	
-				with ThreadPoolExecutor(max_workers=100) as pool:
-					get_data = partial(get_url, JAMF_url)
-					response_list = list(pool.map(get_data,list_of_groups))
-					
-					#print(response_list)
-					
-					
-				# Renew token because the report is a long process
-				# renew token
-				tokenURL = JAMF_url + "/api/v1/auth/keep-alive"
-				
-				token = http.post(tokenURL, headers=btHeaders)
-				
-				bearer = token.json()['token']
-				
-				btHeaders = {
-					'Accept': 'application/json',
-					'Authorization': 'Bearer '+bearer
-				}
-				
-				
-				for response in response_list:
-					# Make sure to refresh variables for each loop
-					myComputerID = mycomputerRecordGeneralID
-					myComputerName = mycomputerRecordGeneral['name']
-					myGroupMemberID = response[0] 
-					myGroupMemberName = response[1] 
-					myGroupIsSmart = response[2]
-					
-					#print(f"My Group info: {response}")	
-					
-					appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Type':'Computer Group Membership Info',\
-					\
-					'Computer ID':myComputerID,\
-					\
-					'Computer Name':myComputerName,\
-					\
-					'Computer Group Membership Group ID':myGroupMemberID,\
-					\
-					'Computer Group Membership Group Name':myGroupMemberName,\
-					\
-					'Computer Group Membership Group Is Smart':myGroupIsSmart}"
-					
-					
-					appendJAMF_Computers_Info_Computer_Group_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
-					appendComputerGroupMembershipColumns = appendJAMF_Computers_Info_Computer_Group_Membership
-					
-					#Set Columns	
-					Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, appendComputerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
-					
-					#Set CSV File
-					dataToCsvComputers.append(Combined)
-					
-					
-					
-			if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == 'yes':
-				##########################################################################################		
-				# Get info for Computer Configuration Profile Membership	
-				##########################################################################################
-				print(".......Working on Configuration Profile Membership for Computer ID: " + getMycomputerRecordGeneralID)
+				JIMServerRecordsName = JIMServer['name']
+				JIMServerList.append(JIMServerRecordsName)
 				
-				#Get Info from record
-				computerConfigurationProfileMembership = mycomputerConfigurationProfileMembership
+			JIMServerlabel = "Please choose the JIM Server you would like to use:"
+			
+			JimServerChoice = let_user_pick(JIMServerlabel, JIMServerList)
+			
+			JIMServerNameForURL = (JIMServerList[JimServerChoice])
+			
+			JIMServerLDAPLookupURL = "/JSSResource/ldapservers/name/" + JIMServerNameForURL
+			
+			
+		elif get_JAMF_Computers_Info_Local_Account_LDAP == ("no"):
+			
+			print("\nIncluding Local Account Info LDAP Verification Data.\n\n")
+			includeLocalAccountInfoLDAP = "no"
+			
+		
+	elif get_JAMF_Computers_Info_Local_Account == ("no"):
+		
+		print("\nNot including Local Account Info Data.\n\n")
+		includeLocalAccountInfo = "no"
+
+	
+	#Get Group Membership
+	print("\n******************** JAMF API Computer Info Computer Group Membership Section. ********************\n")
+	get_JAMF_Computers_Info_Computer_Group_Membership = getYesOrNoInput("Do you want to include JAMF Computer Hardware Computer Group Membership Info in Report? (yes or no): ")
+	if get_JAMF_Computers_Info_Computer_Group_Membership == ("yes"):
+		
+		print("\nIncluding Computer Group Membership Info Data.\n\n")		
+		includeComputerGroupMembershipInfo = "yes"
+		
+	elif get_JAMF_Computers_Info_Computer_Group_Membership == ("no"):
+		
+		print("\nNot including Computer Group Membership Info Data.\n\n")
+		includeComputerGroupMembershipInfo = "no"
+		
+		
+	#Get Config Profile Membership
+	print("\n******************** JAMF API Computer Info Computer Configuration Profile Membership Section. ********************\n")
+	get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = getYesOrNoInput("Do you want to include JAMF Computer Hardware Configuration Profile Membership Info in Report? (yes or no): ")
+	if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == ("yes"):
+		
+		print("\nIncluding Computer Configuration Profile Membership Info Data.\n\n")		
+		includeComputerConfigurationProfileMembershipInfo = "yes"
+		
+	elif get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == ("no"):
+		
+		print("\nNot including Computer Group Membership Info Data.\n\n")
+		includeComputerConfigurationProfileMembershipInfo = "no"
+
+
+elif get_JAMF_Computers_Info == ("no"):
+	
+	includeComputerInfo = "no"
+	usingFilter = "noFilter"
+	includeHardwareInfo = "no"
+	includeFileVault2Info = "no"
+	includeLocalAccountInfo = "no"
+	includeComputerGroupMembershipInfo = "no"
+	includeComputerConfigurationProfileMembershipInfo = "no"
+	
+
+##################################################
+# Get Jamf Policy Info
+##################################################
+print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+
+if get_JAMF_Policy_Info == ("yes"):
+	
+	#Get Policy Info
+	print("\nIncluding JAMF Policy Info.\n\n")
+	includePolicyInfo = "yes"
+	
+	
+	#Get Policy Self Service Elements
+	print("\n******************** JAMF API Policy Self Service Section. ********************\n")
+	get_JAMF_Policy_Info_SelfService = getYesOrNoInput("Do you want to include JAMF Policy Self Service Info in Report? (yes or no): ")
+	if get_JAMF_Policy_Info_SelfService == ("yes"):
+		
+		print("\nIncluding Self Service Data.\n\n")
+		
+		includeSelfServiceInfo = "yes"
+		
+	elif get_JAMF_Policy_Info_SelfService == ("no"):
+		
+		print("\nNot Including Self Service Data.\n\n")
+		
+		includeSelfServiceInfo = "no"
+		
+		
+	#Get Policy Targets
+	print("\n******************** JAMF API Policy Targets Section. ********************\n")
+	get_JAMF_Policy_Info_Targets = getYesOrNoInput("Do you want to include JAMF Policy Targets Info in Report? (yes or no): ")
+	if get_JAMF_Policy_Info_Targets == ("yes"):
+		
+		print("\nIncluding Target Data.\n\n")
+		
+		includeTargetsInfo = "yes"
+		
+	elif get_JAMF_Policy_Info_Targets == ("no"):
+		
+		print("\nNot Including Target Data.\n\n")
+		
+		includeTargetsInfo = "no"
+		
+		
+	#Get Policy Exclusions
+	print("\n******************** JAMF API Policy Exclusions Section. ********************\n")
+	get_JAMF_Policy_Info_Exclusions = getYesOrNoInput("Do you want to include JAMF Policy Exclusions Info in Report? (yes or no): ")
+	if get_JAMF_Policy_Info_Exclusions == ("yes"):
+		
+		print("\nIncluding Exclusions Data.\n\n")
+		
+		includeExclusionsInfo = "yes"
+		
+	elif get_JAMF_Policy_Info_Exclusions == ("no"):
+		
+		print("\nNot Including Exclusions Data.\n\n")
+		
+		includeExclusionsInfo = "no"
+		
+		
+	#Get Policy Package Elements
+	print("\n******************** JAMF API Policy Packages Section. ********************\n")
+	get_JAMF_Policy_Info_Packages = getYesOrNoInput("Do you want to include JAMF Policy Packages Info in Report? (yes or no): ")
+	if get_JAMF_Policy_Info_Packages == ("yes"):
+		
+		print("\nIncluding Package Data.\n\n")
+		
+		includePackagesInfo = "yes"
+		
+	elif get_JAMF_Policy_Info_Packages == ("no"):
+		
+		print("\nNot Including Package Data.\n\n")
+		
+		includePackagesInfo = "no"
+		
+		
+	#Get Policy Script Elements
+	print("\n******************** JAMF API Policy Scripts Section. ********************\n")
+	get_JAMF_Policy_Info_Scripts = getYesOrNoInput("Do you want to include JAMF Policy Scripts Info in Report? (yes or no): ")
+	if get_JAMF_Policy_Info_Scripts == ("yes"):
+		
+		print("\nIncluding Scripts Data.\n\n")
+		
+		includeScriptsInfo = "yes"
+		
+	elif get_JAMF_Policy_Info_Scripts == ("no"):
+		
+		print("\nNot Including Scripts Data.\n\n")
+		
+		includeScriptsInfo = "no"
+		
+		
+elif get_JAMF_Policy_Info == ("no"):
+	
+	includePolicyInfo = "no"
+	
+
+##################################################
+# Get Configuration Profile Info
+##################################################
+print("\n\n******************** JAMF API Report Included Excel Sheets Config Info ********************\n")
+
+if get_JAMF_Configuration_Profile_Info == ("yes"):
+	
+	#Get Configuration Profile Info
+	print("Including Configuration Profile Info.\n\n")
+	
+	includeConfigurationProfileInfo = "yes"
+	
+	#Get Policy Targets
+	print("\n******************** JAMF API Configuration Profile Targets Section. ********************\n")
+	get_JAMF_Configuration_Profile_Info_Targets = getYesOrNoInput("Do you want to include JAMF Configuration Profile Targets Info in Report? (yes or no): ")
+	if get_JAMF_Configuration_Profile_Info_Targets == ("yes"):
+		
+		print("\nIncluding Target Data.\n\n")
+		
+		includeConfigurationProfileTargetsInfo = "yes"
+		
+	elif get_JAMF_Configuration_Profile_Info_Targets == ("no"):
+		
+		print("\nNot Including Target Data.\n\n")
+		
+		includeConfigurationProfileTargetsInfo = "no"
+		
+		
+	#Get Policy Exclusions
+	print("\n******************** JAMF API Configuration Profile Exclusions Section. ********************\n")
+	get_JAMF_Configuration_Profile_Info_Exclusions = getYesOrNoInput("Do you want to include JAMF Configuration Profile Exclusions Info in Report? (yes or no): ")
+	if get_JAMF_Configuration_Profile_Info_Exclusions == ("yes"):
+		
+		print("\nIncluding Exclusions Data.\n\n")
+		
+		includeConfigurationProfileExclusionsInfo = "yes"
+		
+	elif get_JAMF_Configuration_Profile_Info_Exclusions == ("no"):
+		
+		print("\nNot Including Exclusions Data.\n\n")
+		
+		includeConfigurationProfileExclusionsInfo = "no"
+		
+		
+elif get_JAMF_Configuration_Profile_Info == ("no"):
+	
+	includeConfigurationProfileInfo = "no"
+	
+
+##################################################
+# Get Jamf Package To Policy Info
+##################################################
+print("\n\n******************** JAMF API Report Included Package To Policy Info ********************\n")
+
+if get_JAMF_Package_To_Policy_Info == ("yes"):
+	
+	#Get Package To Policy Info
+	print("\nIncluding JAMF Regular Package Info.\n\n")
+	
+	includeRegularPackageToPolicyInfo = "yes"
+	
+	#Get Policy Exclusions
+	print("\n******************** JAMF API Package To Policy in PreStage Policy Section. ********************\n")
+	get_JAMF_Policy_in_PreStage_Policy_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy in PreStage Policy Info in Report? (yes or no): ")
+	if get_JAMF_Policy_in_PreStage_Policy_Info == ("yes"):
+		
+		print("\nIncluding PreStage Policy Info.\n\n")
+		
+		includePreStagePackageToPolicyInfo = "yes"
+		
+	elif get_JAMF_Policy_in_PreStage_Policy_Info == ("no"):
+		
+		print("\nNot Including PreStage Policy Info.\n\n")
+		
+		includePreStagePackageToPolicyInfo = "no"
+		
+		
+	print("\n******************** JAMF API Package To Policy in Patch Management Section. ********************\n")
+	get_JAMF_Policy_in_Patch_Management_Info = getYesOrNoInput("Do you want to include JAMF Package To Policy in Patch Management Info in Report? (yes or no): ")
+	if get_JAMF_Policy_in_Patch_Management_Info == ("yes"):
+		
+		print("\nIncluding Patch Management Info.\n\n")
+		
+		includePatchManagementPackageToPolicyInfo = "yes"
+		
+	elif get_JAMF_Policy_in_Patch_Management_Info == ("no"):
+		
+		print("\nNot Including Patch Management Info.\n\n")
+		
+		includePatchManagementPackageToPolicyInfo = "no"
+		
+		
+##################################################
+# Get Jamf Script To Policy Info
+##################################################
+print("\n\n******************** JAMF API Report Included Script To Policy Info ********************\n")
+
+if get_JAMF_Script_To_Policy_Info == ("yes"):
+	
+	#Get Script To Policy Info
+	print("\nIncluding JAMF Regular Script Info.\n\n")
+	
+	includeRegularScriptToPolicyInfo = "yes"
+
+
+##################################################
+# Get Jamf Computer Scope Info
+##################################################
+print("\n\n******************** JAMF API Report Included Computer Scope Info ********************\n")
+
+if get_JAMF_Computer_Scope_Info == ("yes"):
+	
+	#Get Computer Scope Info
+	print("\nIncluding JAMF Computer Scope Info.\n\n")
+
 				
+##################################################
+# Set Variables for dict
+##################################################
+#Check Options set and desplay message to user
+if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF_Configuration_Profile_Info == 'yes' or get_JAMF_Package_To_Policy_Info == 'yes' or get_JAMF_Script_To_Policy_Info == 'yes' or get_JAMF_Computer_Scope_Info == 'yes':
+	
+	print("\n******************** Running Requested Report Now. ********************\n\n")
+	
+
+	##################################################
+	# Set Variables for Dict for Computers Info
+	##################################################
+	if usingFilter == 'computerFilter':
+		
+		dataToCVS_JAMF_Computers_Info = "{'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+	elif usingFilter == 'smartGroupFilter':
+		
+		dataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':'',\
+		\
+		'Computer SmartGroup Name':'',\
+		\
+		'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+	elif usingFilter == 'noFilter':
+		
+		dataToCVS_JAMF_Computers_Info = "{'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+	
+	dataToCVS_JAMF_Computers_Hardware_Info = "{'Computer Make':'',\
+	\
+	'Computer Model':'',\
+	\
+	'Computer Model Identifier':'',\
+	\
+	'Computer OS Name':'',\
+	\
+	'Computer OS Version':'',\
+	\
+	'Computer OS Build':''}"	
+	
+	
+	dataToCVS_JAMF_Computers_FileVault2_Info = "{'Computer FileVault2 User':''}"
+	
+	
+	dataToCVS_JAMF_Computers_Local_Account_Info = "{'Computer Local Account Name':'',\
+	\
+	'Computer Local Account Real Name':'',\
+	\
+	'Computer Local Account ID':'',\
+	\
+	'Computer Local Account is Admin ':'',\
+	\
+	'Computer Local Account in LDAP ':''}"	
+
+	
+	dataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Computer Group Membership Group ID':'',\
+	\
+	'Computer Group Membership Group Name':'',\
+	\
+	'Computer Group Membership Group Is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Computer Configuration Profile Membership ID':'',\
+	\
+	'Computer Configuration Profile Membership Name':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Policy Info
+	##################################################
+	dataToCVS_JAMF_Policy_Info = "{'Type':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':'',\
+	\
+	'Policy Category ID':'',\
+	\
+	'Policy Category Name':''}"
+	
+	
+	dataToCVS_JAMF_Policy_SelfService_Info = "{'Policy In SelfService':'',\
+	\
+	'Policy In SelfService Name':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Target_Info = "{'Policy Target All Computers':'',\
+	\
+	'Policy Target Computer ID':'',\
+	\
+	'Policy Target Computer Name':'',\
+	\
+	'Policy Target Group ID':'',\
+	\
+	'Policy Target Group Name':'',\
+	\
+	'Policy Target Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Exclusion_Info = "{'Policy Exclusion Computer ID':'',\
+	\
+	'Policy Exclusion Computer Name':'',\
+	\
+	'Policy Exclusion Group id':'',\
+	\
+	'Policy Exclusion Group Name':'',\
+	\
+	'Policy Exclusion Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Packages_Info = "{'Policy Package ID':'',\
+	\
+	'Policy Package Name':'',\
+	\
+	'Policy Package Category Name':'',\
+	\
+	'Policy Package Filename':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Scripts_Info = "{'Policy Script ID':'',\
+	\
+	'Policy Script Name':'',\
+	\
+	'Policy Script Category Name':'',\
+	\
+	'Policy Script Filename':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Configuration Profile Info
+	##################################################
+	dataToCVS_JAMF_Configuration_Profile_Info = "{'Configuration Profile ID':'',\
+	\
+	'Configuration Profile Type':'',\
+	\
+	'Configuration Profile Name':'',\
+	\
+	'Configuration Profile Category ID':'',\
+	\
+	'Configuration Profile Category Name':''}"
+	
+	
+	dataToCVS_JAMF_Configuration_Profile_Target_Info = "{'Configuration Profile Target Computer ID':'',\
+	\
+	'Configuration Profile Target Computer Name':'',\
+	\
+	'Configuration Profile Target Group ID':'',\
+	\
+	'Configuration Profile Target Group Name':'',\
+	\
+	'Configuration Profile Target Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Configuration_Profile_Exclusion_Info = "{'Configuration Profile Exclusion Computer id':'',\
+	\
+	'Configuration Profile Exclusion Computer Name':'',\
+	\
+	'Configuration Profile Exclusion Group id':'',\
+	\
+	'Configuration Profile Exclusion Group Name':'',\
+	\
+	'Configuration Profile Exclusion Group is Smart':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Packages to Policies Info
+	##################################################
+	dataToCVS_JAMF_Package_To_Regular_Policy_Info = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	
+	dataToCVS_JAMF_Package_To_PreStage_Policy_Info = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	
+	dataToCVS_JAMF_Package_Unused_Info = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Script to Policies Info
+	##################################################
+	dataToCVS_JAMF_Script_To_Regular_Policy_Info = "{'Type':'',\
+	\
+	'Script ID':'',\
+	\
+	'Script Name':'',\
+	\
+	'Script File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	dataToCVS_JAMF_Script_Unused_Info = "{'Type':'',\
+	\
+	'Script ID':'',\
+	\
+	'Script Name':'',\
+	\
+	'Script File Name':''}"	
+	
 
-				
-				list_of_config_profiles_ID = []
-				
-				for ConfigProfile in computerConfigurationProfileMembership :
-					if ConfigProfile['id'] > 0:
-						configurationProfileID = str(ConfigProfile['id'])
-						list_of_config_profiles_ID.append(f'{configurationProfileID}')
-						
-						
-				def get_clean_List(url, configProfiles):
-					
-					myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configProfiles}")
-					
-					test = http.get(myURL, headers=headers, auth = HTTPBasicAuth(username, password))
-					
-					if test.status_code != 200:
-						list_of_config_profiles_ID.remove(configProfiles)
-						
-						
-				def get_url(url, configProfiles):
-					
-					print(f"..............Working on Configuration Profile ID: {configProfiles}, for Computer ID: " + getMycomputerRecordGeneralID)
-					
-					myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configProfiles}")
-					
-					try:
-						
-						computerConfigurationProfileMembershipResponse = http.get(myURL, headers=headers, auth = HTTPBasicAuth(username, password))
-						
-						computerConfigurationProfileMembershipResponse.raise_for_status()
-						
-						resp = computerConfigurationProfileMembershipResponse.json()
-						
-					except HTTPError as http_err:
-						
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = configProfiles
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						
-						
-					#General Element for ID and Catagory
-					myConfigurationProfileGeneral = resp['os_x_configuration_profile']['general']
-					myConfigurationProfileGeneralID = myConfigurationProfileGeneral['id']
-					myConfigurationProfileGeneralName = myConfigurationProfileGeneral['name']
-					
-					
-					return myConfigurationProfileGeneralID, myConfigurationProfileGeneralName
-				
-				
-				
-				# Clean List
-				with ThreadPoolExecutor(max_workers=100) as pool:
-					get_data = partial(get_clean_List, JAMF_url)
-					list(pool.map(get_data,list_of_config_profiles_ID))
-					
-					
-				#print(list_of_config_profiles_ID)	
-					
-				# Process List	
-				with ThreadPoolExecutor(max_workers=100) as pool:
-					get_data = partial(get_url, JAMF_url)
-					response_list = list(pool.map(get_data,list_of_config_profiles_ID))
-					
-				#print(response_list)
-					
-					
-				for response in response_list:
-					# Make sure to refresh variables for each loop
-					myComputerID = mycomputerRecordGeneralID
-					myComputerName = mycomputerRecordGeneral['name']
-					myConfigProfileID = response[0] 
-					myConfigProfileName = response[1] 
-					
-					#print(f"My Group info: {response}")
-					
-					appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Type':'Computer Configuration Profile Membership Info',\
-					\
-					'Computer ID':myComputerID,\
-					\
-					'Computer Name':myComputerName,\
-					\
-					'Computer Configuration Profile Membership ID':myConfigProfileID,\
-					\
-					'Computer Configuration Profile Membership Name':myConfigProfileName}"
-					
-					
-					appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
-					appendComputerConfigurationProfileMembershipColumns = appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership
-					
-					#Set Columns	
-					Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, appendComputerConfigurationProfileMembershipColumns)
-					
-					#Set CSV File
-					dataToCsvComputers.append(Combined)
+	##################################################
+	# Set Variables for Dict for Computers Info to empty
+	##################################################
+	if usingFilter == 'computerFilter':
+		
+		dataToCVS_JAMF_Computers_Info_Empty = "{'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+	elif usingFilter == 'smartGroupFilter':
+		
+		dataToCVS_JAMF_Computers_Info_Empty = "{'Computer SmartGroup ID':'',\
+		\
+		'Computer SmartGroup Name':'',\
+		\
+		'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+	elif usingFilter == 'noFilter':
+		
+		dataToCVS_JAMF_Computers_Info_Empty = "{'Type':'',\
+		\
+		'Computer ID':'',\
+		\
+		'Computer Name':'',\
+		\
+		'Computer Serial Number':'',\
+		\
+		'Computer Last Check-in':'',\
+		\
+		'Computer Site Info':''}"
+		
+		
+
+	dataToCVS_JAMF_Computers_Hardware_Info_Empty = "{'Computer Make':'',\
+	\
+	'Computer Model':'',\
+	\
+	'Computer Model Identifier':'',\
+	\
+	'Computer OS Name':'',\
+	\
+	'Computer OS Version':'',\
+	\
+	'Computer OS Build':''}"	
+	
+	
+	dataToCVS_JAMF_Computers_FileVault2_Info_Empty = "{'Computer FileVault2 User':''}"
+	
+	
+	dataToCVS_JAMF_Computers_Local_Account_Info_Empty = "{'Computer Local Account Name':'',\
+	\
+	'Computer Local Account Real Name':'',\
+	\
+	'Computer Local Account ID':'',\
+	\
+	'Computer Local Account is Admin ':'',\
+	\
+	'Computer Local Account in LDAP ':''}"
+	
+	
+	dataToCVS_JAMF_Computers_Info_Computer_Group_Membership_Empty = "{'Computer Group Membership Group ID':'',\
+	\
+	'Computer Group Membership Group Name':'',\
+	\
+	'Computer Group Membership Group Is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty = "{'Computer Configuration Profile Membership ID':'',\
+	\
+	'Computer Configuration Profile Membership Name':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Policy Info Empty
+	##################################################
+	dataToCVS_JAMF_Policy_Info_Empty = "{'Type':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':'',\
+	\
+	'Policy Category ID':'',\
+	\
+	'Policy Category Name':''}"
+	
+	
+	dataToCVS_JAMF_Policy_SelfService_Info_Empty = "{'Policy In SelfService':'',\
+	\
+	'Policy In SelfService Name':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Target_Info_Empty = "{'Policy Target All Computers':'',\
+	\
+	'Policy Target Computer ID':'',\
+	\
+	'Policy Target Computer Name':'',\
+	\
+	'Policy Target Group ID':'',\
+	\
+	'Policy Target Group Name':'',\
+	\
+	'Policy Target Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Exclusion_Info_Empty = "{'Policy Exclusion Computer ID':'',\
+	\
+	'Policy Exclusion Computer Name':'',\
+	\
+	'Policy Exclusion Group id':'',\
+	\
+	'Policy Exclusion Group Name':'',\
+	\
+	'Policy Exclusion Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Packages_Info_Empty = "{'Policy Package ID':'',\
+	\
+	'Policy Package Name':'',\
+	\
+	'Policy Package Category Name':'',\
+	\
+	'Policy Package Filename':''}"
+	
+	
+	dataToCVS_JAMF_Policy_Scripts_Info_Empty = "{'Policy Script ID':'',\
+	\
+	'Policy Script Name':'',\
+	\
+	'Policy Script Category Name':'',\
+	\
+	'Policy Script Filename':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Configuration Profile Info to empty
+	##################################################
+	dataToCVS_JAMF_Configuration_Profile_Info_Empty = "{'Configuration Profile ID':'',\
+	\
+	'Configuration Profile Type':'',\
+	\
+	'Configuration Profile Name':'',\
+	\
+	'Configuration Profile Category ID':'',\
+	\
+	'Configuration Profile Category Name':''}"
+	
+	
+	dataToCVS_JAMF_Configuration_Profile_Target_Info_Empty = "{'Configuration Profile Target Computer ID':'',\
+	\
+	'Configuration Profile Target Computer Name':'',\
+	\
+	'Configuration Profile Target Group ID':'',\
+	\
+	'Configuration Profile Target Group Name':'',\
+	\
+	'Configuration Profile Target Group is Smart':''}"
+	
+	
+	dataToCVS_JAMF_Configuration_Profile_Exclusion_Info_Empty = "{'Configuration Profile Exclusion Computer id':'',\
+	\
+	'Configuration Profile Exclusion Computer Name':'',\
+	\
+	'Configuration Profile Exclusion Group id':'',\
+	\
+	'Configuration Profile Exclusion Group Name':'',\
+	\
+	'Configuration Profile Exclusion Group is Smart':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Script Profile Info to empty
+	##################################################
+	dataToCVS_JAMF_Package_To_Regular_Policy_Info_Empty = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	
+	dataToCVS_JAMF_Package_To_PreStage_Policy_Info_Empty = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	
+	dataToCVS_JAMF_Package_Unused_Info_Empty = "{'Type':'',\
+	\
+	'Package List':'',\
+	\
+	'Package ID':'',\
+	\
+	'Package Name':'',\
+	\
+	'Package File Name':''}"
+	
+	
+	##################################################
+	# Set Variables for Dict for Script to Policies Info Empty
+	##################################################
+	dataToCVS_JAMF_Script_To_Regular_Policy_Info_Empty = "{'Type':'',\
+	\
+	'Script ID':'',\
+	\
+	'Script Name':'',\
+	\
+	'Script File Name':'',\
+	\
+	'Policy ID':'',\
+	\
+	'Policy Name':''}"
+	
+	dataToCVS_JAMF_Script_Unused_Info_Empty = "{'Type':'',\
+	\
+	'Script ID':'',\
+	\
+	'Script Name':'',\
+	\
+	'Script File Name':''}"	
+	
+	
+	##################################################
+	# Take Variables and make Dict
+	##################################################
+	# Computers Info
+	JAMF_Computers_Info = eval(dataToCVS_JAMF_Computers_Info)
+	JAMF_Computers_Hardware_Info = eval(dataToCVS_JAMF_Computers_Hardware_Info)
+	JAMF_Computers_FileVault2_Info = eval(dataToCVS_JAMF_Computers_FileVault2_Info)
+	JAMF_Computers_Local_Account_Info = eval(dataToCVS_JAMF_Computers_Local_Account_Info)
+	JAMF_Computers_Info_Computer_Group_Membership = eval(dataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
+	JAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
+	
+	# Policy Info
+	JAMF_Policy_Info = eval(dataToCVS_JAMF_Policy_Info)
+	JAMF_Policy_SelfService_Info = eval(dataToCVS_JAMF_Policy_SelfService_Info)
+	JAMF_Policy_Target_Info = eval(dataToCVS_JAMF_Policy_Target_Info)
+	JAMF_Policy_Exclusion_Info = eval(dataToCVS_JAMF_Policy_Exclusion_Info)
+	JAMF_Policy_Packages_Info = eval(dataToCVS_JAMF_Policy_Packages_Info)
+	JAMF_Policy_Scripts_Info = eval(dataToCVS_JAMF_Policy_Scripts_Info)
+	
+	# Configuration Profile Info
+	JAMF_Configuration_Profile_Info = eval(dataToCVS_JAMF_Configuration_Profile_Info)
+	JAMF_Configuration_Profile_Target_Info = eval(dataToCVS_JAMF_Configuration_Profile_Target_Info)
+	JAMF_Configuration_Profile_Exclusion_Info = eval(dataToCVS_JAMF_Configuration_Profile_Exclusion_Info)
+	
+	# Package to Policy Info
+	JAMF_Package_To_Regular_Policy_Info = eval(dataToCVS_JAMF_Package_To_Regular_Policy_Info)
+	JAMF_Package_To_PreStage_Policy_Info = eval(dataToCVS_JAMF_Package_To_PreStage_Policy_Info)
+	JAMF_Package_Unused_Info = eval(dataToCVS_JAMF_Package_Unused_Info)
+	
+	
+	# Script to Policy Info
+	JAMF_Script_To_Regular_Policy_Info = eval(dataToCVS_JAMF_Script_To_Regular_Policy_Info)
+	JAMF_Script_Unused_Info = eval(dataToCVS_JAMF_Script_Unused_Info)
+	
+	
+	##################################################
+	# Take Variables and make them a Empty Dict
+	##################################################
+	# Computers Info
+	JAMF_Computers_Info_Empty = eval(dataToCVS_JAMF_Computers_Info_Empty)
+	JAMF_Computers_Hardware_Info_Empty = eval(dataToCVS_JAMF_Computers_Hardware_Info_Empty)
+	JAMF_Computers_FileVault2_Info_Empty = eval(dataToCVS_JAMF_Computers_FileVault2_Info_Empty)
+	JAMF_Computers_Local_Account_Info_Empty = eval(dataToCVS_JAMF_Computers_Local_Account_Info_Empty)
+	JAMF_Computers_Info_Computer_Group_Membership_Empty = eval(dataToCVS_JAMF_Computers_Info_Computer_Group_Membership_Empty)
+	JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty = eval(dataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty)
+	
+	# Policy Info
+	JAMF_Policy_Info_Empty = eval(dataToCVS_JAMF_Policy_Info_Empty)
+	JAMF_Policy_SelfService_Info_Empty = eval(dataToCVS_JAMF_Policy_SelfService_Info_Empty)
+	JAMF_Policy_Target_Info_Empty = eval(dataToCVS_JAMF_Policy_Target_Info_Empty)
+	JAMF_Policy_Exclusion_Info_Empty = eval(dataToCVS_JAMF_Policy_Exclusion_Info_Empty)
+	JAMF_Policy_Packages_Info_Empty = eval(dataToCVS_JAMF_Policy_Packages_Info_Empty)
+	JAMF_Policy_Scripts_Info_Empty = eval(dataToCVS_JAMF_Policy_Scripts_Info_Empty)
+	
+	# Configuration Profile Info
+	JAMF_Configuration_Profile_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Info_Empty)
+	JAMF_Configuration_Profile_Target_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Target_Info_Empty)
+	JAMF_Configuration_Profile_Exclusion_Info_Empty = eval(dataToCVS_JAMF_Configuration_Profile_Exclusion_Info_Empty)
+	
+	# Package to Policy Info
+	JAMF_Package_To_Regular_Policy_Info_Empty = eval(dataToCVS_JAMF_Package_To_Regular_Policy_Info_Empty)
+	JAMF_Package_To_PreStage_Policy_Info_Empty = eval(dataToCVS_JAMF_Package_To_PreStage_Policy_Info_Empty)
+	JAMF_Package_Unused_Info_Empty = eval(dataToCVS_JAMF_Package_Unused_Info_Empty)
+	
+	# Script to Policy Info
+	JAMF_Script_To_Regular_Policy_Info_Empty = eval(dataToCVS_JAMF_Script_To_Regular_Policy_Info_Empty)
+	JAMF_Script_Unused_Info_Empty = eval(dataToCVS_JAMF_Script_Unused_Info_Empty)
+	
+	
+	##################################################
+	# Build the dataToCsvPolicy
+	##################################################
+	# Computer Fields
+	if get_JAMF_Computers_Info == "yes":
+		
+		if includeComputerInfo == "yes":
+			
+			computerColumns = JAMF_Computers_Info
+			
+			
+		if includeHardwareInfo == "yes":
+			
+			hardwareColumns = JAMF_Computers_Hardware_Info
+			
+		elif includeHardwareInfo == "no":
+			
+			hardwareColumns = JAMF_Computers_Hardware_Info_Empty
+			
+		
+		if includeFileVault2Info == "yes":
+			
+			FileVault2Columns = JAMF_Computers_FileVault2_Info
+			
+		elif includeFileVault2Info == "no":
+			
+			FileVault2Columns = JAMF_Computers_FileVault2_Info_Empty
+			
+		
+		if includeLocalAccountInfo == "yes":
+			
+			LocalAccountColumns = JAMF_Computers_Local_Account_Info
+			
+		elif includeLocalAccountInfo == "no":
+			
+			LocalAccountColumns = JAMF_Computers_Local_Account_Info_Empty
+			
+			
+		if includeComputerGroupMembershipInfo == 'yes':
+			
+			computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership
+			
+		elif includeComputerGroupMembershipInfo == 'no':
+			
+			computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership_Empty
+			
+			
+		if includeComputerConfigurationProfileMembershipInfo == 'yes':
+			
+			computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership
+			
+		elif includeComputerConfigurationProfileMembershipInfo == 'no':
+			
+			computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty	
+			
+			
+	elif get_JAMF_Computers_Info == "no":
+		
+		computerColumns = JAMF_Computers_Info_Empty
+		hardwareColumns = JAMF_Computers_Hardware_Info_Empty
+		FileVault2Columns = JAMF_Computers_FileVault2_Info_Empty
+		LocalAccountColumns = JAMF_Computers_Local_Account_Info_Empty
+		computerGroupMembershipColumns = JAMF_Computers_Info_Computer_Group_Membership_Empty
+		computerConfigurationProfileMembershipColumns = JAMF_Computers_Info_Computer_Configuration_Profile_Membership_Empty	
 						
-				
-				
-##################################################
-# Process Requested Info for Policies
-##################################################
-
-if get_JAMF_Policy_Info == ("yes"):
-	# Set up url for getting a list of all policies from JAMF API
-	url = JAMF_url + "/JSSResource/policies"
 	
-	try:
-		response = http.get(url, headers=btHeaders)
+	# Policy Fields
+	if get_JAMF_Policy_Info == "yes":
 		
-		response.raise_for_status()
+		if includePolicyInfo == "yes":
+			
+			policyColumns = JAMF_Policy_Info
+			
+			
+		if includeSelfServiceInfo == "yes":
+			
+			selfServiceColumns = JAMF_Policy_SelfService_Info
+			
+		elif includeSelfServiceInfo == "no":
+			
+			selfServiceColumns = JAMF_Policy_SelfService_Info_Empty
+			
+			
+		if includeTargetsInfo == "yes":
+			
+			targetsColumns = JAMF_Policy_Target_Info
+			
+		elif includeTargetsInfo == "no":
+			
+			targetsColumns = JAMF_Policy_Target_Info_Empty
+			
+			
+		if includeExclusionsInfo == "yes":
+			
+			exclusionColumns = JAMF_Policy_Exclusion_Info
+			
+		elif includeExclusionsInfo == "no":
+			
+			exclusionColumns = JAMF_Policy_Exclusion_Info_Empty	
+			
+			
+		if includePackagesInfo == "yes":
+			
+			packageColumns = JAMF_Policy_Packages_Info
+			
+		elif includePackagesInfo == "no":
+			
+			packageColumns = JAMF_Policy_Packages_Info_Empty
+			
+			
+		if includeScriptsInfo == "yes":
+			
+			scriptsColumns = JAMF_Policy_Scripts_Info
+			
+		elif includeScriptsInfo == "no":
+			
+			scriptsColumns = JAMF_Policy_Scripts_Info_Empty
+			
+	elif get_JAMF_Policy_Info == "no":
 		
-		resp = response.json()
+		policyColumns = JAMF_Policy_Info_Empty
+		selfServiceColumns = JAMF_Policy_SelfService_Info_Empty
+		targetsColumns = JAMF_Policy_Target_Info_Empty
+		exclusionColumns = JAMF_Policy_Exclusion_Info_Empty
+		packageColumns = JAMF_Policy_Packages_Info_Empty
+		scriptsColumns = JAMF_Policy_Scripts_Info_Empty
 		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')
 	
-	# For Testing
-	#print(response.json())
-	
-	policies = resp['policies']
-	
-	policies.sort(key=lambda item: item.get('id'), reverse=False)
-	
-	
-	list_of_policies = []
-	
-	for policy in policies :
-		PolicyID = str(policy['id']) 
-		list_of_policies.append(f'{PolicyID}')
+	# Configuration Profile Fields
+	if get_JAMF_Configuration_Profile_Info == "yes":
 		
+		if includeConfigurationProfileInfo == "yes":
+			
+			configProfileColumns = JAMF_Configuration_Profile_Info
+			
+		elif includeConfigurationProfileInfo == "no":
+			
+			configProfileColumns = JAMF_Configuration_Profile_Info_Empty
+			
+			
+		if includeConfigurationProfileTargetsInfo == "yes":
+			
+			configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info
+			
+		elif includeConfigurationProfileTargetsInfo == "no":
+			
+			configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info_Empty
+			
+			
+		if includeConfigurationProfileExclusionsInfo == "yes":
+			
+			configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info
+			
+		elif includeConfigurationProfileExclusionsInfo == "no":
+			
+			configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info_Empty
+			
+			
+	elif get_JAMF_Configuration_Profile_Info == "no":
 		
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
+		configProfileColumns = JAMF_Configuration_Profile_Info_Empty
+		configProfileTargetsColumns = JAMF_Configuration_Profile_Target_Info_Empty
+		configProfileExclusionsColumns = JAMF_Configuration_Profile_Exclusion_Info_Empty
 	
 	
-	def get_clean_List(url, policyIDList):
-		
-		myURL = (f"{url}/JSSResource/policies/id/{policyIDList}")
-		
-		test = http.get(myURL, headers=btHeaders)
+	# Package to Policy Info fields
+	if get_JAMF_Package_To_Policy_Info == 'yes':
 		
-		if test.status_code != 200:
-			list_of_policies.remove(policyIDList)
+		# Regular columns
+		if includeRegularPackageToPolicyInfo == "yes":
 			
+			packageToRegularPolicyColumns = JAMF_Package_To_Regular_Policy_Info
+			packageUnusedColumns = JAMF_Package_Unused_Info	
 			
+		elif includeRegularPackageToPolicyInfo == "no":
 			
-	def get_url(url, policyIDList):
-		
-		getPolicy = ''
-		
-		myURL = (f"{url}/JSSResource/policies/id/{policyIDList}")
+			packageToRegularPolicyColumns = JAMF_Package_To_Regular_Policy_Info_Empty
+			packageUnusedColumns = JAMF_Package_Unused_Info_Empty
 		
-		try:
+		#prestage columns
+		if includePreStagePackageToPolicyInfo == "yes":
 			
-			response = http.get(myURL, headers=btHeaders)
+			packageToPreStagePolicyColumns = JAMF_Package_To_PreStage_Policy_Info
+			packageUnusedColumns = JAMF_Package_Unused_Info
 			
-			response.raise_for_status()
+		elif includePreStagePackageToPolicyInfo == "no":
 			
-			getPolicy = response.json()
+			packageToPreStagePolicyColumns = JAMF_Package_To_PreStage_Policy_Info_Empty
+			packageUnusedColumns = JAMF_Package_Unused_Info_Empty
 			
-		except HTTPError as http_err:
 			
-			# Process HTTP Error
-			check_http_err = str(http_err)
-			split_My_http_err = check_http_err.split()
+	# Script to Policy Info fields
+	if get_JAMF_Script_To_Policy_Info == 'yes':
+		
+		# Regular columns
+		if includeRegularScriptToPolicyInfo == "yes":
 			
-			myHttpError = split_My_http_err[0]
-			myMissingRecordID = policyIDList
-			myMissingRecordURL = split_My_http_err[5]
+			ScriptToRegularPolicyColumns = JAMF_Script_To_Regular_Policy_Info
+			ScriptUnusedColumns = JAMF_Script_Unused_Info	
 			
-			if myHttpError == '404':
-				print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-				
-			else:
-				print(f'HTTP error occurred: {http_err}')
-				
-		except Exception as err:
-			print(f'Other error occurred: {err}')
+		elif includeRegularScriptToPolicyInfo == "no":
 			
+			ScriptToRegularPolicyColumns = JAMF_Script_To_Regular_Policy_Info_Empty
+			ScriptUnusedColumns = JAMF_Script_Unused_Info_Empty
 			
-		return getPolicy
-	
+
+##########################################################################################
+# Process Requested Info for Sheets
+##########################################################################################			
+if get_JAMF_Computers_Info == ("yes"):
 	
-	# Clean List
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		get_data = partial(get_clean_List, JAMF_url)
-		list(pool.map(get_data,list_of_policies))
+	##########################################################################################
+	# Process Computers information for csv / Excel
+	##########################################################################################
+	# LDAP lookups for Local Account names are shared by every computer in the report
+	if includeLocalAccountInfo == "yes" and includeLocalAccountInfoLDAP == "yes":
 		
+		ldapUserCache = LDAPUserCache(JAMF_url, JIMServerLDAPLookupURL, btHeaders)
 		
-	#print(list_of_policies)
 		
+	# Get all computer groups once for the Computer Group Membership lookups
+	if get_JAMF_Computers_Info_Computer_Group_Membership == 'yes':
 		
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
-	
-	
-	# Process List	
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		get_data = partial(get_url, JAMF_url)
-		response_list = list(pool.map(get_data,list_of_policies))
+		computerGroupIndex = getComputerGroupIndex()
 		
-		#print(response_list)
 		
+	# Set up url for getting a list of all Computers from JAMF API
+	if usingFilter == 'computerFilter':
 		
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
+		url = JAMF_url + "/JSSResource/computers/id/" + JAMF_Computer_ID
+		
+	elif usingFilter == 'smartGroupFilter':
+		
+		url = JAMF_url + "/JSSResource/computergroups/id/" + JAMF_SmartGroup_ID
+		
+	# Only the filters are fetched here, the list of all Computers comes from the entity store
+	if usingFilter != 'noFilter':
+		
+		try:
+			response = fetchEngine.get(url, headers=btHeaders)
+			
+			response.raise_for_status()
+			
+			resp = response.json()
+			
+		except HTTPError as http_err:
+			print(f'HTTP error occurred: {http_err}')
+		except Exception as err:
+			print(f'Other error occurred: {err}')
 	
+	# For Testing
+	#print(response.json())
 	
-	def processData(response):
-		global btHeaders
-	##	# Make sure to refresh variables for each loop
-		#General Element for ID and Catagory
-		myPolicyGeneral = response['policy']['general']
-		myPolicyGeneralCatagory = response['policy']['general']['category']
+	#Choose filter for records
+	if usingFilter == 'computerFilter':
 		
-		#Scope Element for Computer Targets
-		myPolicyScopeTargetsAllComputers = response['policy']['scope']['all_computers']
-		myPolicyScopeTargetsComputers = response['policy']['scope']['computers']
-		myPolicyScopeTargetsComputerGroups = response['policy']['scope']['computer_groups']
+		computerRecords = resp['computer']['general']
+
 		
-		#Scope Element For Limitation
-		#myPolicyScopeLimitationsUsers = getPolicy['policy']['scope']['limitations']['users']
-		#myPolicyScopeLimitationsUserGroups = getPolicy['policy']['scope']['limitations']['user_groups']
+	elif usingFilter == 'smartGroupFilter':
 		
-		#Scope Element For Exclusions
-		myPolicyScopeExclusionsComputers = response['policy']['scope']['exclusions']['computers']
-		myPolicyScopeExclusionsComputerGroups = response['policy']['scope']['exclusions']['computer_groups']
+		computerRecords = resp['computer_group']['computers']
+		computerRecords.sort(key=lambda item: item.get('id'), reverse=False)
 		
+		smartGroupRecords = resp['computer_group']
+		smartGroupRecordName = smartGroupRecords['name']
 		
-		#Package Element
-		myPackagesInfo = response['policy']['package_configuration']['packages']
+		#Set Variables if Data Available
+		if len(str(smartGroupRecords['id'])) == 0:
+			smartGroupRecordID = ''
+		else:
+			smartGroupRecordID = int(smartGroupRecords['id'])
 		
+	elif usingFilter == 'noFilter':
 		
-		#Script Elements
-		myScriptInfo = response['policy']['scripts']
+		computerRecords = entityStore.getList('computers')
+	
+	
+	# Process Computers List and get information linked to Computers
+	if usingFilter == 'computerFilter':
 		
-		#SelfService Element
-		mySelfServiceInfo = response['policy']['self_service']
-		useForSelfService = str(mySelfServiceInfo['use_for_self_service'])
+		#run for single computer
+		# Get ID to do JAMF API lookup
+		computerRecordID = str(computerRecords['id'])
+		
+		#For Testing
+		#print(computerRecordID)
+		
+		# Set up url for getting information from each configurationProfile ID from JAMF API
+		url = JAMF_url + "/JSSResource/computers/id/" + computerRecordID
+		
+		try:
+			response = fetchEngine.get(url, headers=btHeaders)
+			
+			response.raise_for_status()
+			
+			computerRecordProfile = response.json()
+			
+		except HTTPError as http_err:
+			print(f'HTTP error occurred: {http_err}')
+		except Exception as err:
+			print(f'Other error occurred: {err}')
+			
+			
+		# For Testing
+		#print(computerRecordProfile)
+			
+		#General Element for ID and Catagory
+		mycomputerRecordGeneral = computerRecordProfile['computer']['general']
+		mycomputerRecordHardware = computerRecordProfile['computer']['hardware']
+		mycomputerRecordHardwareFileVault2Users = computerRecordProfile['computer']['hardware']['filevault2_users']
+		mycomputerRecordHardwareLocalAccounts = computerRecordProfile['computer']['groups_accounts']['local_accounts']
+		mycomputerRecordComputerGroupMembership = computerRecordProfile['computer']['groups_accounts']['computer_group_memberships']
+		mycomputerConfigurationProfileMembership = computerRecordProfile['computer']['configuration_profiles']
 		
 		
 		##########################################################################################
-		# Process Policy information for csv / Excel
+		# Process ConfigurationProfile information for csv / Excel
 		##########################################################################################
-		
-		# Individual Policy Info for each record
-		getMyPolicyID = (str(myPolicyGeneral['id']) + " - " + myPolicyGeneral['name'])
-		getMyPolicyGeneralCatagory = (str(myPolicyGeneralCatagory['id']) + " - " + myPolicyGeneralCatagory['name'])
+		# Individual Computers Info for each record
+		getMycomputerRecordGeneralID = (str(mycomputerRecordGeneral['id']) + " - " + mycomputerRecordGeneral['name'])
 		
 		# Get info for Policies
-		print("Working on Policy ID: " + getMyPolicyID)
+		print("Working on Computer ID: " + getMycomputerRecordGeneralID)
 		
 		#Set Variables if Data Available
-		if len(str(myPolicyGeneral['id'])) == 0:
-			myPolicyGeneralID = ''
+		if len(str(mycomputerRecordGeneral['id'])) == 0:
+			mycomputerRecordGeneralID = ''
 		else:
-			myPolicyGeneralID = int(myPolicyGeneral['id'])
+			mycomputerRecordGeneralID = int(mycomputerRecordGeneral['id'])
 			
-		if len(str(myPolicyGeneralCatagory['id'])) == 0:
-			myPolicyGeneralCatagoryID = ''
-		else:
-			myPolicyGeneralCatagoryID = int(myPolicyGeneralCatagory['id'])
 			
-		#Get Catagory name and format for excel
-		formatMyPolicyGeneralCatagory = f"\"{myPolicyGeneralCatagory['name']}\""
-		
-		# Set Variables for Dict for Policy Info
-		appendDataToCVS_JAMF_Policy_Info = "{'Type':'Policy',\
+		# Set Variables for Dict for Computers Info
+		if usingFilter == 'computerFilter':
+			
+			appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
 			\
-			'Policy ID':myPolicyGeneralID,\
+			'Computer ID':mycomputerRecordGeneralID,\
 			\
-			'Policy Name':myPolicyGeneral['name'],\
+			'Computer Name':mycomputerRecordGeneral['name'],\
 			\
-			'Policy Category ID':myPolicyGeneralCatagoryID,\
+			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
 			\
-			'Policy Category Name':formatMyPolicyGeneralCatagory}"
-		
-		appendJAMF_Policy_Info = eval(appendDataToCVS_JAMF_Policy_Info)
-		appendPolicyColumns = appendJAMF_Policy_Info
+			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
+			\
+			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
+			
+		elif usingFilter == 'smartGroupFilter':
+			
+			appendDataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':smartGroupRecordID,\
+			\
+			'Computer SmartGroup Name':smartGroupRecordName,\
+			\
+			'Type':'Computer Info',\
+			\
+			'Computer ID':mycomputerRecordGeneralID,\
+			\
+			'Computer Name':mycomputerRecordGeneral['name'],\
+			\
+			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
+			\
+			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
+			\
+			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
+			
+		elif usingFilter == 'noFilter':
+			
+			appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
+			\
+			'Computer ID':mycomputerRecordGeneralID,\
+			\
+			'Computer Name':mycomputerRecordGeneral['name'],\
+			\
+			'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
+			\
+			'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
+			\
+			'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
+			
+			
+		appendJAMF_Computers_Info = eval(appendDataToCVS_JAMF_Computers_Info)
+		appendComputerColumns = appendJAMF_Computers_Info
 		
 		#Set Columns	
-		Combined = MergePolicyInfo(appendPolicyColumns, selfServiceColumns, targetsColumns, exclusionColumns, packageColumns, scriptsColumns)
+		Combined = MergeComputersInfo(appendComputerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 		
 		#Set CSV File
-		dataToCsvPolicy.append(Combined)	
+		dataToCsvComputers.append(Combined)	
 		
-		if get_JAMF_Policy_Info_SelfService == ("yes"):
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
+		
+		if get_JAMF_Computers_Info_Hardware == ("yes"):
+			##########################################################################################		
+			# Get info for Hardware	
+			##########################################################################################
+			# Get info for Policies
+			print(".......Getting Hardware Info for Computer ID: " + getMycomputerRecordGeneralID)
 			
-			token = http.post(url, headers=btHeaders)
+			formatMyComputerRecordHardwareOSBuild = f"\"{mycomputerRecordHardware['os_build']}\""
 			
-			bearer = token.json()['token']
+			appendDataToCVS_JAMF_Computers_Hardware_Info = "{'Type':'Computer Hardware Info',\
+			\
+			'Computer ID':mycomputerRecordGeneralID,\
+			\
+			'Computer Name':mycomputerRecordGeneral['name'],\
+			\
+			'Computer Make':mycomputerRecordHardware['make'],\
+			\
+			'Computer Model':mycomputerRecordHardware['model'],\
+			\
+			'Computer Model Identifier':mycomputerRecordHardware['model_identifier'],\
+			\
+			'Computer OS Name':mycomputerRecordHardware['os_name'],\
+			\
+			'Computer OS Version':str(mycomputerRecordHardware['os_version']),\
+			\
+			'Computer OS Build':formatMyComputerRecordHardwareOSBuild}"	
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			appendJAMF_Computers_Hardware_Info = eval(appendDataToCVS_JAMF_Computers_Hardware_Info)
+			appendComputerHardwareColumns = appendJAMF_Computers_Hardware_Info
 			
+			#Set Columns	
+			Combined = MergeComputersInfo(computerColumns, appendComputerHardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 			
-			if useForSelfService == 'True':
-				##########################################################################################
-				# Get Info for Self Service
-				##########################################################################################
-				# Set Variables for Dict for Policy Info
-				appendDataToCVS_JAMF_Policy_SelfService_Info = "{'Type':'Policy Self Service Info',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
-				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
+			#Set CSV File
+			dataToCsvComputers.append(Combined)	
+			
+			
+		if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
+			##########################################################################################		
+			# Get info for FileVautl2	
+			##########################################################################################
+			print(".......Getting FileVault Info for Computer ID: " + getMycomputerRecordGeneralID)
+			
+			for FileVault2User in mycomputerRecordHardwareFileVault2Users :
+				
+				appendDataToCVS_JAMF_Computers_FileVault2_Info = "{'Type':'Computer Hardware FileVault2 Info',\
 				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				'Computer ID':mycomputerRecordGeneralID,\
 				\
-				'Policy In SelfService':str(mySelfServiceInfo['use_for_self_service']),\
+				'Computer Name':mycomputerRecordGeneral['name'],\
 				\
-				'Policy In SelfService Name':mySelfServiceInfo['self_service_display_name']}"
+				'Computer FileVault2 User':FileVault2User}"
 				
-				appendJAMF_Policy_SelfService_Info = eval(appendDataToCVS_JAMF_Policy_SelfService_Info)
-				appendSelfServiceColumns = appendJAMF_Policy_SelfService_Info
+				appendJAMF_Computers_FileVault2_Info = eval(appendDataToCVS_JAMF_Computers_FileVault2_Info)
+				appendComputerFileVault2Columns = appendJAMF_Computers_FileVault2_Info
 				
 				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, appendSelfServiceColumns, targetsColumns, exclusionColumns, packageColumns, scriptsColumns)
+				Combined = MergeComputersInfo(computerColumns, hardwareColumns, appendComputerFileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 				
 				#Set CSV File
-				dataToCsvPolicy.append(Combined)	
+				dataToCsvComputers.append(Combined)	
 				
-		if get_JAMF_Policy_Info_Targets == ("yes"):
+				
+		if get_JAMF_Computers_Info_Local_Account == ("yes"):
 			##########################################################################################		
-			# Get info for Target Computers	
+			# Get info for Local Accounts	
+			##########################################################################################
+			print(".......Getting Local Account Info for Computer ID: " + getMycomputerRecordGeneralID)
+			
+			for computerLocalAccount in mycomputerRecordHardwareLocalAccounts:
+				
+				# Put current data into variable to filter
+				filterComputerLocalAccountData = computerLocalAccount['name']
+				
+				# Regex Pattern
+				filterPattern = r"^((?![_/][a-zA-Z]*))"
+				filterDefaultUserAccountsListdata = filterDefaultUserAccountsList
+				
+				if re.match(filterPattern, filterComputerLocalAccountData): #Check if regex is correct
+				
+					if filterComputerLocalAccountData not in filterDefaultUserAccountsListdata :
+						
+						verifyLocalAccountIsAdmin = computerLocalAccount['administrator']
+						computerLocalAccountName = computerLocalAccount['name']
+						computerLocalAccountRealName = computerLocalAccount['realname']
+						
+						#Set Variables if Data Available
+						if len(str(computerLocalAccount['uid'])) == 0:
+							computerLocalAccountUID = ''
+						else:
+							computerLocalAccountUID = int(computerLocalAccount['uid'])
+							
+						computerLocalAccountIsAdmin = verifyLocalAccountIsAdmin
+						computerInInLDAP = "false"
+						
+						if includeLocalAccountInfoLDAP == "yes":
+							
+							# Looked up ahead for the whole batch, each name only once per run
+							verifyLocalAccount = ldapUserCache.get(filterComputerLocalAccountData)
+							
+							if verifyLocalAccount is None:
+								continue
+								
+								
+							# For Testing
+							#print(verifyLocalAccount)
+								
+							verifidLocalAccountRecords = verifyLocalAccount['ldap_users']
+							verifidLocalAccountRecords.sort(key=lambda item: item.get('id'), reverse=False)
+							
+							for localAccountRecord in verifidLocalAccountRecords :
+								
+								#print(localAccountRecord['username'])
+								
+								#Set Variables if Data Available
+								if len(str(localAccountRecord['uid'])) == 0:
+									computerLocalAccountUID = ''
+								else:
+									computerLocalAccountUID = int(localAccountRecord['uid'])
+									
+									
+								computerInInLDAP = "true"
+								
+								
+						appendDataToCVS_JAMF_Computers_Local_Account_Info = "{'Type':'Computer Hardware Local Account Info',\
+						\
+						'Computer ID':mycomputerRecordGeneralID,\
+						\
+						'Computer Name':mycomputerRecordGeneral['name'],\
+						\
+						'Computer Local Account Name':computerLocalAccountName,\
+						\
+						'Computer Local Account Real Name':computerLocalAccountRealName,\
+						\
+						'Computer Local Account ID':computerLocalAccountUID,\
+						\
+						'Computer Local Account is Admin ':computerLocalAccountIsAdmin,\
+						\
+						'Computer Local Account in LDAP ':computerInInLDAP}"
+						
+						
+						appendJAMF_Computers_Local_Account_Info = eval(appendDataToCVS_JAMF_Computers_Local_Account_Info)
+						appendLocalAccountColumns = appendJAMF_Computers_Local_Account_Info
+						
+						#Set Columns	
+						Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, appendLocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+						
+						#Set CSV File
+						dataToCsvComputers.append(Combined)	
+						
+						
+		if get_JAMF_Computers_Info_Computer_Group_Membership == 'yes':
+			##########################################################################################		
+			# Get info for Computer Group Membership	
 			##########################################################################################
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
+			print(".......Getting Computer Group Info for Computer ID: " + getMycomputerRecordGeneralID)
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			#Get Info from record
+			computerGroupMembershipRecords = mycomputerRecordComputerGroupMembership
 			
 			
-			for computer in myPolicyScopeTargetsComputers:
-				
-				#Set Variables if Data Available
-				if len(str(computer['id'])) == 0:
-					computerID = ''
-				else:
-					computerID = int(computer['id'])
-					
-				# Get info for Policies
-				print(f"Working on Computer ID: {computerID}")
-				
-				
-				appendDataToCVS_JAMF_Policy_Target_Info = "{'Type':'Policy Computer Targets',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
-				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
-				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
-				\
-				'Policy Target All Computers':str(myPolicyScopeTargetsAllComputers),\
-				\
-				'Policy Target Computer ID':computerID,\
-				\
-				'Policy Target Computer Name':computer['name']}"
-				
-				appendJAMF_Policy_Target_Info = eval(appendDataToCVS_JAMF_Policy_Target_Info)
-				appendtargetsColumns = appendJAMF_Policy_Target_Info
-				
-				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, appendtargetsColumns, exclusionColumns, packageColumns, scriptsColumns)
-				
-				#Set CSV File
-				dataToCsvPolicy.append(Combined)
-				
-				
-			##########################################################################################
-			# Get Info for Target Computer Groups
-			##########################################################################################
-			# Start New MultiProcess Code here
-				
-			list_of_Targets = []
+			list_of_groups = []
 			
-			for target in myPolicyScopeTargetsComputerGroups:
-				targetID = str(target['id']) 
-				list_of_Targets.append(f'{targetID}')
+			for groupName in computerGroupMembershipRecords :
+				list_of_groups.append(f'{groupName}')
 				
 				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
 			
-			bearer = token.json()['token']
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			# Look up each group in the computer group index, groups that no longer exist are left out
+			response_list = []
 			
-			
-			def get_clean_List(url, targetIDList):
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{targetIDList}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_Targets.remove(targetIDList)
-					
-					
-					
-			def get_url(url, targetIDList):
-				
-				getTargetGroupData = ''
+			for groupName in list_of_groups:
+				groupRecord = computerGroupIndex.get(groupName)
 				
-				myURL = (f"{url}/JSSResource/computergroups/id/{targetIDList}")
+				if groupRecord is None:
+					print(f".......We found that Record: {groupName}, does not exist in your JAMF Instance at URL: {JAMF_url}/JSSResource/computergroups")
+					continue
 				
-				try:
-					
-					response = http.get(myURL, headers=btHeaders)
-					
-					response.raise_for_status()
-					
-					getTargetGroupData = response.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = targetIDList
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
+				#Set Variables if Data Available
+				if len(str(groupRecord['id'])) == 0:
+					mygroupMembershipId = ''
+				else:
+					mygroupMembershipId = int(groupRecord['id'])	
 					
 					
-				return getTargetGroupData
-			
-			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Targets))
-				
+				groupMembershipName = groupRecord['name']
+				groupMembershipIsSmart = groupRecord['is_smart']
 				
-			#print(list_of_policies)	
+				print(f"..............Working on Computer Group: {groupMembershipName}, for Computer ID: " + getMycomputerRecordGeneralID)
 				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+				response_list.append((mygroupMembershipId, groupMembershipName, groupMembershipIsSmart))
 			
-			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Targets))
-				
-				
 			#print(response_list)
+
+
 			
 			
 			for response in response_list:
-			##	# Make sure to refresh variables for each loop
-				myTargetsComputerGroupInfo = response['computer_group']
-				
-				
-				#Set Variables if Data Available
-				if len(str(myTargetsComputerGroupInfo['id'])) == 0:
-					myTargetsComputerGroupInfoID = ''
-				else:
-					myTargetsComputerGroupInfoID = int(myTargetsComputerGroupInfo['id'])
-					
-				# Get info for Policies
-				print(f"Working on Target Group ID: {myTargetsComputerGroupInfoID}")
+				# Make sure to refresh variables for each loop
+				myComputerID = mycomputerRecordGeneralID
+				myComputerName = mycomputerRecordGeneral['name']
+				myGroupMemberID = response[0] 
+				myGroupMemberName = response[1] 
+				myGroupIsSmart = response[2]
 				
+				#print(f"My Group info: {response}")	
 				
-				appendDataToCVS_JAMF_Policy_Target_Group_Info = "{'Type':'Policy Computer Target Group',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
+				appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Type':'Computer Group Membership Info',\
 				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				'Computer ID':myComputerID,\
 				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				'Computer Name':myComputerName,\
 				\
-				'Policy Target Group ID':myTargetsComputerGroupInfoID,\
+				'Computer Group Membership Group ID':myGroupMemberID,\
 				\
-				'Policy Target Group Name':myTargetsComputerGroupInfo['name'],\
+				'Computer Group Membership Group Name':myGroupMemberName,\
 				\
-				'Policy Target Group is Smart':str(myTargetsComputerGroupInfo['is_smart'])}"
+				'Computer Group Membership Group Is Smart':myGroupIsSmart}"
 				
-				appendJAMF_Policy_Target_Group_Info = eval(appendDataToCVS_JAMF_Policy_Target_Group_Info)
-				appendtargetsGroupsColumns = appendJAMF_Policy_Target_Group_Info
+				
+				appendJAMF_Computers_Info_Computer_Group_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
+				appendComputerGroupMembershipColumns = appendJAMF_Computers_Info_Computer_Group_Membership
 				
 				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, appendtargetsGroupsColumns, exclusionColumns, packageColumns, scriptsColumns)
+				Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, appendComputerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 				
 				#Set CSV File
-				dataToCsvPolicy.append(Combined)
+				dataToCsvComputers.append(Combined)
 				
 				
-		if get_JAMF_Policy_Info_Exclusions == ("yes"):
-			##########################################################################################
-			# Get info for exclusion Computers
+		if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == 'yes':
+			##########################################################################################		
+			# Get info for Computer Configuration Profile Membership	
 			##########################################################################################
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
+			print(".......Working on Configuration Profile Membership for Computer ID: " + getMycomputerRecordGeneralID)
 			
-			token = http.post(url, headers=btHeaders)
+			#Get Info from record
+			computerConfigurationProfileMembership = mycomputerConfigurationProfileMembership
 			
-			bearer = token.json()['token']
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			list_of_config_profiles_ID = []
+			
+			for ConfigProfile in computerConfigurationProfileMembership :
+				if ConfigProfile['id'] > 0:
+					configurationProfileID = str(ConfigProfile['id'])
+					list_of_config_profiles_ID.append(f'{configurationProfileID}')
+					
+					
+			# Look up each profile in the configuration profile index, profiles that no longer exist are left out
+			profileIndex = getConfigurationProfileIndex()
 			
+			response_list = []
 			
-			for exclusion in myPolicyScopeExclusionsComputers:
+			for configProfileID in list_of_config_profiles_ID:
+				profileRecord = profileIndex.get(configProfileID)
 				
-				#Set Variables if Data Available
-				if len(str(exclusion['id'])) == 0:
-					exclusionID = ''
-				else:
-					exclusionID = int(exclusion['id'])
-					
-				# Get info for Policies
-				print(f"Working on Target Group ID: {exclusionID}")
+				if profileRecord is None:
+					print(f".......We found that Record: {configProfileID}, does not exist in your JAMF Instance at URL: {JAMF_url}/JSSResource/osxconfigurationprofiles")
+					continue
 				
+				myConfigurationProfileGeneralID = profileRecord['id']
+				myConfigurationProfileGeneralName = profileRecord['name']
 				
-				appendDataToCVS_JAMF_Policy_Exclusion_Info = "{'Type':'Policy Computer Exclusions',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
+				print(f"..............Working on Configuration Profile ID: {myConfigurationProfileGeneralID}, for Computer ID: " + getMycomputerRecordGeneralID)
+				
+				response_list.append((myConfigurationProfileGeneralID, myConfigurationProfileGeneralName))
+				
+			#print(response_list)
+				
+				
+			for response in response_list:
+				# Make sure to refresh variables for each loop
+				myComputerID = mycomputerRecordGeneralID
+				myComputerName = mycomputerRecordGeneral['name']
+				myConfigProfileID = response[0] 
+				myConfigProfileName = response[1] 
+			
+				#print(f"My Group info: {response}")
+			
+				appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Type':'Computer Configuration Profile Membership Info',\
 				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				'Computer ID':myComputerID,\
 				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				'Computer Name':myComputerName,\
 				\
-				'Policy Exclusion Computer ID':exclusionID,\
+				'Computer Configuration Profile Membership ID':myConfigProfileID,\
 				\
-				'Policy Exclusion Computer Name':exclusion['name']}"
+				'Computer Configuration Profile Membership Name':myConfigProfileName}"
 				
-				appendJAMF_Policy_Exclusion_Info = eval(appendDataToCVS_JAMF_Policy_Exclusion_Info)
-				appendExclusionColumns = appendJAMF_Policy_Exclusion_Info
+				
+				appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
+				appendComputerConfigurationProfileMembershipColumns = appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership
 				
 				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, appendExclusionColumns, packageColumns, scriptsColumns)
+				Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, appendComputerConfigurationProfileMembershipColumns)
 				
 				#Set CSV File
-				dataToCsvPolicy.append(Combined)
-				
-				
-			##########################################################################################
-			# Get Info for Computer Exclusions groups
-			##########################################################################################
-			# Start New MultiProcess Code here
-				
-			list_of_Exclusions = []
+				dataToCsvComputers.append(Combined)
 			
-			for exclusion in myPolicyScopeExclusionsComputerGroups:
-				exclusionID = str(exclusion['id']) 
-				list_of_Exclusions.append(f'{exclusionID}')
-				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
+		
+	else:		
+		
+		#Run for smart group on no filter
+		# Set up urls for getting information from each computer ID from JAMF API
+		computerRecordURLs = [JAMF_url + "/JSSResource/computers/id/" + str(computerRecord['id']) for computerRecord in computerRecords]
+		
+		# Computer records are fetched in batches ahead of the loop
+		if INCREMENTAL_COMPUTERS:
+			computerSnapshot = ComputerSnapshot(snapshotStore)
+			computerResponses = computerSnapshot.iterComputerResponses(JAMF_url, computerRecords, btHeaders)
 			
-			token = http.post(url, headers=btHeaders)
+		else:
+			computerResponses = fetchEngine.iterGet(computerRecordURLs, headers=btHeaders)
 			
-			bearer = token.json()['token']
+			if SNAPSHOTS_ENABLED:
+				computerSnapshot = ComputerSnapshot(snapshotStore)
+				computerResponses = computerSnapshot.iterRecorded(computerRecords, computerResponses)
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+		# Local account names of each batch are checked in LDAP before the batch is processed
+		if includeLocalAccountInfo == "yes" and includeLocalAccountInfoLDAP == "yes":
+			computerResponses = ldapUserCache.iterPrefetched(computerResponses)
 			
+		# Computers whose record could not be fetched
+		failedComputerIDs = []
+		
+		for computerRecord, response in zip(computerRecords, computerResponses):
 			
-			def get_clean_List(url, exclusionIDList):
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{exclusionIDList}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_Exclusions.remove(exclusionIDList)
-					
-					
-					
-			def get_url(url, exclusionIDList):
-				
-				getExclusionGroupData = ''
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{exclusionIDList}")
-				
-				try:
-					
-					response = http.get(myURL, headers=btHeaders)
-					
-					response.raise_for_status()
-					
-					getExclusionGroupData = response.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = exclusionIDList
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				return getExclusionGroupData
+			# Get ID to do JAMF API lookup
+			computerRecordID = str(computerRecord['id'])
+			
+			#For Testing
+			#print(computerRecordID)
 			
+			computerRecordProfile = None
 			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Exclusions))
+			try:
+				response.raise_for_status()
+				
+				computerRecordProfile = response.json()
+				
+			except HTTPError as http_err:
+				print(f'HTTP error occurred: {http_err}')
+			except Exception as err:
+				print(f'Other error occurred: {err}')
 				
+			# The record is missing from this run, say so in the report and go on to the next computer
+			if computerRecordProfile is None:
+				failedComputerIDs.append(computerRecordID)
 				
-			#print(list_of_policies)	
+				appendJAMF_Computers_Not_Retrieved_Info = {'Type':'Record Not Retrieved', 'Computer ID':int(computerRecordID), 'Computer Name':computerRecord.get('name', '')}
 				
+				if usingFilter == 'smartGroupFilter':
+					appendJAMF_Computers_Not_Retrieved_Info = {'Computer SmartGroup ID':smartGroupRecordID, 'Computer SmartGroup Name':smartGroupRecordName} | appendJAMF_Computers_Not_Retrieved_Info
+					
+				#Set CSV File
+				dataToCsvComputers.append(appendJAMF_Computers_Not_Retrieved_Info)
+				continue
 				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
 			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
+			# For Testing
+			#print(computerRecordProfile)
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			#General Element for ID and Catagory
+			mycomputerRecordGeneral = computerRecordProfile['computer']['general']
+			mycomputerRecordHardware = computerRecordProfile['computer']['hardware']
+			mycomputerRecordHardwareFileVault2Users = computerRecordProfile['computer']['hardware']['filevault2_users']
+			mycomputerRecordHardwareLocalAccounts = computerRecordProfile['computer']['groups_accounts']['local_accounts']
+			mycomputerRecordComputerGroupMembership = computerRecordProfile['computer']['groups_accounts']['computer_group_memberships']
+			mycomputerConfigurationProfileMembership = computerRecordProfile['computer']['configuration_profiles']
 			
 			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Exclusions))
-				
-				
-			#print(response_list)
+			##########################################################################################
+			# Process ConfigurationProfile information for csv / Excel
+			##########################################################################################
+			# Individual Computers Info for each record
+			getMycomputerRecordGeneralID = (str(mycomputerRecordGeneral['id']) + " - " + mycomputerRecordGeneral['name'])
 			
+			# Get info for Policies
+			print("Working on Computer ID: " + getMycomputerRecordGeneralID)
 			
-			for response in response_list:
-			##	# Make sure to refresh variables for each loop
-				myExclusionsComputerGroupInfo = response['computer_group']
+			#Set Variables if Data Available
+			if len(str(mycomputerRecordGeneral['id'])) == 0:
+				mycomputerRecordGeneralID = ''
+			else:
+				mycomputerRecordGeneralID = int(mycomputerRecordGeneral['id'])
 				
-				#Set Variables if Data Available
-				if len(str(myExclusionsComputerGroupInfo['id'])) == 0:
-					myExclusionsComputerGroupInfoID = ''
-				else:
-					myExclusionsComputerGroupInfoID = int(myExclusionsComputerGroupInfo['id'])
-					
-				# Get info for Policies
-				print(f"Working on Exclusion Group ID: {myExclusionsComputerGroupInfoID}")
+		
+			# Set Variables for Dict for Computers Info
+			if usingFilter == 'computerFilter':
+				
+				appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
+				\
+				'Computer ID':mycomputerRecordGeneralID,\
+				\
+				'Computer Name':mycomputerRecordGeneral['name'],\
+				\
+				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
+				\
+				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
+				\
+				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
 				
+			elif usingFilter == 'smartGroupFilter':
 				
-				appendDataToCVS_JAMF_Policy_Exclusion_Group_Info = "{'Type':'Policy Computer Exclusions Group',\
+				appendDataToCVS_JAMF_Computers_Info = "{'Computer SmartGroup ID':smartGroupRecordID,\
 				\
-				'Policy ID':myPolicyGeneralID,\
+				'Computer SmartGroup Name':smartGroupRecordName,\
 				\
-				'Policy Name':myPolicyGeneral['name'],\
+				'Type':'Computer Info',\
 				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				'Computer ID':mycomputerRecordGeneralID,\
 				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				'Computer Name':mycomputerRecordGeneral['name'],\
 				\
-				'Policy Exclusion Group id':myExclusionsComputerGroupInfoID,\
+				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
 				\
-				'Policy Exclusion Group Name':myExclusionsComputerGroupInfo['name'],\
+				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
 				\
-				'Policy Exclusion Group is Smart':str(myExclusionsComputerGroupInfo['is_smart'])}"
+				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
 				
-				appendJAMF_Policy_Exclusion_Info = eval(appendDataToCVS_JAMF_Policy_Exclusion_Group_Info)
-				appendExclusionGroupsColumns = appendJAMF_Policy_Exclusion_Info
+			elif usingFilter == 'noFilter':
 				
-				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, appendExclusionGroupsColumns, packageColumns, scriptsColumns)
+				appendDataToCVS_JAMF_Computers_Info = "{'Type':'Computer Info',\
+				\
+				'Computer ID':mycomputerRecordGeneralID,\
+				\
+				'Computer Name':mycomputerRecordGeneral['name'],\
+				\
+				'Computer Serial Number':str(mycomputerRecordGeneral['serial_number']),\
+				\
+				'Computer Last Check-in':str(mycomputerRecordGeneral['last_contact_time']),\
+				\
+				'Computer Site Info':str(mycomputerRecordGeneral['site']['name'])}"
 				
-				#Set CSV File
-				dataToCsvPolicy.append(Combined)
 				
-		if get_JAMF_Policy_Info_Packages == ("yes"):		
-			##########################################################################################
-			#Get Info for Packages in Policy
-			##########################################################################################	
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
+			appendJAMF_Computers_Info = eval(appendDataToCVS_JAMF_Computers_Info)
+			appendComputerColumns = appendJAMF_Computers_Info
 			
-			bearer = token.json()['token']
+			#Set Columns	
+			Combined = MergeComputersInfo(appendComputerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			#Set CSV File
+			dataToCsvComputers.append(Combined)	
 			
 			
-			# Start New MultiProcess Code here
+			if get_JAMF_Computers_Info_Hardware == ("yes"):
+				##########################################################################################		
+				# Get info for Hardware	
+				##########################################################################################
+				formatMyComputerRecordHardwareOSBuild = f"\"{mycomputerRecordHardware['os_build']}\""
+				
+				appendDataToCVS_JAMF_Computers_Hardware_Info = "{'Type':'Computer Hardware Info',\
+				\
+				'Computer ID':mycomputerRecordGeneralID,\
+				\
+				'Computer Name':mycomputerRecordGeneral['name'],\
+				\
+				'Computer Make':mycomputerRecordHardware['make'],\
+				\
+				'Computer Model':mycomputerRecordHardware['model'],\
+				\
+				'Computer Model Identifier':mycomputerRecordHardware['model_identifier'],\
+				\
+				'Computer OS Name':mycomputerRecordHardware['os_name'],\
+				\
+				'Computer OS Version':str(mycomputerRecordHardware['os_version']),\
+				\
+				'Computer OS Build':formatMyComputerRecordHardwareOSBuild}"	
+				
+				appendJAMF_Computers_Hardware_Info = eval(appendDataToCVS_JAMF_Computers_Hardware_Info)
+				appendComputerHardwareColumns = appendJAMF_Computers_Hardware_Info
+				
+				#Set Columns	
+				Combined = MergeComputersInfo(computerColumns, appendComputerHardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+				
+				#Set CSV File
+				dataToCsvComputers.append(Combined)	
+					
 			
-			list_of_Packages = []
+			if get_JAMF_Computers_Info_FileVault2_Users == ("yes"):
+				##########################################################################################		
+				# Get info for FileVautl2	
+				##########################################################################################
+				for FileVault2User in mycomputerRecordHardwareFileVault2Users :
+					
+					appendDataToCVS_JAMF_Computers_FileVault2_Info = "{'Type':'Computer Hardware FileVault2 Info',\
+					\
+					'Computer ID':mycomputerRecordGeneralID,\
+					\
+					'Computer Name':mycomputerRecordGeneral['name'],\
+					\
+					'Computer FileVault2 User':FileVault2User}"
+					
+					appendJAMF_Computers_FileVault2_Info = eval(appendDataToCVS_JAMF_Computers_FileVault2_Info)
+					appendComputerFileVault2Columns = appendJAMF_Computers_FileVault2_Info
+					
+					#Set Columns	
+					Combined = MergeComputersInfo(computerColumns, hardwareColumns, appendComputerFileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+					
+					#Set CSV File
+					dataToCsvComputers.append(Combined)	
 			
-			for package in myPackagesInfo:
-				packageID = str(package['id']) 
-				list_of_Packages.append(f'{packageID}')
 				
+			if get_JAMF_Computers_Info_Local_Account == ("yes"):
+				##########################################################################################		
+				# Get info for Local Accounts	
+				##########################################################################################
+				for computerLocalAccount in mycomputerRecordHardwareLocalAccounts:
+					
+					# Put current data into variable to filter
+					filterComputerLocalAccountData = computerLocalAccount['name']
+					
+					# Regex Pattern
+					filterPattern = r"^((?![_/][a-zA-Z]*))"
+					filterDefaultUserAccountsListdata = filterDefaultUserAccountsList
+					
+					if re.match(filterPattern, filterComputerLocalAccountData): #Check if regex is correct
+					
+						if filterComputerLocalAccountData not in filterDefaultUserAccountsListdata :
+							
+							verifyLocalAccountIsAdmin = computerLocalAccount['administrator']
+							computerLocalAccountName = computerLocalAccount['name']
+							computerLocalAccountRealName = computerLocalAccount['realname']
+							
+							#Set Variables if Data Available
+							if len(str(computerLocalAccount['uid'])) == 0:
+								computerLocalAccountUID = ''
+							else:
+								computerLocalAccountUID = int(computerLocalAccount['uid'])
+								
+							computerLocalAccountIsAdmin = verifyLocalAccountIsAdmin
+							computerInInLDAP = "false"
+							
+							if includeLocalAccountInfoLDAP == "yes":
+								
+								# Looked up ahead for the whole batch, each name only once per run
+								verifyLocalAccount = ldapUserCache.get(filterComputerLocalAccountData)
+								
+								if verifyLocalAccount is None:
+									continue
+									
+								
+								# For Testing
+								#print(verifyLocalAccount)
+								
+								verifidLocalAccountRecords = verifyLocalAccount['ldap_users']
+								#verifidLocalAccountRecords.sort(key=lambda item: item.get('id'), reverse=False)
+								
+								for localAccountRecord in verifidLocalAccountRecords :
+									
+									#print(localAccountRecord['username'])
+									
+									#Set Variables if Data Available
+									if len(str(localAccountRecord['uid'])) == 0:
+										computerLocalAccountUID = ''
+									else:
+										computerLocalAccountUID = int(localAccountRecord['uid'])
+										
+									
+									computerInInLDAP = "true"
+									
+						
+							appendDataToCVS_JAMF_Computers_Local_Account_Info = "{'Type':'Computer Hardware Local Account Info',\
+							\
+							'Computer ID':mycomputerRecordGeneralID,\
+							\
+							'Computer Name':mycomputerRecordGeneral['name'],\
+							\
+							'Computer Local Account Name':computerLocalAccountName,\
+							\
+							'Computer Local Account Real Name':computerLocalAccountRealName,\
+							\
+							'Computer Local Account ID':computerLocalAccountUID,\
+							\
+							'Computer Local Account is Admin ':computerLocalAccountIsAdmin,\
+							\
+							'Computer Local Account in LDAP ':computerInInLDAP}"
+						
+							
+							appendJAMF_Computers_Local_Account_Info = eval(appendDataToCVS_JAMF_Computers_Local_Account_Info)
+							appendLocalAccountColumns = appendJAMF_Computers_Local_Account_Info
+						
+							#Set Columns	
+							Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, appendLocalAccountColumns, computerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
+						
+							#Set CSV File
+							dataToCsvComputers.append(Combined)	
+							
+							
+			if get_JAMF_Computers_Info_Computer_Group_Membership == 'yes':
+				##########################################################################################		
+				# Get info for Computer Group Membership	
+				##########################################################################################
+				print(".......Getting Computer Group Info for Computer ID: " + getMycomputerRecordGeneralID)
 				
-			def get_clean_List(url, packageIDList):
+				#Get Info from record
+				computerGroupMembershipRecords = mycomputerRecordComputerGroupMembership
 				
-				myURL = (f"{url}/JSSResource/packages/id/{packageIDList}")
 				
-				test = http.get(myURL, headers=btHeaders)
+				list_of_groups = []
 				
-				if test.status_code != 200:
-					list_of_Packages.remove(packageIDList)
-					
+				for groupName in computerGroupMembershipRecords :
+					list_of_groups.append(f'{groupName}')
 					
 					
-			def get_url(url, packageIDList):
 				
-				getPackageData = ''
 				
-				myURL = (f"{url}/JSSResource/packages/id/{packageIDList}")
+				# Look up each group in the computer group index, groups that no longer exist are left out
+				response_list = []
 				
-				try:
-					
-					response = http.get(myURL, headers=btHeaders)
-					
-					response.raise_for_status()
-					
-					getPackageData = response.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
+				for groupName in list_of_groups:
+					groupRecord = computerGroupIndex.get(groupName)
 					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = packageIDList
-					myMissingRecordURL = split_My_http_err[5]
+					if groupRecord is None:
+						print(f".......We found that Record: {groupName}, does not exist in your JAMF Instance at URL: {JAMF_url}/JSSResource/computergroups")
+						continue
 					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
+					#Set Variables if Data Available
+					if len(str(groupRecord['id'])) == 0:
+						mygroupMembershipId = ''
 					else:
-						print(f'HTTP error occurred: {http_err}')
+						mygroupMembershipId = int(groupRecord['id'])	
 						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				return getPackageData
-			
-			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Packages))
-				
-				
-			#print(list_of_policies)
-				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Packages))
-				
-				
-			#print(response_list)
-			
-			
-			for response in response_list:
-				myPackageInfo = response['package']
-				
-				formatMyPackageInfoCatagory = f"\"{myPackageInfo['category']}\""
-				
-				#Set Variables if Data Available
-				if len(str(myPackageInfo['id'])) == 0:
-					myPackageInfoID = ''
-				else:
-					myPackageInfoID = int(myPackageInfo['id'])
+						
+					groupMembershipName = groupRecord['name']
+					groupMembershipIsSmart = groupRecord['is_smart']
 					
+					print(f"..............Working on Computer Group: {groupMembershipName}, for Computer ID: " + getMycomputerRecordGeneralID)
 					
-				# Get info for Policies
-				print(f"Working on Package ID: {myPackageInfoID}")
-				
-				
-				appendDataToCVS_JAMF_Policy_Packages_Info = "{'Type':'Policy Package',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
-				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
-				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
-				\
-				'Policy Package ID':myPackageInfoID,\
-				\
-				'Policy Package Name':myPackageInfo['name'],\
-				\
-				'Policy Package Category Name':formatMyPackageInfoCatagory,\
-				\
-				'Policy Package Filename':myPackageInfo['filename']}"
-				
-				appendJAMF_Policy_Packages_Info = eval(appendDataToCVS_JAMF_Policy_Packages_Info)
-				appendPackageColumns = appendJAMF_Policy_Packages_Info
-				
-				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, exclusionColumns, appendPackageColumns, scriptsColumns)
-				
-				#Set CSV File
-				dataToCsvPolicy.append(Combined)
-				
-				
-		if get_JAMF_Policy_Info_Scripts == ("yes"):		
-			##########################################################################################
-			#Get Info for scripts in Policy
-			##########################################################################################
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			# Start New MultiProcess Code here
-			
-			list_of_Scripts = []
-			
-			for script in myScriptInfo:
-				scriptID = str(script['id'])
-				list_of_Scripts.append(f'{scriptID}')
-				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			def get_clean_List(url, scriptIDList):
-				
-				myURL = (f"{url}/JSSResource/scripts/id/{scriptIDList}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_Scripts.remove(scriptIDList)
+					response_list.append((mygroupMembershipId, groupMembershipName, groupMembershipIsSmart))
 					
+				#print(response_list)
 					
 					
-			def get_url(url, scriptIDList):
-				
-				getScriptData = ''
 				
-				myURL = (f"{url}/JSSResource/scripts/id/{scriptIDList}")
 				
-				try:
+				for response in response_list:
+					# Make sure to refresh variables for each loop
+					myComputerID = mycomputerRecordGeneralID
+					myComputerName = mycomputerRecordGeneral['name']
+					myGroupMemberID = response[0] 
+					myGroupMemberName = response[1] 
+					myGroupIsSmart = response[2]
 					
-					response = http.get(myURL, headers=btHeaders)
+					#print(f"My Group info: {response}")	
 					
-					response.raise_for_status()
+					appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership = "{'Type':'Computer Group Membership Info',\
+					\
+					'Computer ID':myComputerID,\
+					\
+					'Computer Name':myComputerName,\
+					\
+					'Computer Group Membership Group ID':myGroupMemberID,\
+					\
+					'Computer Group Membership Group Name':myGroupMemberName,\
+					\
+					'Computer Group Membership Group Is Smart':myGroupIsSmart}"
 					
-					getScriptData = response.json()
 					
-				except HTTPError as http_err:
+					appendJAMF_Computers_Info_Computer_Group_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Group_Membership)
+					appendComputerGroupMembershipColumns = appendJAMF_Computers_Info_Computer_Group_Membership
 					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
+					#Set Columns	
+					Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, appendComputerGroupMembershipColumns, computerConfigurationProfileMembershipColumns)
 					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = scriptIDList
-					myMissingRecordURL = split_My_http_err[5]
+					#Set CSV File
+					dataToCsvComputers.append(Combined)
 					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
 					
 					
-				return getScriptData
-			
-			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Scripts))
-				
-				
-			#print(list_of_policies)	
+			if get_JAMF_Computers_Info_Computer_Configuration_Profile_Membership == 'yes':
+				##########################################################################################		
+				# Get info for Computer Configuration Profile Membership	
+				##########################################################################################
+				print(".......Working on Configuration Profile Membership for Computer ID: " + getMycomputerRecordGeneralID)
 				
+				#Get Info from record
+				computerConfigurationProfileMembership = mycomputerConfigurationProfileMembership
 				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Scripts))
+
 				
+				list_of_config_profiles_ID = []
 				
-			#print(response_list)
+				for ConfigProfile in computerConfigurationProfileMembership :
+					if ConfigProfile['id'] > 0:
+						configurationProfileID = str(ConfigProfile['id'])
+						list_of_config_profiles_ID.append(f'{configurationProfileID}')
 						
-			
-			for response in response_list:
-				myScriptInfo = response['script']
+						
+				# Look up each profile in the configuration profile index, profiles that no longer exist are left out
+				profileIndex = getConfigurationProfileIndex()
 				
-				formatMyScriptsinfoCatagory = f"\"{myScriptInfo['category']}\""
+				response_list = []
 				
-				#Set Variables if Data Available
-				if len(str(myScriptInfo['id'])) == 0:
-					myScriptInfoID = ''
-				else:
-					myScriptInfoID = int(myScriptInfo['id'])
+				for configProfileID in list_of_config_profiles_ID:
+					profileRecord = profileIndex.get(configProfileID)
 					
-				# Get info for Policies
-				print(f"Working on Script ID: {myScriptInfoID}")
-				
-				appendDataToCVS_JAMF_Policy_Scripts_Info = "{'Type':'Policy Scripts',\
-				\
-				'Policy ID':myPolicyGeneralID,\
-				\
-				'Policy Name':myPolicyGeneral['name'],\
-				\
-				'Policy Category ID':myPolicyGeneralCatagoryID,\
-				\
-				'Policy Category Name':formatMyPolicyGeneralCatagory,\
-				\
-				'Policy Script ID':myScriptInfoID,\
-				\
-				'Policy Script Name':myScriptInfo['name'],\
-				\
-				'Policy Script Category Name':formatMyScriptsinfoCatagory,\
-				\
-				'Policy Script Filename':myScriptInfo['filename']}"
-				
-				
-				appendJAMF_Policy_Scripts_Info = eval(appendDataToCVS_JAMF_Policy_Scripts_Info)
-				appendScriptsColumns = appendJAMF_Policy_Scripts_Info
-				
-				#Set Columns	
-				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, exclusionColumns, packageColumns, appendScriptsColumns)
-				
-				#Set CSV File
-				dataToCsvPolicy.append(Combined)
-				
-				
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
-	
-	
-	# Process List
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		list(pool.map(processData,response_list))
-
-
-##########################################################################################
-# Configuration Profiles Section
-##########################################################################################			
-if get_JAMF_Configuration_Profile_Info == ("yes"):
-	
-	##########################################################################################
-	# Process Configuration Profilesinformation for csv / Excel
-	##########################################################################################
-	# Set up url for getting a list of all Configuration Profiles from JAMF API
-	url = JAMF_url + "/JSSResource/osxconfigurationprofiles"
-	
-	try:
-		response = http.get(url, headers=btHeaders)
-		
-		response.raise_for_status()
-		
-		resp = response.json()
-		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')
-	
-	# For Testing
-	#print(response.json())
-	
-	configurationProfiles = resp['os_x_configuration_profiles']
-	
-	configurationProfiles.sort(key=lambda item: item.get('id'), reverse=False)
-	
-
-	
-	list_of_configuration_profiles = []
-	
-	for configurationProfile in configurationProfiles :
-		configurationProfileID = str(configurationProfile['id']) 
-		list_of_configuration_profiles.append(f'{configurationProfileID}')
-		
-		
-		#Renew token because the report is a long process
-		#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
-	
-	
-	def get_clean_List(url, configurationProfileIDList):
-		
-		myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configurationProfileIDList}")
-		
-		test = http.get(myURL, headers=btHeaders)
-		
-		if test.status_code != 200:
-			list_of_configuration_profiles.remove(configurationProfileIDList)
-			
-			
-			
-	def get_url(url, configurationProfileIDList):
-		
-		getConfigurationProfile = ''
-		
-		myURL = (f"{url}/JSSResource/osxconfigurationprofiles/id/{configurationProfileIDList}")
-		
-		try:
-			
-			response = http.get(myURL, headers=btHeaders)
-			
-			response.raise_for_status()
-			
-			getConfigurationProfile = response.json()
-			
-		except HTTPError as http_err:
-			
-			# Process HTTP Error
-			check_http_err = str(http_err)
-			split_My_http_err = check_http_err.split()
+					if profileRecord is None:
+						print(f".......We found that Record: {configProfileID}, does not exist in your JAMF Instance at URL: {JAMF_url}/JSSResource/osxconfigurationprofiles")
+						continue
+					
+					myConfigurationProfileGeneralID = profileRecord['id']
+					myConfigurationProfileGeneralName = profileRecord['name']
+					
+					print(f"..............Working on Configuration Profile ID: {myConfigurationProfileGeneralID}, for Computer ID: " + getMycomputerRecordGeneralID)
+					
+					response_list.append((myConfigurationProfileGeneralID, myConfigurationProfileGeneralName))
+					
+				#print(response_list)
+					
+					
+				for response in response_list:
+					# Make sure to refresh variables for each loop
+					myComputerID = mycomputerRecordGeneralID
+					myComputerName = mycomputerRecordGeneral['name']
+					myConfigProfileID = response[0] 
+					myConfigProfileName = response[1] 
+					
+					#print(f"My Group info: {response}")
+					
+					appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership = "{'Type':'Computer Configuration Profile Membership Info',\
+					\
+					'Computer ID':myComputerID,\
+					\
+					'Computer Name':myComputerName,\
+					\
+					'Computer Configuration Profile Membership ID':myConfigProfileID,\
+					\
+					'Computer Configuration Profile Membership Name':myConfigProfileName}"
+					
+					
+					appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership = eval(appendDataToCVS_JAMF_Computers_Info_Computer_Configuration_Profile_Membership)
+					appendComputerConfigurationProfileMembershipColumns = appendJAMF_Computers_Info_Computer_Configuration_Profile_Membership
+					
+					#Set Columns	
+					Combined = MergeComputersInfo(computerColumns, hardwareColumns, FileVault2Columns, LocalAccountColumns, computerGroupMembershipColumns, appendComputerConfigurationProfileMembershipColumns)
+					
+					#Set CSV File
+					dataToCsvComputers.append(Combined)
+						
+						
+		if failedComputerIDs:
+			print(f"\n.......Computer records for ID: {', '.join(failedComputerIDs)}, could not be retrieved and are listed as Record Not Retrieved in the report\n")
 			
-			myHttpError = split_My_http_err[0]
-			myMissingRecordID = configurationProfileIDList
-			myMissingRecordURL = split_My_http_err[5]
+		if INCREMENTAL_COMPUTERS:
+			computerSnapshot.printStats()
 			
-			if myHttpError == '404':
-				print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
+		if includeLocalAccountInfo == "yes" and includeLocalAccountInfoLDAP == "yes":
+			ldapUserCache.printStats()
 				
-			else:
-				print(f'HTTP error occurred: {http_err}')
 				
-		except Exception as err:
-			print(f'Other error occurred: {err}')
-			
-			
-		return getConfigurationProfile
-	
-	
-	# Clean List
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		get_data = partial(get_clean_List, JAMF_url)
-		list(pool.map(get_data,list_of_configuration_profiles))
-		
-		
-	#print(list_of_policies)
-		
-		
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
-	
-	
-	# Process List	
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		get_data = partial(get_url, JAMF_url)
-		response_list = list(pool.map(get_data,list_of_configuration_profiles))
+##################################################
+# Process Requested Info for Policies
+##################################################
+
+if get_JAMF_Policy_Info == ("yes"):
+	# Get every policy record once, shared with the Package and Script to Policies sections
+	response_list = entityStore.getAllRecords('policies')
 		
-		#print(response_list)
+	#print(response_list)
 		
 		
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
 	
 	
-	def processData(response):
-		global btHeaders
-		# Make sure to refresh variables for each loop
+	async def processData(response):
+	##	# Make sure to refresh variables for each loop
 		#General Element for ID and Catagory
-		myConfigurationProfileGeneral = response['os_x_configuration_profile']['general']
-		myConfigurationProfileGeneralCatagory = response['os_x_configuration_profile']['general']['category']
+		myPolicyGeneral = response['policy']['general']
+		myPolicyGeneralCatagory = response['policy']['general']['category']
 		
 		#Scope Element for Computer Targets
-		myConfigurationProfileScopeTargetsAllComputers = response['os_x_configuration_profile']['scope']['all_computers']
-		myConfigurationProfileScopeTargetsComputers = response['os_x_configuration_profile']['scope']['computers']
-		myConfigurationProfileScopeTargetsComputerGroups = response['os_x_configuration_profile']['scope']['computer_groups']
+		myPolicyScopeTargetsAllComputers = response['policy']['scope']['all_computers']
+		myPolicyScopeTargetsComputers = response['policy']['scope']['computers']
+		myPolicyScopeTargetsComputerGroups = response['policy']['scope']['computer_groups']
 		
 		#Scope Element For Limitation
-		myConfigurationProfileScopeLimitationsUsers = response['os_x_configuration_profile']['scope']['limitations']['users']
-		myConfigurationProfileScopeLimitationsUserGroups = response['os_x_configuration_profile']['scope']['limitations']['user_groups']
+		#myPolicyScopeLimitationsUsers = getPolicy['policy']['scope']['limitations']['users']
+		#myPolicyScopeLimitationsUserGroups = getPolicy['policy']['scope']['limitations']['user_groups']
 		
 		#Scope Element For Exclusions
-		myConfigurationProfileScopeExclusionsComputers = response['os_x_configuration_profile']['scope']['exclusions']['computers']
-		myConfigurationProfileScopeExclusionsComputerGroups = response['os_x_configuration_profile']['scope']['exclusions']['computer_groups']
+		myPolicyScopeExclusionsComputers = response['policy']['scope']['exclusions']['computers']
+		myPolicyScopeExclusionsComputerGroups = response['policy']['scope']['exclusions']['computer_groups']
+		
+		
+		#Package Element
+		myPackagesInfo = response['policy']['package_configuration']['packages']
+		
+		
+		#Script Elements
+		myScriptInfo = response['policy']['scripts']
+		
+		#SelfService Element
+		mySelfServiceInfo = response['policy']['self_service']
+		useForSelfService = str(mySelfServiceInfo['use_for_self_service'])
 		
 		
 		##########################################################################################
-		# Process ConfigurationProfile information for csv / Excel
+		# Process Policy information for csv / Excel
 		##########################################################################################
 		
-		# Individual ConfigurationProfile Info for each record
-		getMyConfigurationProfileID = (str(myConfigurationProfileGeneral['id']) + " - " + myConfigurationProfileGeneral['name'])
-		getMyConfigurationProfileGeneralCatagory = (str(myConfigurationProfileGeneralCatagory['id']) + " - " + myConfigurationProfileGeneralCatagory['name'])
+		# Individual Policy Info for each record
+		getMyPolicyID = (str(myPolicyGeneral['id']) + " - " + myPolicyGeneral['name'])
+		getMyPolicyGeneralCatagory = (str(myPolicyGeneralCatagory['id']) + " - " + myPolicyGeneralCatagory['name'])
 		
 		# Get info for Policies
-		print("Working on Configuration Profile ID: " + getMyConfigurationProfileID)
-		
-		formatMyConfigurationProfileGeneralCatagory = f"\"{myConfigurationProfileGeneralCatagory['name']}\""
+		print("Working on Policy ID: " + getMyPolicyID)
 		
 		#Set Variables if Data Available
-		if len(str(myConfigurationProfileGeneral['id'])) == 0:
-			myConfigurationProfileGeneralID = ''
+		if len(str(myPolicyGeneral['id'])) == 0:
+			myPolicyGeneralID = ''
 		else:
-			myConfigurationProfileGeneralID = int(myConfigurationProfileGeneral['id'])
+			myPolicyGeneralID = int(myPolicyGeneral['id'])
 			
-		#Set Variables if Data Available
-		if len(str(myConfigurationProfileGeneralCatagory['id'])) == 0:
-			myConfigurationProfileGeneralCatagoryID = ''
+		if len(str(myPolicyGeneralCatagory['id'])) == 0:
+			myPolicyGeneralCatagoryID = ''
 		else:
-			myConfigurationProfileGeneralCatagoryID = int(myConfigurationProfileGeneralCatagory['id'])
-			
+			myPolicyGeneralCatagoryID = int(myPolicyGeneralCatagory['id'])
 			
-		# Set Variables for Dict for Configuration Profile Info
-		appendDataToCVS_JAMF_Configuration_Profile_Info = "{'Configuration Profile Type':'Configuration Profile',\
-		\
-		'Configuration Profile ID':myConfigurationProfileGeneralID,\
-		\
-		'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
-		\
-		'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
-		\
-		'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory}"
+		#Get Catagory name and format for excel
+		formatMyPolicyGeneralCatagory = f"\"{myPolicyGeneralCatagory['name']}\""
 		
-		appendJAMF_Configuration_Profile_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Info)
-		appendConfigProfileColumns = appendJAMF_Configuration_Profile_Info
+		# Set Variables for Dict for Policy Info
+		appendDataToCVS_JAMF_Policy_Info = "{'Type':'Policy',\
+			\
+			'Policy ID':myPolicyGeneralID,\
+			\
+			'Policy Name':myPolicyGeneral['name'],\
+			\
+			'Policy Category ID':myPolicyGeneralCatagoryID,\
+			\
+			'Policy Category Name':formatMyPolicyGeneralCatagory}"
+		
+		appendJAMF_Policy_Info = eval(appendDataToCVS_JAMF_Policy_Info)
+		appendPolicyColumns = appendJAMF_Policy_Info
 		
 		#Set Columns	
-		Combined = MergeConfigProfileInfo(appendConfigProfileColumns, configProfileTargetsColumns, configProfileExclusionsColumns)
+		Combined = MergePolicyInfo(appendPolicyColumns, selfServiceColumns, targetsColumns, exclusionColumns, packageColumns, scriptsColumns)
 		
 		#Set CSV File
-		dataToCsvConfigurationProfile.append(Combined)
+		dataToCsvPolicy.append(Combined)	
 		
-		if get_JAMF_Configuration_Profile_Info_Targets == ("yes"):
+		if get_JAMF_Policy_Info_SelfService == ("yes"):
+			
+			
+			if useForSelfService == 'True':
+				##########################################################################################
+				# Get Info for Self Service
+				##########################################################################################
+				# Set Variables for Dict for Policy Info
+				appendDataToCVS_JAMF_Policy_SelfService_Info = "{'Type':'Policy Self Service Info',\
+				\
+				'Policy ID':myPolicyGeneralID,\
+				\
+				'Policy Name':myPolicyGeneral['name'],\
+				\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				\
+				'Policy In SelfService':str(mySelfServiceInfo['use_for_self_service']),\
+				\
+				'Policy In SelfService Name':mySelfServiceInfo['self_service_display_name']}"
+				
+				appendJAMF_Policy_SelfService_Info = eval(appendDataToCVS_JAMF_Policy_SelfService_Info)
+				appendSelfServiceColumns = appendJAMF_Policy_SelfService_Info
+				
+				#Set Columns	
+				Combined = MergePolicyInfo(policyColumns, appendSelfServiceColumns, targetsColumns, exclusionColumns, packageColumns, scriptsColumns)
+				
+				#Set CSV File
+				dataToCsvPolicy.append(Combined)	
+				
+		if get_JAMF_Policy_Info_Targets == ("yes"):
 			##########################################################################################		
 			# Get info for Target Computers	
 			##########################################################################################
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
 			
-			
-			for computer in myConfigurationProfileScopeTargetsComputers:
+			for computer in myPolicyScopeTargetsComputers:
 				
 				#Set Variables if Data Available
 				if len(str(computer['id'])) == 0:
@@ -4326,28 +5050,31 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				# Get info for Policies
 				print(f"Working on Computer ID: {computerID}")
 				
-				appendDataToCVS_JAMF_Configuration_Profile_Target_Info = "{'Configuration Profile Type':'Configuration Profile Target Computer',\
+				
+				appendDataToCVS_JAMF_Policy_Target_Info = "{'Type':'Policy Computer Targets',\
 				\
-				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				'Policy ID':myPolicyGeneralID,\
 				\
-				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				'Policy Name':myPolicyGeneral['name'],\
 				\
-				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
 				\
-				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
 				\
-				'Configuration Profile Target Computer ID':computer['id'],\
+				'Policy Target All Computers':str(myPolicyScopeTargetsAllComputers),\
 				\
-				'Configuration Profile Target Computer Name':computer['name']}"
+				'Policy Target Computer ID':computerID,\
+				\
+				'Policy Target Computer Name':computer['name']}"
 				
-				appendJAMF_Configuration_Profile_Target_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Target_Info)
-				appendConfigProfileTargetsColumns = appendJAMF_Configuration_Profile_Target_Info
+				appendJAMF_Policy_Target_Info = eval(appendDataToCVS_JAMF_Policy_Target_Info)
+				appendtargetsColumns = appendJAMF_Policy_Target_Info
 				
 				#Set Columns	
-				Combined = MergeConfigProfileInfo(configProfileColumns, appendConfigProfileTargetsColumns, configProfileExclusionsColumns)
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, appendtargetsColumns, exclusionColumns, packageColumns, scriptsColumns)
 				
 				#Set CSV File
-				dataToCsvConfigurationProfile.append(Combined)
+				dataToCsvPolicy.append(Combined)
 				
 				
 			##########################################################################################
@@ -4357,105 +5084,21 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				
 			list_of_Targets = []
 			
-			for target in myConfigurationProfileScopeTargetsComputerGroups:
+			for target in myPolicyScopeTargetsComputerGroups:
 				targetID = str(target['id']) 
 				list_of_Targets.append(f'{targetID}')
 				
 				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			def get_clean_List(url, targetIDList):
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{targetIDList}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_Targets.remove(targetIDList)
-					
-					
-					
-			def get_url(url, targetIDList):
-				
-				getTargetGroupData = ''
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{targetIDList}")
-				
-				try:
-					
-					response = http.get(myURL, headers=btHeaders)
-					
-					response.raise_for_status()
-					
-					getTargetGroupData = response.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = targetIDList
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				return getTargetGroupData
 			
 			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Targets))
-				
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('computergroups', list_of_Targets)
+			response_list = fetchResult.records
 				
-			#print(list_of_policies)	
 				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			#print(response_list)
 			
 			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Targets))
-				
-				
-			#print(response_list)
-				
-				
 			for response in response_list:
 			##	# Make sure to refresh variables for each loop
 				myTargetsComputerGroupInfo = response['computer_group']
@@ -4471,53 +5114,39 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				print(f"Working on Target Group ID: {myTargetsComputerGroupInfoID}")
 				
 				
-				# Get info for Target Computer Group
-				appendDataToCVS_JAMF_Configuration_Profile_Target_Group_Info = "{'Configuration Profile Type':'Configuration Profile Target Computer Group',\
+				appendDataToCVS_JAMF_Policy_Target_Group_Info = "{'Type':'Policy Computer Target Group',\
 				\
-				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				'Policy ID':myPolicyGeneralID,\
 				\
-				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				'Policy Name':myPolicyGeneral['name'],\
 				\
-				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
 				\
-				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
 				\
-				'Configuration Profile Target Group ID':myTargetsComputerGroupInfoID,\
+				'Policy Target Group ID':myTargetsComputerGroupInfoID,\
 				\
-				'Configuration Profile Target Group Name':myTargetsComputerGroupInfo['name'],\
+				'Policy Target Group Name':myTargetsComputerGroupInfo['name'],\
 				\
-				'Configuration Profile Target Group is Smart':str(myTargetsComputerGroupInfo['is_smart'])}"
+				'Policy Target Group is Smart':str(myTargetsComputerGroupInfo['is_smart'])}"
 				
-				appendJAMF_Configuration_Profile_Target_Group_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Target_Group_Info)
-				appendConfigProfileTargetGroupsColumns = appendJAMF_Configuration_Profile_Target_Group_Info
+				appendJAMF_Policy_Target_Group_Info = eval(appendDataToCVS_JAMF_Policy_Target_Group_Info)
+				appendtargetsGroupsColumns = appendJAMF_Policy_Target_Group_Info
 				
 				#Set Columns	
-				Combined = MergeConfigProfileInfo(configProfileColumns, appendConfigProfileTargetGroupsColumns, configProfileExclusionsColumns)
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, appendtargetsGroupsColumns, exclusionColumns, packageColumns, scriptsColumns)
 				
 				#Set CSV File
-				dataToCsvConfigurationProfile.append(Combined)
-				
+				dataToCsvPolicy.append(Combined)
 				
 				
-		if get_JAMF_Configuration_Profile_Info_Exclusions == ("yes"):
+		if get_JAMF_Policy_Info_Exclusions == ("yes"):
 			##########################################################################################
 			# Get info for exclusion Computers
 			##########################################################################################
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
 			
-			
-			for exclusion in myConfigurationProfileScopeExclusionsComputers:
+			for exclusion in myPolicyScopeExclusionsComputers:
 				
 				#Set Variables if Data Available
 				if len(str(exclusion['id'])) == 0:
@@ -4529,28 +5158,28 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				print(f"Working on Target Group ID: {exclusionID}")
 				
 				
-				appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Info = "{'Configuration Profile Type':'Configuration Profile Exclusion Computers',\
+				appendDataToCVS_JAMF_Policy_Exclusion_Info = "{'Type':'Policy Computer Exclusions',\
 				\
-				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				'Policy ID':myPolicyGeneralID,\
 				\
-				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				'Policy Name':myPolicyGeneral['name'],\
 				\
-				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
 				\
-				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
 				\
-				'Configuration Profile Exclusion Computer id':exclusionID,\
+				'Policy Exclusion Computer ID':exclusionID,\
 				\
-				'Configuration Profile Exclusion Computer Name':exclusion['name']}"
+				'Policy Exclusion Computer Name':exclusion['name']}"
 				
-				appendJAMF_Configuration_Profile_Exclusion_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Info)
-				appendConfigProfileExclusionsColumns = appendJAMF_Configuration_Profile_Exclusion_Info
+				appendJAMF_Policy_Exclusion_Info = eval(appendDataToCVS_JAMF_Policy_Exclusion_Info)
+				appendExclusionColumns = appendJAMF_Policy_Exclusion_Info
 				
 				#Set Columns	
-				Combined = MergeConfigProfileInfo(configProfileColumns, configProfileTargetsColumns, appendConfigProfileExclusionsColumns)
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, appendExclusionColumns, packageColumns, scriptsColumns)
 				
 				#Set CSV File
-				dataToCsvConfigurationProfile.append(Combined)	
+				dataToCsvPolicy.append(Combined)
 				
 				
 			##########################################################################################
@@ -4560,105 +5189,21 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				
 			list_of_Exclusions = []
 			
-			for exclusion in myConfigurationProfileScopeExclusionsComputerGroups:
+			for exclusion in myPolicyScopeExclusionsComputerGroups:
 				exclusionID = str(exclusion['id']) 
 				list_of_Exclusions.append(f'{exclusionID}')
 				
 				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			
-			def get_clean_List(url, exclusionIDList):
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{exclusionIDList}")
-				
-				test = http.get(myURL, headers=btHeaders)
-				
-				if test.status_code != 200:
-					list_of_Exclusions.remove(exclusionIDList)
-					
-					
-					
-			def get_url(url, exclusionIDList):
-				
-				getExclusionGroupData = ''
-				
-				myURL = (f"{url}/JSSResource/computergroups/id/{exclusionIDList}")
-				
-				try:
-					
-					response = http.get(myURL, headers=btHeaders)
-					
-					response.raise_for_status()
-					
-					getExclusionGroupData = response.json()
-					
-				except HTTPError as http_err:
-					
-					# Process HTTP Error
-					check_http_err = str(http_err)
-					split_My_http_err = check_http_err.split()
-					
-					myHttpError = split_My_http_err[0]
-					myMissingRecordID = exclusionIDList
-					myMissingRecordURL = split_My_http_err[5]
-					
-					if myHttpError == '404':
-						print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-						
-					else:
-						print(f'HTTP error occurred: {http_err}')
-						
-				except Exception as err:
-					print(f'Other error occurred: {err}')
-					
-					
-				return getExclusionGroupData
 			
 			
-			# Clean List
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_clean_List, JAMF_url)
-				list(pool.map(get_data,list_of_Exclusions))
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('computergroups', list_of_Exclusions)
+			response_list = fetchResult.records
 				
 				
-			#print(list_of_policies)	
-				
-				
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
+			#print(response_list)
 			
 			
-			# Process List	
-			with ThreadPoolExecutor(max_workers=100) as pool:
-				get_data = partial(get_url, JAMF_url)
-				response_list = list(pool.map(get_data,list_of_Exclusions))
-				
-				
-			#print(response_list)
-				
-				
 			for response in response_list:
 			##	# Make sure to refresh variables for each loop
 				myExclusionsComputerGroupInfo = response['computer_group']
@@ -4673,1350 +5218,820 @@ if get_JAMF_Configuration_Profile_Info == ("yes"):
 				print(f"Working on Exclusion Group ID: {myExclusionsComputerGroupInfoID}")
 				
 				
-				appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Groups_Info = "{'Configuration Profile Type':'Configuration Profile Exclusion Computer Groups',\
+				appendDataToCVS_JAMF_Policy_Exclusion_Group_Info = "{'Type':'Policy Computer Exclusions Group',\
 				\
-				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				'Policy ID':myPolicyGeneralID,\
 				\
-				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				'Policy Name':myPolicyGeneral['name'],\
 				\
-				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
 				\
-				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
 				\
-				'Configuration Profile Exclusion Group id':myExclusionsComputerGroupInfoID,\
+				'Policy Exclusion Group id':myExclusionsComputerGroupInfoID,\
 				\
-				'Configuration Profile Exclusion Group Name':myExclusionsComputerGroupInfo['name'],\
+				'Policy Exclusion Group Name':myExclusionsComputerGroupInfo['name'],\
 				\
-				'Configuration Profile Exclusion Group is Smart':str(myExclusionsComputerGroupInfo['is_smart'])}"
+				'Policy Exclusion Group is Smart':str(myExclusionsComputerGroupInfo['is_smart'])}"
 				
-				appendJAMF_Configuration_Profile_Exclusion_Groups_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Groups_Info)
-				appendConfigProfileExclusionsGroupsColumns = appendJAMF_Configuration_Profile_Exclusion_Groups_Info
+				appendJAMF_Policy_Exclusion_Info = eval(appendDataToCVS_JAMF_Policy_Exclusion_Group_Info)
+				appendExclusionGroupsColumns = appendJAMF_Policy_Exclusion_Info
 				
 				#Set Columns	
-				Combined = MergeConfigProfileInfo(configProfileColumns, configProfileTargetsColumns, appendConfigProfileExclusionsGroupsColumns)
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, appendExclusionGroupsColumns, packageColumns, scriptsColumns)
 				
 				#Set CSV File
-				dataToCsvConfigurationProfile.append(Combined)	
-				
+				dataToCsvPolicy.append(Combined)
 				
-	#Renew token because the report is a long process
-	#renew token
-	url = JAMF_url+"/api/v1/auth/keep-alive"
-	
-	token = http.post(url, headers=btHeaders)
-	
-	bearer = token.json()['token']
-	
-	btHeaders = {
-		'Accept': 'application/json',
-		'Authorization': 'Bearer '+bearer
-	}
-	
-	
-	# Process List
-	with ThreadPoolExecutor(max_workers=100) as pool:
-		list(pool.map(processData,response_list))
-
-	
-##########################################################################################
-# Package to Policies Section
-##########################################################################################			
-if get_JAMF_Package_To_Policy_Info == ("yes"):
-	
-	##########################################################################################
-	# Process Package to Policies information for csv / Excel
-	##########################################################################################
-	# Set up url for getting a list of all Package to Regular Policies from JAMF API
-	url = JAMF_url + "/JSSResource/policies"
-	
-	# Set up list
-	policyPackagesList = []
-	preStagePolicyPackagesList = []
-	patchManagementPolicyPackagesList = []
-	
-	
-	try:
-		policyResponse = http.get(url, headers=btHeaders)
-		
-		policyResponse.raise_for_status()
-		
-		resp = policyResponse.json()
-		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')	
-		
-	#For Testing
-	#print(resp)
-		
-	policyRecords = resp['policies']
-	policyRecords.sort(key=lambda item: item.get('id'), reverse=False)
-
-
-	for policy in policyRecords:
-		
-		#Renew token because the report is a long process
-		#renew token
-		url = JAMF_url+"/api/v1/auth/keep-alive"
-		
-		token = http.post(url, headers=btHeaders)
-		
-		bearer = token.json()['token']
-		
-		btHeaders = {
-			'Accept': 'application/json',
-			'Authorization': 'Bearer '+bearer
-		}
-		
-		# Get Policy ID to do JAMF API lookup 
-		policyRecordsID = str(policy['id']) 
-		
-		#	For Testing
-		#print(policyRecordsID)
-		
-		# Set up url for getting information from each policy ID from JAMF API
-		url = JAMF_url + "/JSSResource/policies/id/" + policyRecordsID
-		
-		try:
-			PolicyRecordsResponse = http.get(url, headers=btHeaders)
-			
-			PolicyRecordsResponse.raise_for_status()
+		if get_JAMF_Policy_Info_Packages == ("yes"):		
+			##########################################################################################
+			#Get Info for Packages in Policy
+			##########################################################################################	
 			
-			getPolicyRecords = PolicyRecordsResponse.json()
 			
-		except HTTPError as http_err:
-			# Process HTTP Error
-			check_http_err = str(http_err)
-			split_My_http_err = check_http_err.split()
+			# Start New MultiProcess Code here
 			
-			myHttpError = split_My_http_err[0]
-			myMissingRecordID = policyRecordsID
-			myMissingRecordURL = split_My_http_err[5]
+			list_of_Packages = []
 			
-			if myHttpError == '404':
-				print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
+			for package in myPackagesInfo:
+				packageID = str(package['id']) 
+				list_of_Packages.append(f'{packageID}')
 				
-			else:
-				print(f'HTTP error occurred: {http_err}')
 				
-			continue
-		except Exception as err:
-			print(f'Other error occurred: {err}')
-			continue
-			
-		# For Testing
-		#print(getPolicyRecords)
-			
-		#Get policy ID and Name for report
-		policyInfoID = getPolicyRecords['policy']['general']['id']
-		policyInfoName = getPolicyRecords['policy']['general']['name']
-		
-		# Find the package data in each policy
-		policyPackageInfo = getPolicyRecords['policy']['package_configuration']['packages']
-		
-		
-		# Individual Policy Info for each record
-		getMyPolicyIDList = (str(policyInfoID) + " - " + policyInfoName)
-		
-		# Get info for Policies
-		print("Gathering List for Package Info from Policy ID: " + getMyPolicyIDList)
-		
-		
-		#Get Package ID from Policy to compare and find unused packages.
-		for policyPackage in policyPackageInfo:
-			
-			#get package info for dict
-			policyPackagesDict = {'Policy ID': policyInfoID, 'Policy Name': policyInfoName, 'Package ID': str(policyPackage['id'])}
-			
-			policyPackagesList.append(policyPackagesDict)
-	
-	
-	#For testing
-	#print(policyPackagesList)	
-	
-	
-
-
-	if includePreStagePackageToPolicyInfo == ("yes"):
-		##########################################################################################
-		# Process Package to PreStage Policies information for csv / Excel
-		##########################################################################################
-		# Set up url for getting a list of all Package to PreStage Policies from JAMF API
-		PSURL = JAMF_url + "/api/v2/computer-prestages"
-		
-		
-		try:
-			preStagePolicyPackagesResponse = http.get(PSURL, headers=btHeaders)
-			
-			preStagePolicyPackagesResponse.raise_for_status()
-			
-			resp = preStagePolicyPackagesResponse.json()
-			
-		except HTTPError as http_err:
-			print(f'HTTP error occurred: {http_err}')
-		except Exception as err:
-			print(f'Other error occurred: {err}')	
-			
-		#For Testing
-		#print(resp)
-		
-		preStagePolicies = resp['results']
-		
-		for results in preStagePolicies:
-			
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
-			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
-			
-			preStagePoliciesID = results['id']
-			packages = results['customPackageIds']
-			preStagePoliciesDisplayName = results['displayName']
-			
-			
-			# Individual Policy Info for each record
-			getMyPreStagePolicyIDList = (str(preStagePoliciesID) + " - " + preStagePoliciesDisplayName)
-			
-			# Get info for Policies
-			print("Gathering List for Package Info from PreStage Policy ID: " + getMyPreStagePolicyIDList)
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('packages', list_of_Packages)
+			response_list = fetchResult.records
+				
+				
+			#print(response_list)
 			
 			
-			for package in packages:
+			for response in response_list:
+				myPackageInfo = response['package']
+				
+				formatMyPackageInfoCatagory = f"\"{myPackageInfo['category']}\""
+				
+				#Set Variables if Data Available
+				if len(str(myPackageInfo['id'])) == 0:
+					myPackageInfoID = ''
+				else:
+					myPackageInfoID = int(myPackageInfo['id'])
+					
+					
+				# Get info for Policies
+				print(f"Working on Package ID: {myPackageInfoID}")
+				
+				
+				appendDataToCVS_JAMF_Policy_Packages_Info = "{'Type':'Policy Package',\
+				\
+				'Policy ID':myPolicyGeneralID,\
+				\
+				'Policy Name':myPolicyGeneral['name'],\
+				\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				\
+				'Policy Package ID':myPackageInfoID,\
+				\
+				'Policy Package Name':myPackageInfo['name'],\
+				\
+				'Policy Package Category Name':formatMyPackageInfoCatagory,\
+				\
+				'Policy Package Filename':myPackageInfo['filename']}"
 				
-				#print(package)
+				appendJAMF_Policy_Packages_Info = eval(appendDataToCVS_JAMF_Policy_Packages_Info)
+				appendPackageColumns = appendJAMF_Policy_Packages_Info
 				
-				preStagePolicyPackagesDict = {'PreStage Policy ID': preStagePoliciesID, 'PreStage Policy Display Name': preStagePoliciesDisplayName, 'Package ID': package}
+				#Set Columns	
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, exclusionColumns, appendPackageColumns, scriptsColumns)
 				
-				preStagePolicyPackagesList.append(preStagePolicyPackagesDict)
+				#Set CSV File
+				dataToCsvPolicy.append(Combined)
 				
 				
-		#print(preStagePolicyPackagesList)
-	
-	if includePatchManagementPackageToPolicyInfo == ("yes"):
-		##########################################################################################
-		# Process Package to PreStage Policies information for csv / Excel
-		##########################################################################################
-		# Set up url for getting a list of all Package to PreStage Policies from JAMF API
-		allPatchPolicies = JAMF_url + "/JSSResource/patchpolicies"
-		patchPoliciesByID = JAMF_url + "/JSSResource/patchpolicies/id/"
-		patchSoftwareTitlesByID = JAMF_url + "/JSSResource/patchsoftwaretitles/id/"
-		
-		
-		# Find all patch Policy ID
-		try:
-			patchManagementPolicyPackagesResponse = http.get(allPatchPolicies, headers=btHeaders)
-			
-			patchManagementPolicyPackagesResponse.raise_for_status()
-			
-			resp = patchManagementPolicyPackagesResponse.json()
-			
-		except HTTPError as http_err:
-			print(f'HTTP error occurred: {http_err}')
-		except Exception as err:
-			print(f'Other error occurred: {err}')	
-			
-		#For Testing
-		#print(resp)
-			
-		# Get ID from patch policy
-		patchPolicy = resp['patch_policies']
-		
-		
-		# Find Patch Policiy ID
-		for policy in patchPolicy :
-			
-			#Renew token because the report is a long process
-			#renew token
-			url = JAMF_url+"/api/v1/auth/keep-alive"
-			
-			token = http.post(url, headers=btHeaders)
-			
-			bearer = token.json()['token']
+		if get_JAMF_Policy_Info_Scripts == ("yes"):		
+			##########################################################################################
+			#Get Info for scripts in Policy
+			##########################################################################################
 			
-			btHeaders = {
-				'Accept': 'application/json',
-				'Authorization': 'Bearer '+bearer
-			}
 			
-			btBrokenXMLHeaders = {
-				"Accept": "application/xml, application/json",
-				"Content-Type": "application/xml",
-				'Authorization': 'Bearer '+bearer
-			}
+			# Start New MultiProcess Code here
 			
+			list_of_Scripts = []
 			
-			patchManagementID = str(policy['id'])
+			for script in myScriptInfo:
+				scriptID = str(script['id'])
+				list_of_Scripts.append(f'{scriptID}')
+				
+				
 			
-			# Get info for Policies
-			print("Gathering List for Package Info from Patch Management Policy ID: " + patchManagementID)
 			
-			try:
-				patchManagementPolicyPackagesResponseID = http.get(patchPoliciesByID+patchManagementID, headers=btHeaders)
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('scripts', list_of_Scripts)
+			response_list = fetchResult.records
 				
-				patchManagementPolicyPackagesResponseID.raise_for_status()
 				
-				resp = patchManagementPolicyPackagesResponseID.json()
+			#print(response_list)
+						
+			
+			for response in response_list:
+				myScriptInfo = response['script']
 				
-			except HTTPError as http_err:
-				print(f'HTTP error occurred: {http_err}')
-			except Exception as err:
-				print(f'Other error occurred: {err}')	
+				formatMyScriptsinfoCatagory = f"\"{myScriptInfo['category']}\""
 				
-			#For Testing
-			# print(resp['patch_policy']['software_title_configuration_id'])
+				#Set Variables if Data Available
+				if len(str(myScriptInfo['id'])) == 0:
+					myScriptInfoID = ''
+				else:
+					myScriptInfoID = int(myScriptInfo['id'])
+					
+				# Get info for Policies
+				print(f"Working on Script ID: {myScriptInfoID}")
 				
-			pmSoftwareTitleConfigurationID = str(resp['patch_policy']['software_title_configuration_id'])
-			
-			# print(pmSoftwareTitleConfigurationID)
-			
-			try:
-				patchManagementSoftwareTitleConfigurationInfo = http.get(patchSoftwareTitlesByID+pmSoftwareTitleConfigurationID, headers=btBrokenXMLHeaders)
+				appendDataToCVS_JAMF_Policy_Scripts_Info = "{'Type':'Policy Scripts',\
+				\
+				'Policy ID':myPolicyGeneralID,\
+				\
+				'Policy Name':myPolicyGeneral['name'],\
+				\
+				'Policy Category ID':myPolicyGeneralCatagoryID,\
+				\
+				'Policy Category Name':formatMyPolicyGeneralCatagory,\
+				\
+				'Policy Script ID':myScriptInfoID,\
+				\
+				'Policy Script Name':myScriptInfo['name'],\
+				\
+				'Policy Script Category Name':formatMyScriptsinfoCatagory,\
+				\
+				'Policy Script Filename':myScriptInfo['filename']}"
 				
-				patchManagementSoftwareTitleConfigurationInfo.raise_for_status()
 				
-				resp = xmltodict.parse(patchManagementSoftwareTitleConfigurationInfo.content)
+				appendJAMF_Policy_Scripts_Info = eval(appendDataToCVS_JAMF_Policy_Scripts_Info)
+				appendScriptsColumns = appendJAMF_Policy_Scripts_Info
 				
-			except HTTPError as http_err:
-				print(f'HTTP error occurred: {http_err}')
-			except Exception as err:
-				print(f'Other error occurred: {err}')	
+				#Set Columns	
+				Combined = MergePolicyInfo(policyColumns, selfServiceColumns, targetsColumns, exclusionColumns, packageColumns, appendScriptsColumns)
 				
-			#For Testing
-			# print(resp['patch_software_title'])
+				#Set CSV File
+				dataToCsvPolicy.append(Combined)
 				
-			patchManagementPolicyDisplayName = resp['patch_software_title']['name']
-			pmSoftwareTitleVersionInfo = resp['patch_software_title']['versions']['version']
-			
-			for version in pmSoftwareTitleVersionInfo :
-				packageInfo = version['package']
-				pmSoftwareVersionName = version['software_version']
 				
-				if packageInfo != None :
-					#print(packageInfo['id'])
-					#print(packageInfo['name'])
-					
-					patchManagementPackageID = str(packageInfo['id'])
-					patchManagementSoftwareVersionName = pmSoftwareVersionName
-					
-					patchManagementPolicyPackagesDict = {'Patch Management ID': patchManagementID, 'Patch Management Display Name': patchManagementPolicyDisplayName, 'Patch Management Software Version Name': patchManagementSoftwareVersionName, 'Package ID': patchManagementPackageID}
-					
-					patchManagementPolicyPackagesList.append(patchManagementPolicyPackagesDict)
-					
-		# For Testing
-		#print(patchManagementPolicyPackagesList)
 	
 	
+	# Process List
+	fetchEngine.map(processData, response_list)
+
+
+##########################################################################################
+# Configuration Profiles Section
+##########################################################################################			
+if get_JAMF_Configuration_Profile_Info == ("yes"):
+	
 	##########################################################################################
-	# lookup package information and compair to dict and list to find what is in use.
+	# Process Configuration Profilesinformation for csv / Excel
 	##########################################################################################
-	url = JAMF_url + "/JSSResource/packages"
-	
-	try:
-		packageResponse = http.get(url, headers=btHeaders)
-		
-		packageResponse.raise_for_status()
+	# Get every Configuration Profile record once, the list is shared with the Computers section
+	response_list = entityStore.getAllRecords('osxconfigurationprofiles')
 		
-		resp = packageResponse.json()
+	#print(response_list)
 		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')	
 		
-	#For Testing
-	#print(resp)
-		
-	packageRecords = resp['packages']
-	packageRecords.sort(key=lambda item: item.get('id'), reverse=False)
-	
-	
-	#print(packageRecords)
 	
 	
-	#process package records and set dict and list
-	for package in packageRecords:
-		
-		#Renew token because the report is a long process
-		#renew token
-		url = JAMF_url+"/api/v1/auth/keep-alive"
+	async def processData(response):
+		# Make sure to refresh variables for each loop
+		#General Element for ID and Catagory
+		myConfigurationProfileGeneral = response['os_x_configuration_profile']['general']
+		myConfigurationProfileGeneralCatagory = response['os_x_configuration_profile']['general']['category']
 		
-		token = http.post(url, headers=btHeaders)
+		#Scope Element for Computer Targets
+		myConfigurationProfileScopeTargetsAllComputers = response['os_x_configuration_profile']['scope']['all_computers']
+		myConfigurationProfileScopeTargetsComputers = response['os_x_configuration_profile']['scope']['computers']
+		myConfigurationProfileScopeTargetsComputerGroups = response['os_x_configuration_profile']['scope']['computer_groups']
 		
-		bearer = token.json()['token']
+		#Scope Element For Limitation
+		myConfigurationProfileScopeLimitationsUsers = response['os_x_configuration_profile']['scope']['limitations']['users']
+		myConfigurationProfileScopeLimitationsUserGroups = response['os_x_configuration_profile']['scope']['limitations']['user_groups']
 		
-		btHeaders = {
-			'Accept': 'application/json',
-			'Authorization': 'Bearer '+bearer
-		}
+		#Scope Element For Exclusions
+		myConfigurationProfileScopeExclusionsComputers = response['os_x_configuration_profile']['scope']['exclusions']['computers']
+		myConfigurationProfileScopeExclusionsComputerGroups = response['os_x_configuration_profile']['scope']['exclusions']['computer_groups']
 		
-		packageRecordsID = package['id']
-		packageRecordsName = package['name']
 		
-		key = 'Package ID' 
-		value = str(packageRecordsID)
+		##########################################################################################
+		# Process ConfigurationProfile information for csv / Excel
+		##########################################################################################
 		
-		# Individual Policy Info for each record
-		getMyPackageList = (str(packageRecordsID) + " - " + packageRecordsName)
+		# Individual ConfigurationProfile Info for each record
+		getMyConfigurationProfileID = (str(myConfigurationProfileGeneral['id']) + " - " + myConfigurationProfileGeneral['name'])
+		getMyConfigurationProfileGeneralCatagory = (str(myConfigurationProfileGeneralCatagory['id']) + " - " + myConfigurationProfileGeneralCatagory['name'])
 		
 		# Get info for Policies
-		print("Checking Policies that use Package: " + getMyPackageList) 
+		print("Working on Configuration Profile ID: " + getMyConfigurationProfileID)
+		
+		formatMyConfigurationProfileGeneralCatagory = f"\"{myConfigurationProfileGeneralCatagory['name']}\""
+		
+		#Set Variables if Data Available
+		if len(str(myConfigurationProfileGeneral['id'])) == 0:
+			myConfigurationProfileGeneralID = ''
+		else:
+			myConfigurationProfileGeneralID = int(myConfigurationProfileGeneral['id'])
+			
+		#Set Variables if Data Available
+		if len(str(myConfigurationProfileGeneralCatagory['id'])) == 0:
+			myConfigurationProfileGeneralCatagoryID = ''
+		else:
+			myConfigurationProfileGeneralCatagoryID = int(myConfigurationProfileGeneralCatagory['id'])
+			
+			
+		# Set Variables for Dict for Configuration Profile Info
+		appendDataToCVS_JAMF_Configuration_Profile_Info = "{'Configuration Profile Type':'Configuration Profile',\
+		\
+		'Configuration Profile ID':myConfigurationProfileGeneralID,\
+		\
+		'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+		\
+		'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+		\
+		'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory}"
 		
-		#for testing
-		#print(packageRecordsID)
-		#print(policyPackagesList)
-		#print(type(value))
+		appendJAMF_Configuration_Profile_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Info)
+		appendConfigProfileColumns = appendJAMF_Configuration_Profile_Info
+		
+		#Set Columns	
+		Combined = MergeConfigProfileInfo(appendConfigProfileColumns, configProfileTargetsColumns, configProfileExclusionsColumns)
 		
+		#Set CSV File
+		dataToCsvConfigurationProfile.append(Combined)
 		
-		#Process Info for packages to policies
-		if checkIfPackageIsUsedInPolicy(policyPackagesList, key, value) and checkIfPackageIsUsedInPolicy(preStagePolicyPackagesList, key, value) and checkIfPackageIsUsedInPolicy(patchManagementPolicyPackagesList, key, value):
+		if get_JAMF_Configuration_Profile_Info_Targets == ("yes"):
+			##########################################################################################		
+			# Get info for Target Computers	
+			##########################################################################################
+			
 			
-			for policy in policyPackagesList:
+			for computer in myConfigurationProfileScopeTargetsComputers:
+				
+				#Set Variables if Data Available
+				if len(str(computer['id'])) == 0:
+					computerID = ''
+				else:
+					computerID = int(computer['id'])
+					
+				# Get info for Policies
+				print(f"Working on Computer ID: {computerID}")
+				
+				appendDataToCVS_JAMF_Configuration_Profile_Target_Info = "{'Configuration Profile Type':'Configuration Profile Target Computer',\
+				\
+				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				\
+				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				\
+				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				\
+				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				\
+				'Configuration Profile Target Computer ID':computer['id'],\
+				\
+				'Configuration Profile Target Computer Name':computer['name']}"
+				
+				appendJAMF_Configuration_Profile_Target_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Target_Info)
+				appendConfigProfileTargetsColumns = appendJAMF_Configuration_Profile_Target_Info
+				
+				#Set Columns	
+				Combined = MergeConfigProfileInfo(configProfileColumns, appendConfigProfileTargetsColumns, configProfileExclusionsColumns)
+				
+				#Set CSV File
+				dataToCsvConfigurationProfile.append(Combined)
 				
-				policyPackageID = policy['Package ID']
 				
-				checkPolicyListID = str(policyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
+			##########################################################################################
+			# Get Info for Target Computer Groups
+			##########################################################################################
+			# Start New MultiProcess Code here
+				
+			list_of_Targets = []
+			
+			for target in myConfigurationProfileScopeTargetsComputerGroups:
+				targetID = str(target['id']) 
+				list_of_Targets.append(f'{targetID}')
 				
 				
-				if checkPolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-						
-					# for testing
-					# print(getMyPackageRecords['package']['id'])
-						
-						
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-						
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(policy['Policy ID'])) == 0:
-						myCurrentPolicyID = ''
-					else:
-						myCurrentPolicyID = int(policy['Policy ID'])
-						
-					myCurrentPolicyName = policy['Policy Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_Regular_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'Regular Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'Policy ID':myCurrentPolicyID,\
-					\
-					'Policy Name':myCurrentPolicyName}"
-					
-					appendJAMF_Package_To_Regular_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_Regular_Policy_Info)
-					appendPackageToRegularPolicyColumns = appendJAMF_Package_To_Regular_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToRegularPolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
-					
-					# For Testing
-					# print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package File Name: " + myPackageRecordsFileName + ", is being used by Policy ID: " + str(myCurrentPolicyID) + " with Policy Name: " + myCurrentPolicyName)
 			
 			
-			for preStagePolicy in preStagePolicyPackagesList:
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('computergroups', list_of_Targets)
+			response_list = fetchResult.records
 				
-				preStagePolicyPackageID = preStagePolicy['Package ID']
 				
-				checkPreStagePolicyListID = str(preStagePolicyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
+			#print(response_list)
 				
-				if checkPreStagePolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-					
-						
-						
-					#print(getMyPackageRecords['package']['id'])
-						
-						
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-						
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(preStagePolicy['PreStage Policy ID'])) == 0:
-						myCurrentPreStagePolicyID = ''
-					else:
-						myCurrentPreStagePolicyID = int(preStagePolicy['PreStage Policy ID'])
-						
-					myCurrentPreStagePolicyName = preStagePolicy['PreStage Policy Display Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_PreStage_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'PreStage Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'PreStage Policy ID':myCurrentPreStagePolicyID,\
-					\
-					'PreStage Policy Name':myCurrentPreStagePolicyName}"
-					
-					
-					appendJAMF_Package_To_PreStage_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_PreStage_Policy_Info)
-					appendPackageToPreStagePolicyColumns = appendJAMF_Package_To_PreStage_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToPreStagePolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
+				
+			for response in response_list:
+			##	# Make sure to refresh variables for each loop
+				myTargetsComputerGroupInfo = response['computer_group']
+				
+				
+				#Set Variables if Data Available
+				if len(str(myTargetsComputerGroupInfo['id'])) == 0:
+					myTargetsComputerGroupInfoID = ''
+				else:
+					myTargetsComputerGroupInfoID = int(myTargetsComputerGroupInfo['id'])
 					
-					# For Testing
-					#print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package FileName: "+ myPackageRecordsFileName + " is being used in PreStage Policies ID: " + myCurrentPreStagePolicyID + " with PreStage Display Name: " + myCurrentPreStagePolicyName)
+				# Get info for Policies
+				print(f"Working on Target Group ID: {myTargetsComputerGroupInfoID}")
+				
+				
+				# Get info for Target Computer Group
+				appendDataToCVS_JAMF_Configuration_Profile_Target_Group_Info = "{'Configuration Profile Type':'Configuration Profile Target Computer Group',\
+				\
+				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				\
+				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				\
+				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				\
+				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				\
+				'Configuration Profile Target Group ID':myTargetsComputerGroupInfoID,\
+				\
+				'Configuration Profile Target Group Name':myTargetsComputerGroupInfo['name'],\
+				\
+				'Configuration Profile Target Group is Smart':str(myTargetsComputerGroupInfo['is_smart'])}"
+				
+				appendJAMF_Configuration_Profile_Target_Group_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Target_Group_Info)
+				appendConfigProfileTargetGroupsColumns = appendJAMF_Configuration_Profile_Target_Group_Info
+				
+				#Set Columns	
+				Combined = MergeConfigProfileInfo(configProfileColumns, appendConfigProfileTargetGroupsColumns, configProfileExclusionsColumns)
+				
+				#Set CSV File
+				dataToCsvConfigurationProfile.append(Combined)
+				
+				
+				
+		if get_JAMF_Configuration_Profile_Info_Exclusions == ("yes"):
+			##########################################################################################
+			# Get info for exclusion Computers
+			##########################################################################################
 			
 			
-			for patchManagementPolicy in patchManagementPolicyPackagesList:
+			for exclusion in myConfigurationProfileScopeExclusionsComputers:
 				
-				patchManagementPolicyPackageID = patchManagementPolicy['Package ID']
+				#Set Variables if Data Available
+				if len(str(exclusion['id'])) == 0:
+					exclusionID = ''
+				else:
+					exclusionID = int(exclusion['id'])
+					
+				# Get info for Policies
+				print(f"Working on Target Group ID: {exclusionID}")
 				
-				checkPatchManagementPolicyListID = str(patchManagementPolicyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
 				
-				if checkPatchManagementPolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-					
-					
-					print("I am here in patch management policy")
-					print(getMyPackageRecords['package']['id'])
-					
-					
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-						
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(patchManagementPolicy['Patch Management ID'])) == 0:
-						myCurrentPatchManagementPolicyID = ''
-					else:
-						myCurrentPatchManagementPolicyID = int(patchManagementPolicy['Patch Management ID'])
-						
-					myCurrentPatchManagementPolicyName = patchManagementPolicy['Patch Management Display Name']
-					
-					myCurrentPatchManagementPolicySoftwareVersionName = patchManagementPolicy['Patch Management Software Version Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_Patch_Management_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'Patch Management Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'Patch Management Policy ID':myCurrentPatchManagementPolicyID,\
-					\
-					'Patch Management Policy Name':myCurrentPatchManagementPolicyName,	\
-					\
-					'Patch Management Policy Software Version Name':myCurrentPatchManagementPolicySoftwareVersionName}"
-					
-					
-					appendJAMF_Package_To_Patch_Management_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_Patch_Management_Policy_Info)
-					appendPackageToPatchManagementPolicyColumns = appendJAMF_Package_To_Patch_Management_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToPatchManagementPolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
-					
-					# For Testing
-					#print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package FileName: "+ myPackageRecordsFileName + " is being used in Patch Management Policies ID: " + myCurrentPatchManagementPolicyID + " with Patch Management Display Name: " + myCurrentPatchManagementPolicyID + " with Patch Management Display Software Version Name: " + myCurrentPatchManagementPolicySoftwareVersionName)
-					
-					
-		elif checkIfPackageIsUsedInPolicy(policyPackagesList, key, value):
-			
-			for policy in policyPackagesList:
+				appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Info = "{'Configuration Profile Type':'Configuration Profile Exclusion Computers',\
+				\
+				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				\
+				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				\
+				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				\
+				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				\
+				'Configuration Profile Exclusion Computer id':exclusionID,\
+				\
+				'Configuration Profile Exclusion Computer Name':exclusion['name']}"
 				
-				policyPackageID = policy['Package ID']
+				appendJAMF_Configuration_Profile_Exclusion_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Info)
+				appendConfigProfileExclusionsColumns = appendJAMF_Configuration_Profile_Exclusion_Info
 				
-				checkPolicyListID = str(policyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
+				#Set Columns	
+				Combined = MergeConfigProfileInfo(configProfileColumns, configProfileTargetsColumns, appendConfigProfileExclusionsColumns)
+				
+				#Set CSV File
+				dataToCsvConfigurationProfile.append(Combined)	
+				
+				
+			##########################################################################################
+			# Get Info for Computer Exclusions groups
+			##########################################################################################
+			# Start New MultiProcess Code here
+				
+			list_of_Exclusions = []
+			
+			for exclusion in myConfigurationProfileScopeExclusionsComputerGroups:
+				exclusionID = str(exclusion['id']) 
+				list_of_Exclusions.append(f'{exclusionID}')
 				
 				
-				if checkPolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-					
-						
-					# for testing
-					#print(getMyPackageRecords['package']['id'])
-						
-						
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-					
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(policy['Policy ID'])) == 0:
-						myCurrentPolicyID = ''
-					else:
-						myCurrentPolicyID = int(policy['Policy ID'])
-					
-					myCurrentPolicyName = policy['Policy Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_Regular_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'Regular Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'Policy ID':myCurrentPolicyID,\
-					\
-					'Policy Name':myCurrentPolicyName}"
-					
-					appendJAMF_Package_To_Regular_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_Regular_Policy_Info)
-					appendPackageToRegularPolicyColumns = appendJAMF_Package_To_Regular_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToRegularPolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
-					
-					# For Testing
-					#print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package File Name: " + myPackageRecordsFileName + ", is being used by Policy ID: " + str(myCurrentPolicyID) + " with Policy Name: " + myCurrentPolicyName)
-					
-					
-		elif checkIfPackageIsUsedInPolicy(preStagePolicyPackagesList, key, value):
 			
-			for preStagePolicy in preStagePolicyPackagesList:
+			
+			# Get each record once, IDs that no longer exist in your JAMF Instance are left out
+			fetchResult = await entityStore.agetRecords('computergroups', list_of_Exclusions)
+			response_list = fetchResult.records
 				
-				preStagePolicyPackageID = preStagePolicy['Package ID']
 				
-				checkPreStagePolicyListID = str(preStagePolicyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
+			#print(response_list)
 				
-				if checkPreStagePolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-					
-						
-						
-					#print(getMyPackageRecords['package']['id'])
-					#print(getMyPackageRecords) 
-						
-						
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-						
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(preStagePolicy['PreStage Policy ID'])) == 0:
-						myCurrentPreStagePolicyID = ''
-					else:
-						myCurrentPreStagePolicyID = int(preStagePolicy['PreStage Policy ID'])
-						
-					myCurrentPreStagePolicyName = preStagePolicy['PreStage Policy Display Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_PreStage_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'PreStage Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'PreStage Policy ID':myCurrentPreStagePolicyID,\
-					\
-					'PreStage Policy Name':myCurrentPreStagePolicyName}"
-					
-					
-					appendJAMF_Package_To_PreStage_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_PreStage_Policy_Info)
-					appendPackageToPreStagePolicyColumns = appendJAMF_Package_To_PreStage_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToPreStagePolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
+				
+			for response in response_list:
+			##	# Make sure to refresh variables for each loop
+				myExclusionsComputerGroupInfo = response['computer_group']
+				
+				#Set Variables if Data Available
+				if len(str(myExclusionsComputerGroupInfo['id'])) == 0:
+					myExclusionsComputerGroupInfoID = ''
+				else:
+					myExclusionsComputerGroupInfoID = int(myExclusionsComputerGroupInfo['id'])
 					
-					# For Testing
-					#print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package FileName: "+ myPackageRecordsFileName + " is being used in PreStage Policies ID: " + myCurrentPreStagePolicyID + " with PreStage Display Name: " + myCurrentPreStagePolicyName)
-		
-		
-		elif checkIfPackageIsUsedInPolicy(patchManagementPolicyPackagesList, key, value):
-			
-			for patchManagementPolicy in patchManagementPolicyPackagesList:
+				# Get info for Policies
+				print(f"Working on Exclusion Group ID: {myExclusionsComputerGroupInfoID}")
+				
+				
+				appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Groups_Info = "{'Configuration Profile Type':'Configuration Profile Exclusion Computer Groups',\
+				\
+				'Configuration Profile ID':myConfigurationProfileGeneralID,\
+				\
+				'Configuration Profile Name':myConfigurationProfileGeneral['name'],\
+				\
+				'Configuration Profile Category ID':myConfigurationProfileGeneralCatagoryID,\
+				\
+				'Configuration Profile Category Name':formatMyConfigurationProfileGeneralCatagory,\
+				\
+				'Configuration Profile Exclusion Group id':myExclusionsComputerGroupInfoID,\
+				\
+				'Configuration Profile Exclusion Group Name':myExclusionsComputerGroupInfo['name'],\
+				\
+				'Configuration Profile Exclusion Group is Smart':str(myExclusionsComputerGroupInfo['is_smart'])}"
 				
-				patchManagementPolicyPackageID = patchManagementPolicy['Package ID']
+				appendJAMF_Configuration_Profile_Exclusion_Groups_Info = eval(appendDataToCVS_JAMF_Configuration_Profile_Exclusion_Groups_Info)
+				appendConfigProfileExclusionsGroupsColumns = appendJAMF_Configuration_Profile_Exclusion_Groups_Info
 				
-				checkPatchManagementPolicyListID = str(patchManagementPolicyPackageID)
-				checkPackageRecordsID = str(packageRecordsID)
+				#Set Columns	
+				Combined = MergeConfigProfileInfo(configProfileColumns, configProfileTargetsColumns, appendConfigProfileExclusionsGroupsColumns)
 				
-				if checkPatchManagementPolicyListID == checkPackageRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
-					
-					try:
-						myPackageRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myPackageRecordsResponse.raise_for_status()
-						
-						getMyPackageRecords = myPackageRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(packageRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-					
-					
-					
-					#print(getMyPackageRecords['package']['id'])
-					
-					
-					#Set Variables if Data Available
-					if len(str(getMyPackageRecords['package']['id'])) == 0:
-						myCurrentPackageID = ''
-					else:
-						myCurrentPackageID = int(getMyPackageRecords['package']['id'])
-						
-					myCurrentPackageName =  getMyPackageRecords['package']['name']
-					myPackageRecordsFileName = getMyPackageRecords['package']['filename']
-					
-					if len(str(patchManagementPolicy['Patch Management ID'])) == 0:
-						myCurrentPatchManagementPolicyID = ''
-					else:
-						myCurrentPatchManagementPolicyID = int(patchManagementPolicy['Patch Management ID'])
-						
-					myCurrentPatchManagementPolicyName = patchManagementPolicy['Patch Management Display Name']
-					
-					myCurrentPatchManagementPolicySoftwareVersionName = patchManagementPolicy['Patch Management Software Version Name']
-					
-					
-					appendDataToCVS_JAMF_Package_To_Patch_Management_Policy_Info = "{'Type':'Package Used',\
-					\
-					'Package List':'Patch Management Policy',\
-					\
-					'Package ID':myCurrentPackageID,\
-					\
-					'Package Name':myCurrentPackageName,\
-					\
-					'Package File Name':myPackageRecordsFileName,\
-					\
-					'Patch Management Policy ID':myCurrentPatchManagementPolicyID,\
-					\
-					'Patch Management Policy Name':myCurrentPatchManagementPolicyName,	\
-					\
-					'Patch Management Policy Software Version Name':myCurrentPatchManagementPolicySoftwareVersionName}"
-					
-					
-					appendJAMF_Package_To_Patch_Management_Policy_Info = eval(appendDataToCVS_JAMF_Package_To_Patch_Management_Policy_Info)
-					appendPackageToPatchManagementPolicyColumns = appendJAMF_Package_To_Patch_Management_Policy_Info
-					
-					#Set Columns	
-					Combined = appendPackageToPatchManagementPolicyColumns
-					
-					#Set CSV File
-					dataToCsvPackageToPolicy.append(Combined)
-					
-					# For Testing
-					#print(f"Yes, Package ID: " + myCurrentPackageID + " with Package Name: " + myCurrentPackageName + " and Package FileName: "+ myPackageRecordsFileName + " is being used in Patch Management Policies ID: " + myCurrentPatchManagementPolicyID + " with Patch Management Display Name: " + myCurrentPatchManagementPolicyID + " with Patch Management Display Software Version Name: " + myCurrentPatchManagementPolicySoftwareVersionName)
-					
-					
-		else:
+				#Set CSV File
+				dataToCsvConfigurationProfile.append(Combined)	
+				
+				
+	
+	
+	# Process List
+	fetchEngine.map(processData, response_list)
+
+	
+##########################################################################################
+# Package to Policies Section
+##########################################################################################			
+if get_JAMF_Package_To_Policy_Info == ("yes"):
+	
+	##########################################################################################
+	# Process Package to Policies information for csv / Excel
+	##########################################################################################
+	# Policy records are shared with the Policy section, each one is only fetched once.
+	# Their packages, scripts and scope go into the usage graph.
+	policyRecords = entityStore.getAllRecords('policies')
+	
+	print(f"Gathering List for Package Info from {len(policyRecords)} Policies")
+	
+	usageGraph.addPolicies(policyRecords)
+	
+	
+	#For testing
+	#print(usageGraph.usedBy)	
+	
+	
+
+
+	if includePreStagePackageToPolicyInfo == ("yes"):
+		##########################################################################################
+		# Process Package to PreStage Policies information for csv / Excel
+		##########################################################################################
+		# Set up url for getting a list of all Package to PreStage Policies from JAMF API
+		PSURL = JAMF_url + "/api/v2/computer-prestages"
+		
+		
+		try:
+			preStagePolicyPackagesResponse = fetchEngine.get(PSURL, headers=btHeaders)
+			
+			preStagePolicyPackagesResponse.raise_for_status()
 			
-			# Set up url for getting information from each policy ID from JAMF API
-			url = JAMF_url + "/JSSResource/packages/id/" + str(packageRecordsID)
+			resp = preStagePolicyPackagesResponse.json()
 			
-			try:
-				myPackageRecordsResponse = http.get(url, headers=btHeaders)
+		except HTTPError as http_err:
+			print(f'HTTP error occurred: {http_err}')
+		except Exception as err:
+			print(f'Other error occurred: {err}')	
+			
+		#For Testing
+		#print(resp)
+		
+		preStagePolicies = resp['results']
+		
+		for results in preStagePolicies:
+			
+			
+			preStagePoliciesID = results['id']
+			packages = results['customPackageIds']
+			preStagePoliciesDisplayName = results['displayName']
+			
+			
+			# Individual Policy Info for each record
+			getMyPreStagePolicyIDList = (str(preStagePoliciesID) + " - " + preStagePoliciesDisplayName)
+			
+			# Get info for Policies
+			print("Gathering List for Package Info from PreStage Policy ID: " + getMyPreStagePolicyIDList)
+			
+			
+			preStageNode = usageGraph.addNode('prestage', preStagePoliciesID, id=preStagePoliciesID, name=preStagePoliciesDisplayName)
+			
+			for package in packages:
 				
-				myPackageRecordsResponse.raise_for_status()
+				#print(package)
 				
-				getMyPackageRecords = myPackageRecordsResponse.json()
+				usageGraph.addEdge(preStageNode, 'installs', ('package', str(package)))
 				
-			except HTTPError as http_err:
-				print(f'HTTP error occurred: {http_err}')
-			except Exception as err:
-				print(f'Other error occurred: {err}')
 				
-			# for testing
-			#print(getMyPackageRecords['package']['id'])
+		#print(usageGraph.usedBy)
+	
+	if includePatchManagementPackageToPolicyInfo == ("yes"):
+		##########################################################################################
+		# Process Package to PreStage Policies information for csv / Excel
+		##########################################################################################
+		# Set up url for getting a list of all Package to PreStage Policies from JAMF API
+		allPatchPolicies = JAMF_url + "/JSSResource/patchpolicies"
+		patchPoliciesByID = JAMF_url + "/JSSResource/patchpolicies/id/"
+		patchSoftwareTitlesByID = JAMF_url + "/JSSResource/patchsoftwaretitles/id/"
+		
+		
+		# Find all patch Policy ID
+		try:
+			patchManagementPolicyPackagesResponse = fetchEngine.get(allPatchPolicies, headers=btHeaders)
 			
+			patchManagementPolicyPackagesResponse.raise_for_status()
 			
-			#Set Variables if Data Available
-			if len(str(getMyPackageRecords['package']['id'])) == 0:
-				myUnusedCurrentPackageID = ''
-			else:
-				myUnusedCurrentPackageID = int(getMyPackageRecords['package']['id'])
-				
-			myUnusedPackageName =  getMyPackageRecords['package']['name']
-			myUnusedPackageRecordsFileName = getMyPackageRecords['package']['filename']
+			resp = patchManagementPolicyPackagesResponse.json()
 			
+		except HTTPError as http_err:
+			print(f'HTTP error occurred: {http_err}')
+		except Exception as err:
+			print(f'Other error occurred: {err}')	
 			
-			appendDataToCVS_JAMF_Package_Unused_Info = "{'Type':'Package Not Used',\
-			\
-			'Package List':'',\
-			\
-			'Package ID':myUnusedCurrentPackageID,\
-			\
-			'Package Name':myUnusedPackageName,\
-			\
-			'Package File Name':myUnusedPackageRecordsFileName}"
+		#For Testing
+		#print(resp)
+			
+		# Get ID from patch policy
+		patchPolicy = resp['patch_policies']
+		
+		
+		# Find Patch Policiy ID
+		for policy in patchPolicy :
 			
 			
-			appendJAMF_Package_Unused_Info = eval(appendDataToCVS_JAMF_Package_Unused_Info)
-			appendPackageUnusedColumns = appendJAMF_Package_Unused_Info
 			
-			#Set Columns	
-			Combined = appendPackageUnusedColumns
 			
-			#Set CSV File
-			dataToCsvPackageToPolicy.append(Combined)
+			patchManagementID = str(policy['id'])
+			
+			# Get info for Policies
+			print("Gathering List for Package Info from Patch Management Policy ID: " + patchManagementID)
+			
+			try:
+				patchManagementPolicyPackagesResponseID = fetchEngine.get(patchPoliciesByID+patchManagementID, headers=btHeaders)
+				
+				patchManagementPolicyPackagesResponseID.raise_for_status()
+				
+				resp = patchManagementPolicyPackagesResponseID.json()
+				
+			except HTTPError as http_err:
+				print(f'HTTP error occurred: {http_err}')
+			except Exception as err:
+				print(f'Other error occurred: {err}')	
+				
+			#For Testing
+			# print(resp['patch_policy']['software_title_configuration_id'])
+				
+			pmSoftwareTitleConfigurationID = str(resp['patch_policy']['software_title_configuration_id'])
 			
-			#print(f"No, Package ID: " + str(packageRecordsID) + ", Package Name: " + packageRecordsName + " is not being used in any Policies")
+			# print(pmSoftwareTitleConfigurationID)
 			
+			try:
+				patchManagementSoftwareTitleConfigurationInfo = fetchEngine.get(patchSoftwareTitlesByID+pmSoftwareTitleConfigurationID, headers=btBrokenXMLHeaders)
+				
+				patchManagementSoftwareTitleConfigurationInfo.raise_for_status()
+				
+				resp = xmltodict.parse(patchManagementSoftwareTitleConfigurationInfo.content)
+				
+			except HTTPError as http_err:
+				print(f'HTTP error occurred: {http_err}')
+			except Exception as err:
+				print(f'Other error occurred: {err}')	
+				
+			#For Testing
+			# print(resp['patch_software_title'])
+				
+			patchManagementPolicyDisplayName = resp['patch_software_title']['name']
+			pmSoftwareTitleVersionInfo = resp['patch_software_title']['versions']['version']
 			
-##########################################################################################
-# Script to Policies Section
-##########################################################################################			
-if get_JAMF_Script_To_Policy_Info == ("yes"):
+			for version in pmSoftwareTitleVersionInfo :
+				packageInfo = version['package']
+				pmSoftwareVersionName = version['software_version']
+				
+				if packageInfo != None :
+					#print(packageInfo['id'])
+					#print(packageInfo['name'])
+					
+					patchManagementPackageID = str(packageInfo['id'])
+					patchManagementSoftwareVersionName = pmSoftwareVersionName
+					
+					patchManagementNode = usageGraph.addNode('patchpolicy', patchManagementID, id=patchManagementID, name=patchManagementPolicyDisplayName)
+					
+					usageGraph.addEdge(patchManagementNode, 'installs', ('package', patchManagementPackageID), softwareVersion=patchManagementSoftwareVersionName)
+					
+		# For Testing
+		#print(usageGraph.usedBy)
+	
 	
 	##########################################################################################
-	# Process Script to Policies information for csv / Excel
+	# lookup package information and compair to dict and list to find what is in use.
 	##########################################################################################
-	# Set up url for getting a list of all Script to Regular Policies from JAMF API
-	url = JAMF_url + "/JSSResource/policies"
+	# List of all packages, shared with the other sections through the entity store
+	packageRecords = entityStore.getList('packages')
 	
-	# Set up list
-	policyScriptsList = []
+	# Details for every package once, used for all the rows below
+	packageDetails = entityStore.getPackageDetails([str(package['id']) for package in packageRecords])
 	
-	try:
-		policyResponse = http.get(url, headers=btHeaders)
-		
-		policyResponse.raise_for_status()
-		
-		resp = policyResponse.json()
-		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')	
-		
-	#For Testing
-	#print(resp)
-		
-	policyRecords = resp['policies']
-	policyRecords.sort(key=lambda item: item.get('id'), reverse=False)
 	
+	#print(packageRecords)
 	
-	for policy in policyRecords:
-		
-		#Renew token because the report is a long process
-		#renew token
-		url = JAMF_url+"/api/v1/auth/keep-alive"
-		
-		token = http.post(url, headers=btHeaders)
-		
-		bearer = token.json()['token']
-		
-		btHeaders = {
-			'Accept': 'application/json',
-			'Authorization': 'Bearer '+bearer
-		}
-		
-		# Get Policy ID to do JAMF API lookup 
-		policyRecordsID = str(policy['id']) 
-		
-		#	For Testing
-		#print(policyRecordsID)
-		
-		# Set up url for getting information from each policy ID from JAMF API
-		url = JAMF_url + "/JSSResource/policies/id/" + policyRecordsID
+	
+	# Package details as a table in package list order, packages that could not be found are left out
+	packageDetailRows = []
+	
+	for package in packageRecords:
+		getMyPackageRecords = packageDetails.get(str(package['id']))
 		
-		try:
-			PolicyRecordsResponse = http.get(url, headers=btHeaders)
-			
-			PolicyRecordsResponse.raise_for_status()
-			
-			getPolicyRecords = PolicyRecordsResponse.json()
-			
-		except HTTPError as http_err:
-			# Process HTTP Error
-			check_http_err = str(http_err)
-			split_My_http_err = check_http_err.split()
-			
-			myHttpError = split_My_http_err[0]
-			myMissingRecordID = policyRecordsID
-			myMissingRecordURL = split_My_http_err[5]
-			
-			if myHttpError == '404':
-				print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-				
-			else:
-				print(f'HTTP error occurred: {http_err}')
-				
-			continue
-		except Exception as err:
-			print(f'Other error occurred: {err}')
+		if getMyPackageRecords is None:
 			continue
 			
-		# For Testing
-		#print(getPolicyRecords)
-			
-		#Get policy ID and Name for report
-		policyInfoID = getPolicyRecords['policy']['general']['id']
-		policyInfoName = getPolicyRecords['policy']['general']['name']
-		
-		# Find the Script data in each policy
-		policyScriptInfo = getPolicyRecords['policy']['scripts']
-		
-		
-		# Individual Policy Info for each record
-		getMyPolicyIDList = (str(policyInfoID) + " - " + policyInfoName)
+		packageDetailRows.append({'Used ID':str(package['id']),\
+		\
+		'Package ID':int(getMyPackageRecords['package']['id']),\
+		\
+		'Package Name':getMyPackageRecords['package']['name'],\
+		\
+		'Package File Name':getMyPackageRecords['package']['filename']})
 		
-		# Get info for Policies
-		print("Gathering List for Script Info from Policy ID: " + getMyPolicyIDList)
+	packageFrame = pd.DataFrame(packageDetailRows, columns=['Used ID', 'Package ID', 'Package Name', 'Package File Name'])
+	
+	print(f"Checking Policies that use {len(packageFrame)} Packages")
+	
+	# One row for each policy that installs a package
+	packageUsageFrame = usageGraph.getEdgeFrame('package', 'installs')
+	
+	
+	# Package used, the usage joined with the package details. One row for each regular,
+	# PreStage and patch policy that uses the package, the ID and Name columns only for
+	# the kinds of policy that were found.
+	packageUsedFrame = packageFrame.merge(packageUsageFrame, on='Used ID', how='inner')
+	
+	packageUsedFrame.insert(0, 'Type', 'Package Used')
+	packageUsedFrame.insert(1, 'Package List', packageUsedFrame['Using Kind'].map({'policy':'Regular Policy', 'prestage':'PreStage Policy', 'patchpolicy':'Patch Management Policy'}))
+	
+	for usingKind, policyIDColumn, policyNameColumn in [('policy', 'Policy ID', 'Policy Name'),\
+		('prestage', 'PreStage Policy ID', 'PreStage Policy Name'),\
+		('patchpolicy', 'Patch Management Policy ID', 'Patch Management Policy Name')]:
 		
+		isUsingKind = packageUsedFrame['Using Kind'] == usingKind
 		
-		#Get Script ID from Policy to compare and find unused Scripts.
-		for policyScript in policyScriptInfo:
-			
-			#get Script info for dict
-			policyScriptsDict = {'Policy ID': policyInfoID, 'Policy Name': policyInfoName, 'Script ID': str(policyScript['id'])}
-			
-			policyScriptsList.append(policyScriptsDict)
-			
+		if isUsingKind.any():
+			packageUsedFrame[policyIDColumn] = pd.to_numeric(packageUsedFrame['Using ID'].where(isUsingKind))
+			packageUsedFrame[policyNameColumn] = packageUsedFrame['Using Name'].where(isUsingKind)
 			
+			if usingKind == 'patchpolicy':
+				packageUsedFrame['Patch Management Policy Software Version Name'] = packageUsedFrame['softwareVersion'].where(isUsingKind)
+				
+	packageUsedFrame = packageUsedFrame.drop(columns=packageUsageFrame.columns)
+	
+	
+	# Package not used, the package details with no usage
+	packageUnusedFrame = packageFrame[~packageFrame['Used ID'].isin(packageUsageFrame['Used ID'])].drop(columns='Used ID')
+	
+	packageUnusedFrame.insert(0, 'Type', 'Package Not Used')
+	packageUnusedFrame.insert(1, 'Package List', '')
+	
+	
+	#Set CSV File
+	dataToCsvPackageToPolicy = pd.concat([packageUsedFrame, packageUnusedFrame], ignore_index=True)
+	
+	
+##########################################################################################
+# Script to Policies Section
+##########################################################################################			
+if get_JAMF_Script_To_Policy_Info == ("yes"):
+	
+	##########################################################################################
+	# Process Script to Policies information for csv / Excel
+	##########################################################################################
+	# Policy records are shared with the Policy section, each one is only fetched once.
+	# The usage graph already has them if the Package to Policies sheet was made.
+	policyRecords = entityStore.getAllRecords('policies')
+	
+	print(f"Gathering List for Script Info from {len(policyRecords)} Policies")
+	
+	usageGraph.addPolicies(policyRecords)
+	
+	
 	#For testing
-	#print(policyScriptsList)	
+	#print(usageGraph.usedBy)	
 			
 			
 	##########################################################################################
 	# lookup Script information and compair to dict and list to find what is in use.
 	##########################################################################################
-	url = JAMF_url + "/JSSResource/scripts"
+	# List of all scripts, shared with the other sections through the entity store
+	ScriptRecords = entityStore.getList('scripts')
 	
-	try:
-		ScriptResponse = http.get(url, headers=btHeaders)
-		
-		ScriptResponse.raise_for_status()
-		
-		resp = ScriptResponse.json()
-		
-	except HTTPError as http_err:
-		print(f'HTTP error occurred: {http_err}')
-	except Exception as err:
-		print(f'Other error occurred: {err}')	
-		
-	#For Testing
-	#print(resp)
-		
-	ScriptRecords = resp['scripts']
-	ScriptRecords.sort(key=lambda item: item.get('id'), reverse=False)
+	# Details for every script once and at the same time, used for all the rows below
+	fetchResult = entityStore.getRecords('scripts', [str(Script['id']) for Script in ScriptRecords])
+	scriptDetails = dict(zip(fetchResult.recordIDs, fetchResult.records))
 	
 	
 	#print(ScriptRecords)
 	
 	
-	#process Script records and set dict and list
+	# Script details as a table in script list order, scripts that could not be found are left out
+	scriptDetailRows = []
+	
 	for Script in ScriptRecords:
+		getMyScriptRecords = scriptDetails.get(str(Script['id']))
 		
-		#Renew token because the report is a long process
-		#renew token
-		url = JAMF_url+"/api/v1/auth/keep-alive"
-		
-		token = http.post(url, headers=btHeaders)
-		
-		bearer = token.json()['token']
-		
-		btHeaders = {
-			'Accept': 'application/json',
-			'Authorization': 'Bearer '+bearer
-		}
-		
-		ScriptRecordsID = Script['id']
-		ScriptRecordsName = Script['name']
-		
-		key = 'Script ID' 
-		value = str(ScriptRecordsID)
-		
-		# Individual Policy Info for each record
-		getMyScriptList = (str(ScriptRecordsID) + " - " + ScriptRecordsName)
-		
-		# Get info for Policies
-		print("Checking Policies that use Script: " + getMyScriptList) 
-		
-		#for testing
-		#print(ScriptRecordsID)
-		#print(policyScriptsList)
-		#print(type(value))
-		
-		
-		#Process Info for Scripts to policies
-		if checkIfScriptIsUsedInPolicy(policyScriptsList, key, value):
-			
-			for policy in policyScriptsList:
-				
-				policyScriptID = policy['Script ID']
-				
-				checkPolicyListID = str(policyScriptID)
-				checkScriptRecordsID = str(ScriptRecordsID)
-				
-				
-				if checkPolicyListID == checkScriptRecordsID:
-					
-					# Set up url for getting information from each policy ID from JAMF API
-					url = JAMF_url + "/JSSResource/scripts/id/" + str(ScriptRecordsID)
-					
-					try:
-						myScriptRecordsResponse = http.get(url, headers=btHeaders)
-						
-						myScriptRecordsResponse.raise_for_status()
-						
-						getMyScriptRecords = myScriptRecordsResponse.json()
-						
-					except HTTPError as http_err:
-						# Process HTTP Error
-						check_http_err = str(http_err)
-						split_My_http_err = check_http_err.split()
-						
-						myHttpError = split_My_http_err[0]
-						myMissingRecordID = str(ScriptRecordsID)
-						myMissingRecordURL = split_My_http_err[5]
-						
-						if myHttpError == '404':
-							print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-							
-						else:
-							print(f'HTTP error occurred: {http_err}')
-							
-						continue
-					except Exception as err:
-						print(f'Other error occurred: {err}')
-						continue
-						
-					# for testing
-					#print(getMyScriptRecords['script']['id'])
-						
-						
-					#Set Variables if Data Available
-					if len(str(getMyScriptRecords['script']['id'])) == 0:
-						myCurrentScriptID = ''
-					else:
-						myCurrentScriptID = int(getMyScriptRecords['script']['id'])
-						
-					myCurrentScriptName =  getMyScriptRecords['script']['name']
-					myScriptRecordsFileName = getMyScriptRecords['script']['filename']
-					
-					if len(str(policy['Policy ID'])) == 0:
-						myCurrentPolicyID = ''
-					else:
-						myCurrentPolicyID = int(policy['Policy ID'])
-						
-					myCurrentPolicyName = policy['Policy Name']
-					
-					
-					appendDataToCVS_JAMF_Script_To_Regular_Policy_Info = "{'Type':'Script Used',\
-					\
-					'Script ID':myCurrentScriptID,\
-					\
-					'Script Name':myCurrentScriptName,\
-					\
-					'Script File Name':myScriptRecordsFileName,\
-					\
-					'Policy ID':myCurrentPolicyID,\
-					\
-					'Policy Name':myCurrentPolicyName}"
-					
-					appendJAMF_Script_To_Regular_Policy_Info = eval(appendDataToCVS_JAMF_Script_To_Regular_Policy_Info)
-					appendScriptToRegularPolicyColumns = appendJAMF_Script_To_Regular_Policy_Info
-					
-					#Set Columns	
-					Combined = appendScriptToRegularPolicyColumns
-					
-					#Set CSV File
-					dataToCsvScriptToPolicy.append(Combined)
-					
-					# For Testing
-					#print(f"Yes, Script ID: " + myCurrentScriptID + " with Script Name: " + myCurrentScriptName + " and Script File Name: " + myScriptRecordsFileName + ", is being used by Policy ID: " + str(myCurrentPolicyID) + " with Policy Name: " + myCurrentPolicyName)
-					
-		else:
-			
-			# Set up url for getting information from each policy ID from JAMF API
-			url = JAMF_url + "/JSSResource/scripts/id/" + str(ScriptRecordsID)
-			
-			try:
-				myScriptRecordsResponse = http.get(url, headers=btHeaders)
-				
-				myScriptRecordsResponse.raise_for_status()
-				
-				getMyScriptRecords = myScriptRecordsResponse.json()
-				
-			except HTTPError as http_err:
-				# Process HTTP Error
-				check_http_err = str(http_err)
-				split_My_http_err = check_http_err.split()
-				
-				myHttpError = split_My_http_err[0]
-				myMissingRecordID = str(ScriptRecordsID)
-				myMissingRecordURL = split_My_http_err[5]
-				
-				if myHttpError == '404':
-					print(f".......We found that Record: {myMissingRecordID}, does not exist in your JAMF Instance at URL: {myMissingRecordURL}")
-					
-				else:
-					print(f'HTTP error occurred: {http_err}')
-					
-				continue
-			except Exception as err:
-				print(f'Other error occurred: {err}')
-				continue
-				
-			# for testing
-			#print(getMyScriptRecords['script']['id'])
-				
-				
-			#Set Variables if Data Available
-			if len(str(getMyScriptRecords['script']['id'])) == 0:
-				myUnusedCurrentScriptID = ''
-			else:
-				myUnusedCurrentScriptID = int(getMyScriptRecords['script']['id'])
-				
-			myUnusedScriptName =  getMyScriptRecords['script']['name']
-			myUnusedScriptRecordsFileName = getMyScriptRecords['script']['filename']
-			
-			
-			appendDataToCVS_JAMF_Script_Unused_Info = "{'Type':'Script Not Used',\
-			\
-			'Script ID':myUnusedCurrentScriptID,\
-			\
-			'Script Name':myUnusedScriptName,\
-			\
-			'Script File Name':myUnusedScriptRecordsFileName}"
-			
-			
-			appendJAMF_Script_Unused_Info = eval(appendDataToCVS_JAMF_Script_Unused_Info)
-			appendScriptUnusedColumns = appendJAMF_Script_Unused_Info
-			
-			#Set Columns	
-			Combined = appendScriptUnusedColumns
-			
-			#Set CSV File
-			dataToCsvScriptToPolicy.append(Combined)
+		if getMyScriptRecords is None:
+			continue
 			
-			#print(f"No, Script ID: " + str(ScriptRecordsID) + ", Script Name: " + ScriptRecordsName + " is not being used in any Policies")
-						
-
+		scriptDetailRows.append({'Used ID':str(Script['id']),\
+		\
+		'Script ID':int(getMyScriptRecords['script']['id']),\
+		\
+		'Script Name':getMyScriptRecords['script']['name'],\
+		\
+		'Script File Name':getMyScriptRecords['script']['filename']})
+		
+	scriptFrame = pd.DataFrame(scriptDetailRows, columns=['Used ID', 'Script ID', 'Script Name', 'Script File Name'])
+	
+	print(f"Checking Policies that use {len(scriptFrame)} Scripts")
+	
+	# One row for each policy that runs a script
+	scriptUsageFrame = usageGraph.getEdgeFrame('script', 'runs')
+	
+	
+	# Script used, the usage joined with the script details, one row for each policy that uses the script
+	scriptUsedFrame = scriptFrame.merge(scriptUsageFrame, on='Used ID', how='inner')
+	
+	scriptUsedFrame.insert(0, 'Type', 'Script Used')
+	scriptUsedFrame['Policy ID'] = pd.to_numeric(scriptUsedFrame['Using ID'])
+	scriptUsedFrame['Policy Name'] = scriptUsedFrame['Using Name']
+	
+	scriptUsedFrame = scriptUsedFrame.drop(columns=scriptUsageFrame.columns)
+	
+	
+	# Script not used, the script details with no usage
+	scriptUnusedFrame = scriptFrame[~scriptFrame['Used ID'].isin(scriptUsageFrame['Used ID'])].drop(columns='Used ID')
+	
+	scriptUnusedFrame.insert(0, 'Type', 'Script Not Used')
+	
+	
+	#Set CSV File
+	dataToCsvScriptToPolicy = pd.concat([scriptUsedFrame, scriptUnusedFrame], ignore_index=True)
+	
+	
+##########################################################################################
+# Computer Scope Section
+##########################################################################################
+if get_JAMF_Computer_Scope_Info == ("yes"):
+	
+	##########################################################################################
+	# Process Computer Scope information for csv / Excel
+	##########################################################################################
+	# Policy and profile records are shared with the other sections, each one is only
+	# fetched once. Scope is resolved locally, there are no requests per computer.
+	policyRecords = entityStore.getAllRecords('policies')
+	profileRecords = entityStore.getAllRecords('osxconfigurationprofiles')
+	
+	print(f"Resolving Scope for {len(entityStore.getList('computers'))} Computers from {len(policyRecords)} Policies and {len(profileRecords)} Configuration Profiles")
+	
+	scopeResolver = ScopeResolver(entityStore)
+	
+	#Set CSV File
+	dataToCsvComputerScope = scopeResolver.resolve(policyRecords, profileRecords)
+	
+	
 ##########################################################################################
 # Process data for Export to csv / Excel
 ##########################################################################################
 # Check and make sure that either Policy or Config Profile was selected
-if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF_Configuration_Profile_Info == 'yes' or get_JAMF_Package_To_Policy_Info == 'yes' or get_JAMF_Script_To_Policy_Info == 'yes':
+if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF_Configuration_Profile_Info == 'yes' or get_JAMF_Package_To_Policy_Info == 'yes' or get_JAMF_Script_To_Policy_Info == 'yes' or get_JAMF_Computer_Scope_Info == 'yes':
 	
 	
 	# Get export to csv file
@@ -6044,6 +6059,12 @@ if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF
 		df_ScriptToPolicy_raw = pd.DataFrame(dataToCsvScriptToPolicy)
 		df_ScriptToPolicy_sort = df_ScriptToPolicy_raw.rename_axis('MyIdx').sort_values(by = ['Script ID', 'MyIdx'])
 		df_ScriptToPolicy = df_ScriptToPolicy_sort.reset_index(drop=True)
+		
+	if get_JAMF_Computer_Scope_Info == ("yes"):	
+		# Columns are set so a report with no rows still has them, Unresolved rows have no Computer ID
+		df_ComputerScope_raw = pd.DataFrame(dataToCsvComputerScope, columns=COMPUTER_SCOPE_COLUMNS).astype({'Computer ID': 'Int64'})
+		df_ComputerScope_sort = df_ComputerScope_raw.rename_axis('MyIdx').sort_values(by = ['Computer ID', 'MyIdx'])
+		df_ComputerScope = df_ComputerScope_sort.reset_index(drop=True)
 
 	
 	print('\n******************** Creating Jamf Instance Info file. ********************\n')
@@ -6323,6 +6344,37 @@ if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF
 		
 		for i, width in enumerate(get_col_widths(df_ScriptToPolicy)):
 			df_ScriptToPolicy_worksheet.set_column(i, i, width)
+			
+	if get_JAMF_Computer_Scope_Info == ("yes"):
+		df_ComputerScope.to_excel(Excelwriter, sheet_name='Jamf Computer Scope Info')
+		
+		# Get the xlsxwriter workbook and worksheet objects.
+		
+		df_ComputerScope_workbook  = Excelwriter.book
+		
+		df_ComputerScope_worksheet = Excelwriter.sheets['Jamf Computer Scope Info']
+		
+		format1 = df_ComputerScope_workbook.add_format({'bg_color': '#82E0AA'})
+		
+		TopRowFormat = df_ComputerScope_workbook.add_format()
+		TopRowFormat.set_bold()
+		TopRowFormat.set_font_size(16)
+		TopRowFormat.set_align('center')
+		TopRowFormat.set_align('vcenter')
+		TopRowFormat.set_bottom(2)
+		TopRowFormat.set_bg_color('#D5D8DC')
+		
+		df_ComputerScope_worksheet.set_row(0, 30, TopRowFormat)
+		
+		df_ComputerScope_worksheet.conditional_format('$A2:$H$1048576', 
+													  {'type':'formula',
+												       'criteria': '=$B2="Nothing Scoped"',
+												       'format': format1
+												      })
+		
+		
+		for i, width in enumerate(get_col_widths(df_ComputerScope)):
+			df_ComputerScope_worksheet.set_column(i, i, width)
 	
 		
 	#And finally we save the file
@@ -6333,16 +6385,20 @@ if get_JAMF_Computers_Info == 'yes' or get_JAMF_Policy_Info == 'yes' or get_JAMF
 else:
 	
 	print("\n******************** No Options Selected. No Report to Run. ********************\n")
-	
 
-# Invalidate Bearer Token
 
-invalidateBearerTokenURL = JAMF_url + "/api/v1/auth/invalidate-token"
-	
-try:
-	invalidateToken = http.post(invalidateBearerTokenURL, headers=btHeaders)
-	
-except HTTPError as http_err:
-	print(f'HTTP error occurred: {http_err}')
-except Exception as err:
-	print(f'Other error occurred: {err}')
\ No newline at end of file
+# Save the records of this run to the snapshot store
+if SNAPSHOTS_ENABLED:
+	snapshotStore.finishRun()
+	snapshotStore.printStats()
+	snapshotStore.close()
+
+
+# Close Async Fetch Engine
+fetchEngine.printConnectionStats()
+fetchEngine.close()
+
+
+# Invalidate Bearer Token
+if tokenManager is not None:
+	tokenManager.invalidate()
\ No newline at end of file